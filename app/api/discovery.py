@@ -3,13 +3,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
 from pydantic import BaseModel, Field
 from typing import List, Optional, Literal
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.database import get_db
-from app.models.job import Job
+from app.utils.ids import uuid7
+from app.models.job import Job, JobStatus, JobType
+from app.models.platform import PlatformName
 from app.models.platform_content import PlatformContent
 from app.tasks.discovery_tasks import run_discovery_job, discover_platform, start_discovery_pipeline
 
@@ -107,13 +109,13 @@ async def start_discovery(
     Use GET /api/v1/discovery/status/{job_id} to check progress.
     """
     # Create job record
-    job_id = str(uuid4())
+    job_id = str(uuid7())
     
     job = Job(
         job_id=job_id,
         user_id="api_user",  # TODO: Get from auth
-        job_type="discovery",
-        status="pending",
+        job_type=JobType.DISCOVERY,
+        status=JobStatus.PENDING,
         config={
             "niche": request.niche,
             "platforms": request.platforms,
@@ -186,7 +188,7 @@ async def get_discovery_results(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
     min_score: float = Query(0, ge=0),
-    platform: Optional[str] = Query(None),
+    platform: Optional[PlatformName] = Query(None),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -313,7 +315,8 @@ async def get_trending_now(
     
     query = select(PlatformContent).where(
         PlatformContent.discovered_at >= cutoff,
-        PlatformContent.platform.in_(platforms)
+        PlatformContent.platform.in_(platforms),
+        PlatformContent.trending_score.isnot(None)
     ).order_by(
         PlatformContent.trending_score.desc()
     ).limit(limit)
@@ -1,16 +1,17 @@
 """Job management API endpoints"""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, literal_column
 from typing import List, Optional
 from uuid import UUID
 import structlog
 
 from app.core.database import get_db
 from app.models.job import Job
-from app.schemas.job import JobCreate, JobResponse, JobUpdate, JobStatus
+from app.schemas.job import JobCreate, JobResponse, JobListAdapter, JobUpdate, JobStatus
 from app.tasks.discovery_tasks import start_discovery_pipeline
+from app.utils.job_logger import get_job_logs as fetch_job_logs
 
 router = APIRouter()
 logger = structlog.get_logger()
@@ -43,6 +44,7 @@ async def create_job(
 async def list_jobs(
     user_id: Optional[str] = Query(None),
     status: Optional[JobStatus] = Query(None),
+    niche: Optional[str] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db)
@@ -54,10 +56,19 @@ async def list_jobs(
         query = query.where(Job.user_id == user_id)
     if status:
         query = query.where(Job.status == status)
+    if niche:
+        # Key is a literal (not a bind param) so idx_job_niche can match
+        query = query.where(literal_column("jobs.config->>'niche'") == niche)
     
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    
+    # Validate and serialize the whole page in one pass
+    jobs = JobListAdapter.validate_python(result.scalars().all(), from_attributes=True)
+    return Response(
+        content=JobListAdapter.dump_json(jobs),
+        media_type="application/json"
+    )
 
 
 @router.get("/{job_id}", response_model=JobResponse)
@@ -172,8 +183,7 @@ async def get_job_logs(
                 detail=f"Job {job_id} not found"
             )
         
-        # Handle case where logs column might not exist yet
-        logs = getattr(job, 'logs', None) or []
+        logs = await fetch_job_logs(db, job_id)
         
         return {
             "job_id": str(job_id),
@@ -1,12 +1,13 @@
 """Rendering API endpoints for video compilation and output."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime
 from pathlib import Path
+import base64
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -276,8 +277,11 @@ async def get_render_preview(
     # Wait briefly for result
     try:
         result = task.get(timeout=10)
-        if result.get("preview_path"):
-            return FileResponse(result["preview_path"], media_type="image/jpeg")
+        if result.get("preview_jpeg"):
+            return Response(
+                content=base64.b64decode(result["preview_jpeg"]),
+                media_type="image/jpeg"
+            )
         raise HTTPException(status_code=404, detail="Preview not available")
     except Exception:
         return {"message": "Preview generation started", "task_id": task.id}
@@ -1,23 +1,44 @@
 """Trend discovery API endpoints"""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, func
-from typing import List, Optional, Literal
+from typing import List, Optional
 from datetime import datetime, timedelta
 
 from app.core.database import get_db
+from app.models.platform import PlatformName
 from app.models.platform_content import PlatformContent
-from app.schemas.video import TrendingContentResponse
+from app.schemas.video import TrendingContentResponse, TrendingContentListAdapter
 
 router = APIRouter()
 
-Platform = Literal["youtube", "tiktok", "instagram", "snapchat"]
+# Only the columns TrendingContentResponse emits; skips description/metadata
+TRENDING_COLUMNS = (
+    PlatformContent.content_id,
+    PlatformContent.platform,
+    PlatformContent.url,
+    PlatformContent.title,
+    PlatformContent.author,
+    PlatformContent.views,
+    PlatformContent.likes,
+    PlatformContent.trending_score,
+    PlatformContent.discovered_at,
+)
+
+
+def _trending_response(rows) -> Response:
+    """Validate and serialize trending rows in one pass."""
+    items = TrendingContentListAdapter.validate_python(rows, from_attributes=True)
+    return Response(
+        content=TrendingContentListAdapter.dump_json(items),
+        media_type="application/json"
+    )
 
 
 @router.get("/", response_model=List[TrendingContentResponse])
 async def get_trends(
-    platforms: Optional[List[Platform]] = Query(None),
+    platforms: Optional[List[PlatformName]] = Query(None),
     niche: Optional[str] = Query(None),
     timeframe: str = Query("24h", regex="^(1h|6h|12h|24h|7d|30d)$"),
     limit: int = Query(50, ge=1, le=200),
@@ -35,8 +56,9 @@ async def get_trends(
     }
     since = datetime.utcnow() - timeframe_map[timeframe]
     
-    query = select(PlatformContent).where(
-        PlatformContent.discovered_at >= since
+    query = select(*TRENDING_COLUMNS).where(
+        PlatformContent.discovered_at >= since,
+        PlatformContent.trending_score.isnot(None)
     ).order_by(desc(PlatformContent.trending_score))
     
     if platforms:
@@ -44,12 +66,12 @@ async def get_trends(
     
     query = query.limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    return _trending_response(result.all())
 
 
 @router.get("/{platform}", response_model=List[TrendingContentResponse])
 async def get_platform_trends(
-    platform: Platform,
+    platform: PlatformName,
     niche: Optional[str] = Query(None),
     timeframe: str = Query("24h", regex="^(1h|6h|12h|24h|7d|30d)$"),
     limit: int = Query(50, ge=1, le=200),
@@ -67,19 +89,20 @@ async def get_platform_trends(
     }
     since = datetime.utcnow() - timeframe_map[timeframe]
     
-    query = select(PlatformContent).where(
+    query = select(*TRENDING_COLUMNS).where(
         PlatformContent.platform == platform,
-        PlatformContent.discovered_at >= since
+        PlatformContent.discovered_at >= since,
+        PlatformContent.trending_score.isnot(None)
     ).order_by(desc(PlatformContent.trending_score))
     
     query = query.limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    return _trending_response(result.all())
 
 
 @router.post("/discover/{platform}")
 async def trigger_discovery(
-    platform: Platform,
+    platform: PlatformName,
     niche: str = Query(..., min_length=1),
     limit: int = Query(100, ge=10, le=500)
 ):
@@ -121,7 +144,9 @@ async def get_trend_stats(
     
     # Top trending score
     top_trending = await db.execute(
-        select(PlatformContent).order_by(
+        select(PlatformContent).where(
+            PlatformContent.trending_score.isnot(None)
+        ).order_by(
             desc(PlatformContent.trending_score)
         ).limit(1)
     )
@@ -1,18 +1,21 @@
 """Video management API endpoints"""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
+from sqlalchemy.orm import joinedload
 from typing import List, Optional
 from uuid import UUID
 
 from app.core.database import get_db
+from app.models.platform import PlatformName
 from app.models.platform_content import PlatformContent
 from app.models.video_analysis import VideoAnalysis
 from app.models.downloaded_video import DownloadedVideo
 from app.models.output_video import OutputVideo
 from app.schemas.video import (
     PlatformContentResponse,
+    PlatformContentListAdapter,
     VideoAnalysisResponse,
     DownloadedVideoResponse,
     OutputVideoResponse,
@@ -26,14 +29,18 @@ router = APIRouter()
 @router.get("/content", response_model=List[PlatformContentResponse])
 async def list_platform_content(
     job_id: Optional[UUID] = Query(None),
-    platform: Optional[str] = Query(None),
+    platform: Optional[PlatformName] = Query(None),
     recommended: Optional[bool] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     db: AsyncSession = Depends(get_db)
 ):
     """List discovered platform content with filtering"""
-    query = select(PlatformContent).order_by(desc(PlatformContent.trending_score))
+    query = (
+        select(PlatformContent)
+        .options(joinedload(PlatformContent.details))
+        .order_by(desc(PlatformContent.trending_score))
+    )
     
     if job_id:
         query = query.where(PlatformContent.job_id == job_id)
@@ -42,7 +49,13 @@ async def list_platform_content(
     
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    
+    # Validate and serialize the whole page in one pass
+    rows = PlatformContentListAdapter.validate_python(result.scalars().all(), from_attributes=True)
+    return Response(
+        content=PlatformContentListAdapter.dump_json(rows, by_alias=True),
+        media_type="application/json"
+    )
 
 
 @router.get("/content/{content_id}", response_model=PlatformContentResponse)
@@ -52,7 +65,9 @@ async def get_platform_content(
 ):
     """Get detailed platform content information"""
     result = await db.execute(
-        select(PlatformContent).where(PlatformContent.content_id == content_id)
+        select(PlatformContent)
+        .options(joinedload(PlatformContent.details))
+        .where(PlatformContent.content_id == content_id)
     )
     content = result.scalar_one_or_none()
     
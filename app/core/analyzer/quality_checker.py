@@ -1,8 +1,10 @@
 """Local quality checking utilities (no AI required)."""
 
 from typing import Dict, Any, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+import os
 import structlog
 
 logger = structlog.get_logger()
@@ -234,8 +236,18 @@ class QualityChecker:
 class BatchQualityChecker:
     """Check quality of multiple videos efficiently."""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = None):
         self.checker = QualityChecker()
+        self.max_workers = max_workers or os.cpu_count() or 1
+    
+    def _check_one(self, path: str) -> QualityReport:
+        try:
+            return self.checker.check_video(path)
+        except Exception as e:
+            logger.error(f"Quality check failed for {path}: {e}")
+            report = QualityReport(passed=False)
+            report.issues.append(str(e))
+            return report
     
     def check_batch(
         self,
@@ -244,20 +256,16 @@ class BatchQualityChecker:
         """
         Check multiple videos.
         
+        OpenCV releases the GIL while it decodes, so videos are checked
+        in parallel on a thread pool.
+        
         Returns dict mapping path to report.
         """
-        results = {}
-        
-        for path in video_paths:
-            try:
-                results[path] = self.checker.check_video(path)
-            except Exception as e:
-                logger.error(f"Quality check failed for {path}: {e}")
-                report = QualityReport(passed=False)
-                report.issues.append(str(e))
-                results[path] = report
+        if len(video_paths) < 2:
+            return {path: self._check_one(path) for path in video_paths}
         
-        return results
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(video_paths))) as pool:
+            return dict(zip(video_paths, pool.map(self._check_one, video_paths)))
     
     def filter_passed(
         self,
@@ -332,10 +332,10 @@ Evaluation Criteria:
             result.has_black_bars = analysis.get("has_black_bars", result.has_black_bars)
             result.is_vertical = analysis.get("is_vertical_oriented", result.is_vertical)
             
-            # Normalize scores to 0-1
-            result.visual_quality_score = analysis.get("visual_quality_score", 5) / 10.0
-            result.relevance_score = analysis.get("relevance_score", 5) / 10.0
-            result.virality_potential = analysis.get("virality_potential", 5) / 10.0
+            # Normalize scores to 0-1 (the DB rejects anything outside it)
+            result.visual_quality_score = min(1.0, max(0.0, analysis.get("visual_quality_score", 5) / 10.0))
+            result.relevance_score = min(1.0, max(0.0, analysis.get("relevance_score", 5) / 10.0))
+            result.virality_potential = min(1.0, max(0.0, analysis.get("virality_potential", 5) / 10.0))
             
             result.detected_topics = analysis.get("detected_topics", [])
             result.detected_text = analysis.get("detected_text_overlays", [])
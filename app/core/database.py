@@ -2,22 +2,62 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from typing import AsyncGenerator
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from typing import AsyncGenerator, Any
+import orjson
+import uuid
 
 from app.config import settings
 
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB bind values with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create async engine
 # Convert sync URL to async if needed
 database_url = settings.database_url
 if database_url.startswith("postgresql://"):
     database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
 
+if settings.db_null_pool:
+    # Every checkout opens (and closes) its own connection
+    pool_options = {"poolclass": NullPool}
+else:
+    # A worker's analysis pipeline holds one connection for its writer while
+    # other sessions (job updates, logs) check out their own; never size the
+    # pool below the pipeline's concurrency
+    pool_options = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": max(settings.db_pool_size, settings.analysis_concurrency + 2),
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+connect_args = {}
+if settings.db_pgbouncer:
+    # Transaction pooling hands each transaction a different server
+    # connection, so prepared statements can't be cached or reuse names
+    connect_args = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+    }
+
 engine = create_async_engine(
     database_url,
     echo=settings.db_echo,
-    pool_size=settings.db_pool_size,
-    max_overflow=settings.db_max_overflow,
-    pool_pre_ping=True,
+    connect_args=connect_args,
+    # Room for every model's insert/select shapes so statements are
+    # compiled once per process instead of evicted and recompiled
+    query_cache_size=settings.db_query_cache_size,
+    # The asyncpg dialect registers its JSONB codec with these, so JSON
+    # columns are (de)serialized by orjson inside the driver
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **pool_options,
 )
 
 # Create async session factory
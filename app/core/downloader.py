@@ -2,18 +2,103 @@
 
 import os
 import asyncio
+import socket
+import time
 from typing import Optional, List, Dict, Any, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from datetime import datetime
+from urllib.parse import urlparse
 import hashlib
 import structlog
 
 from app.config import settings
+from app.core.downloader_cache import get_metadata_cache
 
 logger = structlog.get_logger()
 
 
+_yt_dlp = None
+
+
+def _get_yt_dlp():
+    """Import yt_dlp on first download and cache the module."""
+    global _yt_dlp
+    if _yt_dlp is None:
+        import yt_dlp
+        _yt_dlp = yt_dlp
+    return _yt_dlp
+
+
+# DNS cache for the video hosts yt-dlp connects to. Only hosts registered
+# with _register_dns_host are cached; every other lookup passes through.
+DNS_CACHE_TTL_SECONDS = 300
+DNS_CACHE_MAX_ENTRIES = 256
+_dns_cache: "OrderedDict[tuple, Tuple[list, float]]" = OrderedDict()
+_dns_hosts: set = set()
+_original_getaddrinfo = socket.getaddrinfo
+
+
+def _register_dns_host(host: Optional[str]):
+    """Allow lookups of a download host to be cached."""
+    if host:
+        _dns_hosts.add(host)
+
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """
+    socket.getaddrinfo with a bounded TTL cache for registered hosts.
+    
+    Failures are not cached. Expired entries are dropped when looked up,
+    and the least recently used entry is evicted beyond
+    DNS_CACHE_MAX_ENTRIES.
+    """
+    if host not in _dns_hosts:
+        return _original_getaddrinfo(host, port, family, type, proto, flags)
+    
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    
+    cached = _dns_cache.get(key)
+    if cached:
+        if cached[1] > now:
+            _dns_cache.move_to_end(key)
+            return cached[0]
+        del _dns_cache[key]
+    
+    result = _original_getaddrinfo(host, port, family, type, proto, flags)
+    _dns_cache[key] = (result, now + DNS_CACHE_TTL_SECONDS)
+    while len(_dns_cache) > DNS_CACHE_MAX_ENTRIES:
+        _dns_cache.popitem(last=False)
+    return result
+
+
+def _install_dns_cache():
+    """
+    Route socket.getaddrinfo through the DNS cache (idempotent).
+    
+    This replaces socket.getaddrinfo for the whole process, so the
+    database, Redis, OpenAI and httpx lookups go through the wrapper too.
+    Those hosts are never registered, so they resolve uncached exactly as
+    before; only registered download hosts are served from the cache.
+    """
+    if socket.getaddrinfo is not _cached_getaddrinfo:
+        socket.getaddrinfo = _cached_getaddrinfo
+
+
+async def _prewarm_dns(host: str, port: int = 443):
+    """Register a host and resolve it once so batch downloads hit the cache."""
+    _register_dns_host(host)
+    loop = asyncio.get_running_loop()
+    try:
+        # Same arguments urllib3 uses when opening a connection
+        await loop.run_in_executor(
+            None, _cached_getaddrinfo, host, port, 0, socket.SOCK_STREAM
+        )
+    except OSError as e:
+        logger.warning(f"DNS prewarm failed: {e}", host=host)
+
+
 @dataclass
 class DownloadResult:
     """Result of a video download operation."""
@@ -67,6 +152,9 @@ class VideoDownloader:
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0"
     ]
     
+    # Partial downloads older than this are restarted rather than resumed
+    PARTIAL_MAX_AGE_HOURS = 24
+    
     def __init__(
         self,
         storage_path: str = None,
@@ -90,6 +178,12 @@ class VideoDownloader:
         
         # Track active downloads
         self._active_downloads: Dict[str, asyncio.Task] = {}
+        
+        # Metadata cache for already-fetched videos, shared per process
+        self.metadata_cache = get_metadata_cache(str(self.storage_path / "metadata_cache.db"))
+        
+        # Cache DNS lookups across downloads
+        _install_dns_cache()
     
     def _get_output_path(self, video_id: str, extension: str = "mp4") -> str:
         """Generate unique output path for a video."""
@@ -128,12 +222,21 @@ class VideoDownloader:
                 "User-Agent": random.choice(self.USER_AGENTS),
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
                 "Accept-Language": "en-US,en;q=0.5",
+                "Connection": "keep-alive",
             },
             
             # Performance
-            "socket_timeout": 30,
+            "socket_timeout": 15,
             "retries": 3,
             "fragment_retries": 5,
+            "file_access_retries": 3,
+            "concurrent_fragment_downloads": min(8, self.max_concurrent),
+            "buffersize": 1024 * 1024,
+            "http_chunk_size": 10 * 1024 * 1024,
+            
+            # Resume partial downloads via HTTP Range requests
+            "continuedl": True,
+            "nopart": False,
             
             # File limits
             "max_filesize": self.max_file_size_mb * 1024 * 1024,
@@ -150,6 +253,35 @@ class VideoDownloader:
             "cookiesfrombrowser": None,  # Set to ("chrome",) if needed
         }
     
+    def _discard_stale_partial(self, output_path: str):
+        """Remove a .part file too old to be safely resumed."""
+        part_path = f"{output_path}.part"
+        try:
+            age = time.time() - os.stat(part_path).st_mtime
+        except FileNotFoundError:
+            return
+        
+        if age > self.PARTIAL_MAX_AGE_HOURS * 3600:
+            try:
+                os.unlink(part_path)
+                logger.debug(f"Discarded stale partial download: {part_path}")
+            except OSError as e:
+                logger.warning(f"Failed to delete {part_path}: {e}")
+    
+    def _apply_info(self, result: DownloadResult, info: Dict[str, Any]):
+        """Populate a DownloadResult from a yt-dlp info dict."""
+        result.duration_seconds = info.get("duration", 0) or 0
+        result.resolution = f"{info.get('width', 0)}x{info.get('height', 0)}"
+        result.fps = int(info.get("fps", 0) or 0)
+        result.format = info.get("ext", "mp4") or "mp4"
+        result.metadata = {
+            "title": info.get("title"),
+            "uploader": info.get("uploader"),
+            "upload_date": info.get("upload_date"),
+            "view_count": info.get("view_count"),
+            "like_count": info.get("like_count")
+        }
+    
     async def download_video(
         self,
         url: str,
@@ -168,21 +300,35 @@ class VideoDownloader:
             DownloadResult with status and file info
         """
         result = DownloadResult(content_id=content_id or video_id)
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
+        _register_dns_host(urlparse(url).hostname)
         output_path = self._get_output_path(video_id)
         
-        # Check if already downloaded
-        if os.path.exists(output_path):
+        # Check if already downloaded (stat off the event loop, slow on network mounts)
+        try:
+            existing = await asyncio.to_thread(os.stat, output_path)
+        except FileNotFoundError:
+            existing = None
+        
+        if existing is not None:
             logger.info(f"Video already exists: {video_id}")
             result.success = True
             result.local_path = output_path
-            result.file_size_bytes = os.path.getsize(output_path)
+            result.file_size_bytes = existing.st_size
+            
+            # Fill in metadata from cache to skip the yt-dlp round-trip
+            cached_info = self.metadata_cache.get(video_id)
+            if cached_info:
+                self._apply_info(result, cached_info)
             return result
         
+        # Resume a recent .part file, restart an old one
+        await asyncio.to_thread(self._discard_stale_partial, output_path)
+        
         async with self._semaphore:
             try:
-                import yt_dlp
+                yt_dlp = _get_yt_dlp()
                 
                 ydl_opts = self._get_ydl_options(output_path)
                 
@@ -198,17 +344,8 @@ class VideoDownloader:
                     result.success = True
                     result.local_path = output_path
                     result.file_size_bytes = os.path.getsize(output_path)
-                    result.duration_seconds = info.get("duration", 0)
-                    result.resolution = f"{info.get('width', 0)}x{info.get('height', 0)}"
-                    result.fps = int(info.get("fps", 0) or 0)
-                    result.format = info.get("ext", "mp4")
-                    result.metadata = {
-                        "title": info.get("title"),
-                        "uploader": info.get("uploader"),
-                        "upload_date": info.get("upload_date"),
-                        "view_count": info.get("view_count"),
-                        "like_count": info.get("like_count")
-                    }
+                    self._apply_info(result, info)
+                    self.metadata_cache.set(video_id, info)
                     
                     logger.info(
                         "Download complete",
@@ -223,7 +360,7 @@ class VideoDownloader:
                 result.error = str(e)
                 logger.error(f"Download failed: {e}", video_id=video_id, url=url)
         
-        result.download_time_seconds = (datetime.now() - start_time).total_seconds()
+        result.download_time_seconds = time.perf_counter() - start_time
         return result
     
     async def batch_download(
@@ -243,39 +380,59 @@ class VideoDownloader:
         """
         total = len(videos)
         completed = 0
-        results = []
         
-        async def download_with_callback(video):
+        # Resolve each unique host once up front
+        hosts = {urlparse(v["url"]).hostname for v in videos} - {None}
+        await asyncio.gather(*(_prewarm_dns(host) for host in hosts))
+        
+        results: List[Optional[DownloadResult]] = [None] * total
+        num_workers = min(self.max_concurrent, total) or 1
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrent * 2)
+        
+        async def worker():
             nonlocal completed
-            result = await self.download_video(
-                url=video["url"],
-                video_id=video["video_id"],
-                content_id=video.get("content_id", "")
-            )
-            completed += 1
-            
-            if progress_callback:
-                await progress_callback(completed, total, result)
-            
-            return result
+            while True:
+                item = await queue.get()
+                try:
+                    if item is None:
+                        return
+                    
+                    index, video = item
+                    try:
+                        result = await self.download_video(
+                            url=video["url"],
+                            video_id=video["video_id"],
+                            content_id=video.get("content_id", "")
+                        )
+                    except Exception as e:
+                        result = DownloadResult(
+                            content_id=video.get("content_id", ""),
+                            error=str(e)
+                        )
+                    
+                    results[index] = result
+                    completed += 1
+                    
+                    # A failing callback must not replace the download's result
+                    if progress_callback:
+                        try:
+                            await progress_callback(completed, total, result)
+                        except Exception as e:
+                            logger.warning("Download progress callback failed", error=str(e))
+                finally:
+                    queue.task_done()
         
-        # Process with limited concurrency
-        tasks = [download_with_callback(v) for v in videos]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Bounded queue: only a few pending items are held at any time
+        workers = [asyncio.create_task(worker()) for _ in range(num_workers)]
         
-        # Handle exceptions
-        final_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                error_result = DownloadResult(
-                    content_id=videos[i].get("content_id", ""),
-                    error=str(result)
-                )
-                final_results.append(error_result)
-            else:
-                final_results.append(result)
+        for item in enumerate(videos):
+            await queue.put(item)
+        for _ in workers:
+            await queue.put(None)
+        
+        await asyncio.gather(*workers)
         
-        return final_results
+        return results
     
     async def download_for_job(
         self,
@@ -292,7 +449,7 @@ class VideoDownloader:
         Returns:
             Tuple of (results, skipped_count)
         """
-        from sqlalchemy import select
+        from sqlalchemy import select, insert
         from app.core.database import async_session_maker
         from app.models.platform_content import PlatformContent
         from app.models.downloaded_video import DownloadedVideo
@@ -308,19 +465,22 @@ class VideoDownloader:
             result = await session.execute(query)
             content = result.scalars().all()
             
+            # Fetch already downloaded content in a single query
+            downloaded_ids = set()
+            if content:
+                existing = await session.execute(
+                    select(DownloadedVideo.content_id).where(
+                        DownloadedVideo.content_id.in_([c.content_id for c in content])
+                    )
+                )
+                downloaded_ids = set(existing.scalars().all())
+            
             # Filter out already downloaded
             videos_to_download = []
             skipped = 0
             
             for c in content:
-                # Check if already downloaded
-                existing = await session.execute(
-                    select(DownloadedVideo).where(
-                        DownloadedVideo.content_id == c.content_id
-                    )
-                )
-                
-                if existing.scalar_one_or_none():
+                if c.content_id in downloaded_ids:
                     skipped += 1
                     continue
                 
@@ -342,21 +502,24 @@ class VideoDownloader:
             # Download all
             results = await self.batch_download(videos_to_download)
             
-            # Save successful downloads to database
-            for result in results:
-                if result.success:
-                    downloaded = DownloadedVideo(
-                        content_id=result.content_id,
-                        local_path=result.local_path,
-                        file_size_bytes=result.file_size_bytes,
-                        resolution=result.resolution,
-                        format=result.format,
-                        fps=result.fps,
-                        duration_seconds=result.duration_seconds
-                    )
-                    session.add(downloaded)
+            # Save successful downloads in one bulk INSERT
+            rows = [
+                {
+                    "content_id": result.content_id,
+                    "local_path": result.local_path,
+                    "file_size_bytes": result.file_size_bytes,
+                    "resolution": result.resolution,
+                    "format": result.format,
+                    "fps": result.fps,
+                    "duration_seconds": result.duration_seconds
+                }
+                for result in results
+                if result.success
+            ]
             
-            await session.commit()
+            if rows:
+                await session.execute(insert(DownloadedVideo), rows)
+                await session.commit()
             
             return results, skipped
     
@@ -367,25 +530,30 @@ class VideoDownloader:
         now = time.time()
         max_age_seconds = max_age_hours * 3600
         
-        for file_path in self.temp_dir.iterdir():
-            if file_path.is_file():
-                age = now - file_path.stat().st_mtime
+        # DirEntry caches the readdir result, avoiding a stat per is_file()
+        with os.scandir(self.temp_dir) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                
+                age = now - entry.stat(follow_symlinks=False).st_mtime
                 if age > max_age_seconds:
                     try:
-                        file_path.unlink()
-                        logger.debug(f"Deleted temp file: {file_path}")
+                        os.unlink(entry.path)
+                        logger.debug(f"Deleted temp file: {entry.path}")
                     except Exception as e:
-                        logger.warning(f"Failed to delete {file_path}: {e}")
+                        logger.warning(f"Failed to delete {entry.path}: {e}")
     
     def get_download_stats(self) -> Dict[str, Any]:
         """Get download directory statistics."""
         total_size = 0
         file_count = 0
         
-        for file_path in self.raw_dir.iterdir():
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
-                file_count += 1
+        with os.scandir(self.raw_dir) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    total_size += entry.stat(follow_symlinks=False).st_size
+                    file_count += 1
         
         return {
             "total_files": file_count,
@@ -0,0 +1,111 @@
+"""Persistent SQLite metadata cache for downloaded videos."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any
+import orjson
+import structlog
+
+logger = structlog.get_logger()
+
+
+# Only the yt-dlp info fields the downloader actually consumes are cached;
+# the full info dict (formats, thumbnails, ...) is far too large to store.
+CACHED_INFO_FIELDS = (
+    "duration",
+    "width",
+    "height",
+    "fps",
+    "ext",
+    "title",
+    "uploader",
+    "upload_date",
+    "view_count",
+    "like_count",
+)
+
+
+class MetadataCache:
+    """
+    Local cache of yt-dlp metadata keyed by platform video ID.
+
+    Lets repeat and backfill runs skip the yt-dlp network round-trip for
+    videos that have already been fetched and are still on disk.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None  # Autocommit, each write is its own txn
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta ("
+            "video_id TEXT PRIMARY KEY, "
+            "info_json BLOB NOT NULL, "
+            "fetched_at INTEGER NOT NULL)"
+        )
+
+    def get(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """Return cached info dict for a video, or None on miss."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT info_json FROM meta WHERE video_id = ?",
+                    (video_id,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Metadata cache lookup failed: {e}", video_id=video_id)
+            return None
+
+        if row is None:
+            return None
+        return orjson.loads(row[0])
+
+    def set(self, video_id: str, info: Dict[str, Any]):
+        """Store (or replace) the metadata for a video."""
+        trimmed = {key: info.get(key) for key in CACHED_INFO_FIELDS}
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (video_id, info_json, fetched_at) "
+                    "VALUES (?, ?, ?)",
+                    (video_id, orjson.dumps(trimmed), int(time.time()))
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Metadata cache write failed: {e}", video_id=video_id)
+
+    def close(self):
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# One connection per database file per process, shared by every downloader
+_shared_caches: Dict[str, MetadataCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_metadata_cache(db_path: str) -> MetadataCache:
+    """Return the process's shared MetadataCache for a database file."""
+    with _shared_lock:
+        cache = _shared_caches.get(db_path)
+        if cache is None:
+            cache = _shared_caches[db_path] = MetadataCache(db_path)
+        return cache
+
+
+def close_metadata_caches():
+    """Close every shared MetadataCache (on worker process shutdown)."""
+    with _shared_lock:
+        for cache in _shared_caches.values():
+            cache.close()
+        _shared_caches.clear()
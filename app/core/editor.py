@@ -1,28 +1,64 @@
 """Video editing pipeline for compilation and customization"""
 
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, field
+from __future__ import annotations
+
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, field, replace
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from enum import Enum
 import os
+import uuid
+import asyncio
+import hashlib
+import subprocess
 from datetime import datetime
 import structlog
-from moviepy.editor import (
-    VideoFileClip,
-    TextClip,
-    CompositeVideoClip,
-    concatenate_videoclips,
-    AudioFileClip,
-    CompositeAudioClip,
-    ColorClip
-)
-from moviepy.video.fx import all as vfx
 import numpy as np
 
 from app.config import settings
+from app.core.editor.ffmpeg_pipeline import (
+    FFmpegPipeline,
+    PipelineSegment,
+    BackgroundMusic,
+    OverlayStyle,
+    HW_ENCODER_ARGS,
+    detect_hw_encoder
+)
+from app.core.editor.text_renderer import TextRenderer
+from app.utils.video_utils import get_video_info, get_stream_params, concatenate_videos, temp_output_path
+
+if TYPE_CHECKING:
+    from moviepy.editor import VideoFileClip, CompositeVideoClip
 
 logger = structlog.get_logger()
 
+_moviepy = None
+
+
+def _lazy_import():
+    """
+    Import moviepy.editor on first use and cache the module.
+    
+    MoviePy's import probes for FFmpeg and ImageMagick, which processes
+    that only use the FFmpeg pipeline (or only the downloader) can skip.
+    """
+    global _moviepy
+    if _moviepy is None:
+        try:
+            import moviepy.editor as mpy
+            _moviepy = mpy
+        except ImportError:
+            raise ImportError("moviepy is required: pip install moviepy")
+    return _moviepy
+
+
+@lru_cache(maxsize=64)
+def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    """Convert hex color to RGB tuple (memoized, styles reuse few colors)"""
+    return tuple(bytes.fromhex(hex_color.lstrip('#')))
+
 
 class TransitionType(str, Enum):
     CUT = "cut"
@@ -80,6 +116,10 @@ class EditingConfig:
     audio_settings: AudioSettings = field(default_factory=AudioSettings)
     intro_clip_path: Optional[str] = None
     outro_clip_path: Optional[str] = None
+    use_ffmpeg_pipeline: bool = True  # Render via a single FFmpeg graph
+    hw_encoder: Optional[str] = None  # None = auto-detect, falls back to libx264
+    cpu_affinity: Optional[List[int]] = None  # Cores to pin FFmpeg renders to (Linux)
+    video_bitrate: str = "8M"
 
 
 @dataclass
@@ -106,6 +146,10 @@ class EditResult:
 class VideoEditor:
     """Video editing pipeline for creating compilations"""
     
+    # Normalized sources and abandoned .tmp files older than this are
+    # removed from temp after each compilation
+    TEMP_CACHE_MAX_AGE = 3600
+    
     def __init__(self, config: Optional[EditingConfig] = None):
         self.config = config or EditingConfig()
         self.output_path = Path(settings.local_storage_path) / "processed"
@@ -114,6 +158,25 @@ class VideoEditor:
         # Create directories
         self.output_path.mkdir(parents=True, exist_ok=True)
         self.temp_path.mkdir(parents=True, exist_ok=True)
+        
+        # Text overlays are rendered once as cached PNG sprites
+        self.text_renderer = TextRenderer()
+        self.sprite_path = self.temp_path / "sprites"
+        
+        # Video encoder (hardware if available)
+        self.video_codec = self.config.hw_encoder or detect_hw_encoder() or "libx264"
+    
+    def _write_params(self) -> Dict[str, Any]:
+        """Encoder arguments for MoviePy's write_videofile"""
+        if self.video_codec in HW_ENCODER_ARGS:
+            return {
+                "codec": self.video_codec,
+                "ffmpeg_params": HW_ENCODER_ARGS[self.video_codec] + [
+                    "-b:v", self.config.video_bitrate
+                ]
+            }
+        
+        return {"codec": self.video_codec, "preset": "medium"}
     
     def compile_ranking_video(
         self,
@@ -126,51 +189,270 @@ class VideoEditor:
                    clips=len(clips), 
                    output=output_filename)
         
+        if self.config.use_ffmpeg_pipeline:
+            result = self._compile_with_ffmpeg(clips, output_filename)
+            if result.success:
+                return result
+            
+            logger.warning("FFmpeg pipeline failed, falling back to MoviePy",
+                          error=result.error)
+        
+        return self._compile_with_moviepy(clips, output_filename)
+    
+    async def compile_ranking_video_async(
+        self,
+        clips: List[ClipInfo],
+        output_filename: str,
+        title: Optional[str] = None
+    ) -> EditResult:
+        """Run compile_ranking_video in a worker thread to keep the event loop free"""
+        return await asyncio.to_thread(
+            self.compile_ranking_video,
+            clips,
+            output_filename,
+            title
+        )
+    
+    def _intro_outro_paths(self) -> Tuple[Optional[str], Optional[str]]:
+        """Return configured intro/outro paths that exist on disk"""
+        intro = self.config.intro_clip_path
+        outro = self.config.outro_clip_path
+        return (
+            intro if intro and os.path.exists(intro) else None,
+            outro if outro and os.path.exists(outro) else None
+        )
+    
+    def _matches_output(self, path: str) -> bool:
+        """Check if a file can be stream-copied next to the rendered body"""
+        params = get_stream_params(path)
+        if not params:
+            return False
+        
+        width, height = self.config.output_resolution
+        return (
+            params["video_codec"] == "h264"
+            and params["width"] == width
+            and params["height"] == height
+            and params["r_frame_rate"] == f"{self.config.output_fps}/1"
+            and params["pix_fmt"] == "yuv420p"
+            and params["audio_codec"] == "aac"
+            and params["sample_rate"] == str(FFmpegPipeline.SAMPLE_RATE)
+            and params["channels"] == 2
+        )
+    
+    def _build_segments(
+        self,
+        clips: List[ClipInfo],
+        include_intro_outro: bool = True
+    ) -> List[PipelineSegment]:
+        """Convert clips (optionally plus intro/outro) into FFmpeg pipeline segments"""
+        audio_settings = self.config.audio_settings
+        intro, outro = self._intro_outro_paths() if include_intro_outro else (None, None)
+        fade = (
+            self.config.transition_duration
+            if self.config.transition_type == TransitionType.FADE
+            else 0.0
+        )
+        
+        segments = []
+        
+        if intro:
+            segments.append(PipelineSegment(path=intro))
+        
+        for i, clip_info in enumerate(clips):
+            segments.append(PipelineSegment(
+                path=clip_info.path,
+                start=clip_info.start_time,
+                end=clip_info.end_time,
+                rank=clip_info.rank,
+                caption=clip_info.caption,
+                fade_in=fade if i > 0 else 0.0,
+                fade_out=fade if i < len(clips) - 1 else 0.0,
+                volume=(
+                    audio_settings.original_audio_volume
+                    if audio_settings.background_music_path
+                    else 1.0
+                )
+            ))
+        
+        if outro:
+            segments.append(PipelineSegment(path=outro))
+        
+        return segments
+    
+    def _compile_with_ffmpeg(
+        self,
+        clips: List[ClipInfo],
+        output_filename: str
+    ) -> EditResult:
+        """Render the compilation as a single FFmpeg filter_complex pass"""
+        width, height = self.config.output_resolution
+        audio_settings = self.config.audio_settings
+        overlay = self.config.ranking_overlay
+        caption_style = self.config.caption_style
+        
+        background_music = None
+        if (
+            audio_settings.background_music_path
+            and os.path.exists(audio_settings.background_music_path)
+        ):
+            cached_music = self._cached_background_music(
+                audio_settings.background_music_path,
+                audio_settings.background_volume
+            )
+            background_music = BackgroundMusic(
+                path=cached_music or audio_settings.background_music_path,
+                # Volume is already applied to the cached PCM
+                volume=1.0 if cached_music else audio_settings.background_volume,
+                fade_in=audio_settings.fade_in_duration,
+                fade_out=audio_settings.fade_out_duration
+            )
+        
+        pipeline = FFmpegPipeline(
+            width=width,
+            height=height,
+            fps=self.config.output_fps,
+            video_codec=self.video_codec,
+            bitrate=self.config.video_bitrate,
+            cpu_affinity=self.config.cpu_affinity
+        )
+        
+        output_file = str(self.output_path / output_filename)
+        
+        # Intro/outro already in output format are spliced in with stream
+        # copy instead of being decoded and re-encoded with the body
+        ends = [p for p in self._intro_outro_paths() if p]
+        copy_ends = bool(ends) and all(self._matches_output(p) for p in ends)
+        body_file = (
+            str(self.temp_path / f"body_{output_filename}") if copy_ends else output_file
+        )
+        
+        rendered = pipeline.render(
+            self._build_segments(clips, include_intro_outro=not copy_ends),
+            body_file,
+            background_music=background_music,
+            rank_style=OverlayStyle(
+                font=overlay.font,
+                font_size=overlay.font_size,
+                color=overlay.color,
+                border_color=overlay.stroke_color,
+                border_width=overlay.stroke_width,
+                fade_in=0.3 if overlay.animation == "fade" else 0.0
+            ),
+            caption_style=OverlayStyle(
+                font=caption_style.font,
+                font_size=caption_style.font_size,
+                color=caption_style.color,
+                border_color=caption_style.stroke_color,
+                border_width=caption_style.stroke_width
+            )
+        )
+        
+        if not rendered:
+            return EditResult(success=False, error="FFmpeg render failed")
+        
+        if copy_ends:
+            intro, outro = self._intro_outro_paths()
+            # Absolute paths: the concat list file lives in the temp dir
+            parts = [os.path.abspath(p) for p in (intro, body_file, outro) if p]
+            rendered = concatenate_videos(parts, output_file)
+            Path(body_file).unlink(missing_ok=True)
+            
+            if not rendered:
+                return EditResult(success=False, error="Intro/outro concatenation failed")
+        
+        info = get_video_info(rendered) or {}
+        
+        logger.info("Compilation complete", output=rendered)
+        
+        return EditResult(
+            success=True,
+            output_path=rendered,
+            duration_seconds=info.get("duration"),
+            file_size_bytes=os.path.getsize(rendered),
+            resolution=f"{width}x{height}"
+        )
+    
+    def _compile_with_moviepy(
+        self,
+        clips: List[ClipInfo],
+        output_filename: str
+    ) -> EditResult:
+        """Create a ranking compilation by compositing clips in MoviePy"""
+        mpy = _lazy_import()
+        
+        intermediates = []
+        body_file = None
+        
         try:
-            processed_clips = []
+            # Render each clip to a normalized intermediate in parallel.
+            # Workers get the resolved encoder so they skip re-detection.
+            run_id = uuid.uuid4().hex[:8]
+            worker_config = replace(self.config, hw_encoder=self.video_codec)
+            jobs = [
+                (
+                    clip_info,
+                    i,
+                    len(clips),
+                    str(self.temp_path / f"clip_{run_id}_{i:03d}.mp4")
+                )
+                for i, clip_info in enumerate(clips)
+            ]
+            
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                rendered = list(executor.map(
+                    _process_clip_to_tempfile,
+                    jobs,
+                    [worker_config] * len(jobs)
+                ))
             
-            for clip_info in clips:
-                clip = self._process_clip(clip_info)
-                if clip:
-                    processed_clips.append(clip)
+            intermediates = [path for path in rendered if path]
             
-            if not processed_clips:
+            if not intermediates:
                 return EditResult(
                     success=False,
                     error="No clips could be processed"
                 )
             
-            # Apply transitions
-            final_clips = self._apply_transitions(processed_clips)
-            
-            # Concatenate all clips
-            final_video = concatenate_videoclips(final_clips, method="compose")
-            
-            # Add intro/outro if configured
-            final_video = self._add_intro_outro(final_video)
-            
-            # Add background music
-            final_video = self._add_background_music(final_video)
-            
-            # Set output path
+            # Intermediates share encoder settings, so join with stream copy
             output_file = self.output_path / output_filename
+            body_file = str(self.temp_path / f"body_{run_id}.mp4")
+            if not concatenate_videos(
+                [os.path.abspath(path) for path in intermediates],
+                body_file
+            ):
+                return EditResult(
+                    success=False,
+                    error="Clip concatenation failed"
+                )
             
-            # Render final video
-            final_video.write_videofile(
-                str(output_file),
-                fps=self.config.output_fps,
-                codec="libx264",
-                audio_codec="aac",
-                preset="medium",
-                threads=4
-            )
+            intro, outro = self._intro_outro_paths()
+            needs_audio = bool(self.config.audio_settings.background_music_path)
             
-            # Cleanup
-            final_video.close()
-            for clip in processed_clips:
-                clip.close()
+            if intro or outro or needs_audio:
+                final_video = mpy.VideoFileClip(body_file)
+                
+                # Add intro/outro if configured
+                final_video = self._add_intro_outro(final_video)
+                
+                # Add background music
+                final_video = self._add_background_music(final_video)
+                
+                # Render final video
+                final_video.write_videofile(
+                    str(output_file),
+                    fps=self.config.output_fps,
+                    audio_codec="aac",
+                    threads=os.cpu_count() or 4,
+                    **self._write_params()
+                )
+                
+                final_video.close()
+            else:
+                os.replace(body_file, output_file)
             
             # Get file info
+            info = get_video_info(str(output_file)) or {}
             file_size = os.path.getsize(output_file)
             
             logger.info("Compilation complete", output=str(output_file))
@@ -178,7 +460,7 @@ class VideoEditor:
             return EditResult(
                 success=True,
                 output_path=str(output_file),
-                duration_seconds=final_video.duration,
+                duration_seconds=info.get("duration"),
                 file_size_bytes=file_size,
                 resolution=f"{self.config.output_resolution[0]}x{self.config.output_resolution[1]}"
             )
@@ -189,30 +471,126 @@ class VideoEditor:
                 success=False,
                 error=str(e)
             )
+        
+        finally:
+            # Cleanup intermediates
+            for path in intermediates + ([body_file] if body_file else []):
+                Path(path).unlink(missing_ok=True)
+            self._prune_temp_cache()
+    
+    def _prune_temp_cache(self):
+        """Remove stale normalized sources and leftover partial writes from temp."""
+        cutoff = datetime.now().timestamp() - self.TEMP_CACHE_MAX_AGE
+        for pattern in ("norm_*.mp4", "*.tmp.*"):
+            for path in self.temp_path.glob(pattern):
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                except OSError:
+                    pass
+    
+    def _normalize_source(
+        self,
+        path: str,
+        width: int,
+        height: int,
+        fps: int,
+        start: float = 0.0,
+        end: Optional[float] = None
+    ) -> str:
+        """
+        Pre-scale the used segment of a source clip to the output size and
+        frame rate once.
+        
+        MoviePy then reads frames that are already target-sized instead
+        of resizing every frame in Python. Only [start, end) is encoded,
+        so a short subclip doesn't re-encode the whole source. Results are
+        cached in temp by (path, mtime, size, fps, segment) so compilations
+        sharing sources reuse them. Returns the original path if
+        normalization fails.
+        """
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return path
+        
+        key = hashlib.blake2b(
+            f"{path}:{mtime}:{width}:{height}:{fps}:{start}:{end}".encode()
+        ).hexdigest()[:16]
+        normalized = self.temp_path / f"norm_{key}.mp4"
+        
+        if normalized.exists():
+            return str(normalized)
+        
+        trim = []
+        if start > 0:
+            trim.extend(["-ss", f"{start:.3f}"])
+        if end:
+            trim.extend(["-t", f"{end - start:.3f}"])
+        
+        tmp_path = temp_output_path(normalized)
+        try:
+            result = subprocess.run(
+                [
+                    "ffmpeg", "-y",
+                    *trim,
+                    "-i", path,
+                    "-vf", (
+                        f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                        f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:black,setsar=1"
+                    ),
+                    "-r", str(fps),
+                    "-c:v", "libx264",
+                    "-crf", "18",
+                    "-preset", "ultrafast",
+                    "-c:a", "aac",
+                    str(tmp_path)
+                ],
+                capture_output=True,
+                text=True,
+                timeout=600
+            )
+            
+            if result.returncode != 0:
+                logger.warning("Source normalization failed", path=path, error=result.stderr)
+                return path
+            
+            os.replace(tmp_path, normalized)
+            return str(normalized)
+            
+        except Exception as e:
+            logger.warning("Failed to normalize source", path=path, error=str(e))
+            return path
+        
+        finally:
+            tmp_path.unlink(missing_ok=True)
     
     def _process_clip(self, clip_info: ClipInfo) -> Optional[VideoFileClip]:
         """Process a single clip with effects and overlays"""
+        mpy = _lazy_import()
+        
         try:
-            # Load video clip
-            clip = VideoFileClip(clip_info.path)
+            # Load video clip, pre-scaled to the output size by FFmpeg
+            target_w, target_h = self.config.output_resolution
+            source = self._normalize_source(
+                clip_info.path, target_w, target_h, self.config.output_fps,
+                start=clip_info.start_time,
+                end=clip_info.end_time
+            )
+            clip = mpy.VideoFileClip(source)
             
-            # Trim if specified
-            if clip_info.start_time > 0 or clip_info.end_time:
+            # Trim if specified (normalized sources are already trimmed)
+            if source == clip_info.path and (clip_info.start_time > 0 or clip_info.end_time):
                 end = clip_info.end_time or clip.duration
                 clip = clip.subclip(clip_info.start_time, end)
             
-            # Resize to match output resolution
-            target_w, target_h = self.config.output_resolution
-            clip = clip.resize(height=target_h)
-            
-            # Center crop if wider than target
-            if clip.w > target_w:
-                x_center = clip.w // 2
-                x1 = x_center - (target_w // 2)
-                clip = clip.crop(x1=x1, x2=x1 + target_w)
-            
-            # Pad if narrower than target
-            elif clip.w < target_w:
+            # Fit inside the output frame and letterbox, matching the
+            # FFmpeg pipeline's scale+pad filter. Normalized sources are
+            # already the right size and skip this.
+            if tuple(clip.size) != (target_w, target_h):
+                scale = min(target_w / clip.w, target_h / clip.h)
+                clip = clip.resize(newsize=(round(clip.w * scale), round(clip.h * scale)))
+                
                 clip = clip.on_color(
                     size=(target_w, target_h),
                     color=(0, 0, 0),
@@ -241,17 +619,20 @@ class VideoEditor:
         rank: int
     ) -> CompositeVideoClip:
         """Add ranking number overlay to clip"""
+        mpy = _lazy_import()
+        
         overlay_config = self.config.ranking_overlay
         
         # Create ranking text
-        rank_text = TextClip(
+        rank_text = mpy.ImageClip(self.text_renderer.render_sprite(
             f"#{rank}",
-            fontsize=overlay_config.font_size,
             font=overlay_config.font,
+            size=overlay_config.font_size,
             color=overlay_config.color,
             stroke_color=overlay_config.stroke_color,
-            stroke_width=overlay_config.stroke_width
-        )
+            stroke_width=overlay_config.stroke_width,
+            output_dir=str(self.sprite_path)
+        ))
         
         # Position the text
         rank_text = rank_text.set_position((
@@ -263,9 +644,9 @@ class VideoEditor:
         if overlay_config.animation == "fade":
             rank_text = rank_text.crossfadein(0.3)
         elif overlay_config.animation == "zoom":
-            rank_text = rank_text.fx(vfx.resize, lambda t: 1 + 0.5 * max(0, 0.5 - t))
+            rank_text = rank_text.fx(mpy.vfx.resize, lambda t: 1 + 0.5 * max(0, 0.5 - t))
         
-        return CompositeVideoClip([clip, rank_text])
+        return mpy.CompositeVideoClip([clip, rank_text])
     
     def _add_caption(
         self,
@@ -273,84 +654,126 @@ class VideoEditor:
         text: str
     ) -> CompositeVideoClip:
         """Add caption text to clip"""
+        mpy = _lazy_import()
+        
         style = self.config.caption_style
         
         # Create caption text
-        caption = TextClip(
+        caption = mpy.ImageClip(self.text_renderer.render_sprite(
             text,
-            fontsize=style.font_size,
             font=style.font,
+            size=style.font_size,
             color=style.color,
             stroke_color=style.stroke_color,
             stroke_width=style.stroke_width,
-            method="caption",
-            size=(clip.w - 40, None)
-        )
+            max_width=clip.w - 40,
+            output_dir=str(self.sprite_path)
+        ))
         
         # Add background if configured
         if style.bg_color:
-            bg = ColorClip(
+            bg = mpy.ColorClip(
                 size=(clip.w, caption.h + 20),
                 color=self._hex_to_rgb(style.bg_color)
             ).set_opacity(style.bg_opacity)
             
-            caption = CompositeVideoClip([bg, caption.set_position("center")])
+            caption = mpy.CompositeVideoClip([bg, caption.set_position("center")])
         
         # Position caption
         caption = caption.set_position(("center", clip.h - caption.h - 50))
         caption = caption.set_duration(clip.duration)
         
-        return CompositeVideoClip([clip, caption])
+        return mpy.CompositeVideoClip([clip, caption])
     
-    def _apply_transitions(
+    def _apply_transition(
         self,
-        clips: List[VideoFileClip]
-    ) -> List[VideoFileClip]:
-        """Apply transitions between clips"""
-        if len(clips) <= 1:
-            return clips
+        clip: VideoFileClip,
+        index: int,
+        total: int
+    ) -> VideoFileClip:
+        """Apply fade transitions to a clip based on its position"""
+        if total <= 1 or self.config.transition_type != TransitionType.FADE:
+            return clip
         
-        transition_type = self.config.transition_type
         duration = self.config.transition_duration
+        if index > 0:
+            clip = clip.fadein(duration)
+        if index < total - 1:
+            clip = clip.fadeout(duration)
         
-        if transition_type == TransitionType.CUT:
-            return clips
-        
-        processed = []
-        for i, clip in enumerate(clips):
-            if transition_type == TransitionType.FADE:
-                if i > 0:
-                    clip = clip.crossfadein(duration)
-                if i < len(clips) - 1:
-                    clip = clip.crossfadeout(duration)
-            
-            processed.append(clip)
-        
-        return processed
+        return clip
     
     def _add_intro_outro(self, video: VideoFileClip) -> VideoFileClip:
         """Add intro and outro clips if configured"""
+        mpy = _lazy_import()
+        
         clips_to_join = []
         
         if self.config.intro_clip_path and os.path.exists(self.config.intro_clip_path):
-            intro = VideoFileClip(self.config.intro_clip_path)
+            intro = mpy.VideoFileClip(self.config.intro_clip_path)
             intro = intro.resize(height=self.config.output_resolution[1])
             clips_to_join.append(intro)
         
         clips_to_join.append(video)
         
         if self.config.outro_clip_path and os.path.exists(self.config.outro_clip_path):
-            outro = VideoFileClip(self.config.outro_clip_path)
+            outro = mpy.VideoFileClip(self.config.outro_clip_path)
             outro = outro.resize(height=self.config.output_resolution[1])
             clips_to_join.append(outro)
         
         if len(clips_to_join) > 1:
-            return concatenate_videoclips(clips_to_join, method="compose")
+            return mpy.concatenate_videoclips(clips_to_join, method="compose")
         
         return video
     
+    def _cached_background_music(self, path: str, volume: float) -> Optional[str]:
+        """
+        Decode background music once to a volume-adjusted PCM WAV.
+        
+        The cache key covers path, mtime and volume, so renders sharing a
+        track skip the MP3/AAC decode entirely. Returns None on failure.
+        """
+        mtime = os.path.getmtime(path)
+        key = hashlib.blake2b(f"{path}:{mtime}:{volume}".encode()).hexdigest()[:16]
+        cached_path = self.temp_path / f"bgm_{key}.wav"
+        
+        if cached_path.exists():
+            return str(cached_path)
+        
+        tmp_path = temp_output_path(cached_path)
+        try:
+            result = subprocess.run(
+                [
+                    "ffmpeg", "-y",
+                    "-i", path,
+                    "-filter:a", f"volume={volume}",
+                    "-ac", "2",
+                    "-ar", str(FFmpegPipeline.SAMPLE_RATE),
+                    str(tmp_path)
+                ],
+                capture_output=True,
+                text=True,
+                timeout=120
+            )
+            
+            if result.returncode != 0:
+                logger.warning("Background music decode failed", error=result.stderr)
+                return None
+            
+            os.replace(tmp_path, cached_path)
+            return str(cached_path)
+            
+        except Exception as e:
+            logger.warning("Failed to cache background music", error=str(e))
+            return None
+        
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    
     def _add_background_music(self, video: VideoFileClip) -> VideoFileClip:
         """Add background music to video"""
+        mpy = _lazy_import()
+        
         audio_settings = self.config.audio_settings
         
         if not audio_settings.background_music_path:
@@ -362,19 +785,24 @@ class VideoEditor:
             return video
         
         try:
-            # Load background music
-            bg_music = AudioFileClip(audio_settings.background_music_path)
+            # Load background music, preferring the decoded PCM cache
+            cached_music = self._cached_background_music(
+                audio_settings.background_music_path,
+                audio_settings.background_volume
+            )
+            bg_music = mpy.AudioFileClip(cached_music or audio_settings.background_music_path)
             
             # Loop if shorter than video
             if bg_music.duration < video.duration:
                 loops_needed = int(video.duration / bg_music.duration) + 1
-                bg_music = concatenate_audioclips([bg_music] * loops_needed)
+                bg_music = mpy.concatenate_audioclips([bg_music] * loops_needed)
             
             # Trim to video length
             bg_music = bg_music.subclip(0, video.duration)
             
-            # Adjust volume
-            bg_music = bg_music.volumex(audio_settings.background_volume)
+            # Adjust volume (already baked into the cached PCM)
+            if not cached_music:
+                bg_music = bg_music.volumex(audio_settings.background_volume)
             
             # Apply fade in/out
             if audio_settings.fade_in_duration > 0:
@@ -387,7 +815,7 @@ class VideoEditor:
                 original_audio = video.audio.volumex(audio_settings.original_audio_volume)
                 
                 # Mix audio tracks
-                final_audio = CompositeAudioClip([original_audio, bg_music])
+                final_audio = mpy.CompositeAudioClip([original_audio, bg_music])
                 video = video.set_audio(final_audio)
             else:
                 video = video.set_audio(bg_music)
@@ -400,8 +828,7 @@ class VideoEditor:
     
     def _hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
         """Convert hex color to RGB tuple"""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        return _hex_to_rgb(hex_color)
     
     def extract_clip_segment(
         self,
@@ -411,15 +838,17 @@ class VideoEditor:
         output_filename: str
     ) -> EditResult:
         """Extract a segment from a video"""
+        mpy = _lazy_import()
+        
         try:
-            clip = VideoFileClip(input_path)
+            clip = mpy.VideoFileClip(input_path)
             segment = clip.subclip(start_time, end_time)
             
             output_file = self.temp_path / output_filename
             segment.write_videofile(
                 str(output_file),
                 fps=self.config.output_fps,
-                codec="libx264"
+                **self._write_params()
             )
             
             segment.close()
@@ -437,3 +866,53 @@ class VideoEditor:
                 success=False,
                 error=str(e)
             )
+
+
+def _process_clip_to_tempfile(
+    job: Tuple[ClipInfo, int, int, str],
+    config: EditingConfig
+) -> Optional[str]:
+    """
+    Process one clip and write it to a normalized intermediate file.
+    
+    Module-level so it can run in a ProcessPoolExecutor worker.
+    Returns the intermediate path, or None if the clip failed.
+    """
+    mpy = _lazy_import()
+    
+    clip_info, index, total, output_path = job
+    editor = VideoEditor(config)
+    
+    clip = editor._process_clip(clip_info)
+    if clip is None:
+        return None
+    
+    try:
+        clip = editor._apply_transition(clip, index, total)
+        
+        # Every intermediate needs an audio stream for the stream-copy concat
+        if clip.audio is None:
+            clip = clip.set_audio(mpy.AudioClip(
+                lambda t: np.zeros((len(t), 2)) if np.ndim(t) else np.zeros(2),
+                duration=clip.duration,
+                fps=FFmpegPipeline.SAMPLE_RATE
+            ))
+        
+        clip.write_videofile(
+            output_path,
+            fps=config.output_fps,
+            audio_codec="aac",
+            audio_fps=FFmpegPipeline.SAMPLE_RATE,
+            logger=None,
+            **editor._write_params()
+        )
+        return output_path
+        
+    except Exception as e:
+        logger.error("Failed to render clip",
+                    path=clip_info.path,
+                    error=str(e))
+        return None
+    
+    finally:
+        clip.close()
@@ -3,9 +3,12 @@
 from app.core.editor.compositor import VideoCompositor
 from app.core.editor.effects import EffectsEngine
 from app.core.editor.text_renderer import TextRenderer
+from app.core.editor.ffmpeg_pipeline import FFmpegPipeline, PipelineSegment
 
 __all__ = [
     "VideoCompositor",
     "EffectsEngine",
-    "TextRenderer"
+    "TextRenderer",
+    "FFmpegPipeline",
+    "PipelineSegment"
 ]
@@ -1,13 +1,25 @@
 """Video compositor for ranking videos."""
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from enum import Enum
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import hashlib
+import io
 import os
+import queue
+import subprocess
+import threading
+import uuid
 import structlog
 
 from app.config import settings
+from app.core.editor.effects import EffectsEngine, EffectSettings
+from app.core.editor.ffmpeg_pipeline import HW_ENCODER_ARGS, detect_hw_encoder
+from app.core.editor.text_renderer import TextRenderer
+from app.utils.video_utils import get_video_info, get_stream_params, concatenate_videos
 
 logger = structlog.get_logger()
 
@@ -33,6 +45,36 @@ class TextPosition(Enum):
     BOTTOM_RIGHT = "bottom_right"
 
 
+# xfade transition for each boundary type (NONE becomes a one-frame cut)
+XFADE_TRANSITIONS = {
+    TransitionType.NONE: "fade",
+    TransitionType.FADE: "fadeblack",
+    TransitionType.CROSSFADE: "fade",
+    TransitionType.SLIDE_LEFT: "slideleft",
+    TransitionType.SLIDE_UP: "slideup",
+    TransitionType.ZOOM: "zoomin",
+}
+
+# MoviePy positions that don't depend on the frame or text size
+_TEXT_MARGIN = 40
+_STATIC_POSITIONS = {
+    TextPosition.TOP_LEFT: (_TEXT_MARGIN, _TEXT_MARGIN),
+    TextPosition.TOP_CENTER: ("center", _TEXT_MARGIN),
+    TextPosition.CENTER: ("center", "center"),
+}
+
+# overlay filter (x, y) expressions matching _get_position's layout
+OVERLAY_POSITIONS = {
+    TextPosition.TOP_LEFT: ("40", "40"),
+    TextPosition.TOP_CENTER: ("(main_w-overlay_w)/2", "40"),
+    TextPosition.TOP_RIGHT: ("main_w-overlay_w-40", "40"),
+    TextPosition.CENTER: ("(main_w-overlay_w)/2", "(main_h-overlay_h)/2"),
+    TextPosition.BOTTOM_LEFT: ("40", "main_h-overlay_h-40"),
+    TextPosition.BOTTOM_CENTER: ("(main_w-overlay_w)/2", "main_h-overlay_h-140"),
+    TextPosition.BOTTOM_RIGHT: ("main_w-overlay_w-40", "main_h-overlay_h-40"),
+}
+
+
 @dataclass
 class TextStyle:
     """Style configuration for text overlays."""
@@ -71,9 +113,13 @@ class CompositorConfig:
     output_width: int = 1080
     output_height: int = 1920
     fps: int = 30
-    codec: str = "libx264"
+    codec: str = "libx264"  # "auto" = best available hardware encoder
     audio_codec: str = "aac"
     bitrate: str = "8M"
+    encoder_threads: int = 0  # 0 = os.cpu_count()
+    encoder_preset: str = "medium"  # "ultrafast" for previews
+    encoder_crf: Optional[int] = None  # Constant quality instead of bitrate
+    chunk_encode: bool = True  # Encode groups of clips in parallel, then concat
     
     # Styling
     rank_style: TextStyle = field(default_factory=lambda: TextStyle(
@@ -102,6 +148,7 @@ class CompositorConfig:
     apply_stabilization: bool = False
     apply_watermark: bool = False
     watermark_path: Optional[str] = None
+    effects: Optional[EffectSettings] = None  # Rendered by FFmpeg before load
 
 
 @dataclass
@@ -116,6 +163,76 @@ class RenderResult:
     error: str = ""
 
 
+@lru_cache(maxsize=256)
+def _render_text_image(
+    text: str,
+    font: str,
+    size: int,
+    color: str,
+    stroke_color: str,
+    stroke_width: int,
+    max_width: int
+):
+    """
+    Render text once with Pillow and return it as an RGBA array.
+    
+    Rank labels and repeated captions hit this cache instead of being
+    rasterized again.
+    """
+    import numpy as np
+    
+    img = TextRenderer()._render_text_rgba(
+        text, font, size, color, stroke_color, stroke_width, max_width=max_width
+    )
+    return np.array(img)
+
+
+def _prefetch(iterator: Iterator, depth: int = 8) -> Iterator:
+    """
+    Drain an iterator on a background thread, buffering up to depth items.
+    
+    Used to decode the next frames while the current ones are being
+    encoded; PyAV releases the GIL while decoding and scaling.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        try:
+            for item in iterator:
+                if not put(("item", item)):
+                    return
+            put(("done", None))
+        except Exception as e:
+            put(("error", e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close:
+                close()
+    
+    threading.Thread(target=produce, daemon=True).start()
+    
+    try:
+        while True:
+            kind, value = buffer.get()
+            if kind == "done":
+                return
+            if kind == "error":
+                raise value
+            yield value
+    finally:
+        stop.set()
+
+
 class VideoCompositor:
     """
     Professional video compositor for ranking videos.
@@ -134,9 +251,16 @@ class VideoCompositor:
         # Output directory
         self.output_dir = Path(settings.local_storage_path) / "processed"
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.temp_dir = Path(settings.local_storage_path) / "temp"
+        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.effects = EffectsEngine()
+        self.text_renderer = TextRenderer()
+        self.sprite_dir = self.temp_dir / "sprites"
         
         # MoviePy imports
         self._moviepy = None
+        self._av = None
     
     @property
     def moviepy(self):
@@ -149,32 +273,44 @@ class VideoCompositor:
                 raise ImportError("moviepy is required: pip install moviepy")
         return self._moviepy
     
+    @property
+    def av(self):
+        """Lazy import PyAV (optional, falls back to MoviePy decoding)."""
+        if self._av is None:
+            try:
+                import av
+                self._av = av
+            except ImportError:
+                self._av = False
+        return self._av or None
+    
     def _sanitize_text(self, text: str) -> str:
         """Clean text for safe rendering."""
         if not text:
             return ""
         # Remove emojis and special characters that might crash font rendering
-        import re
-        return re.sub(r'[^\x00-\x7F]+', '', text)
+        return text.encode("ascii", "ignore").decode("ascii")
     
     def _get_position(self, position: TextPosition, text_size: Tuple[int, int]) -> Tuple:
         """Convert TextPosition enum to (x, y) coordinates."""
+        static = _STATIC_POSITIONS.get(position)
+        if static is not None:
+            return static
+        
         w, h = self.config.output_width, self.config.output_height
         tw, th = text_size
+        margin = _TEXT_MARGIN
         
-        margin = 40
-        
-        positions = {
-            TextPosition.TOP_LEFT: (margin, margin),
-            TextPosition.TOP_CENTER: ("center", margin),
-            TextPosition.TOP_RIGHT: (w - tw - margin, margin),
-            TextPosition.CENTER: ("center", "center"),
-            TextPosition.BOTTOM_LEFT: (margin, h - th - margin),
-            TextPosition.BOTTOM_CENTER: ("center", h - th - margin - 100),
-            TextPosition.BOTTOM_RIGHT: (w - tw - margin, h - th - margin),
-        }
+        if position == TextPosition.TOP_RIGHT:
+            return (w - tw - margin, margin)
+        if position == TextPosition.BOTTOM_LEFT:
+            return (margin, h - th - margin)
+        if position == TextPosition.BOTTOM_CENTER:
+            return ("center", h - th - margin - 100)
+        if position == TextPosition.BOTTOM_RIGHT:
+            return (w - tw - margin, h - th - margin)
         
-        return positions.get(position, ("center", "center"))
+        return ("center", "center")
     
     def _create_text_clip(
         self,
@@ -191,16 +327,16 @@ class VideoCompositor:
             return None
         
         try:
-            txt_clip = mpy.TextClip(
+            image = _render_text_image(
                 clean_text,
-                fontsize=style.size,
-                color=style.color,
-                font=style.font,
-                stroke_color=style.stroke_color,
-                stroke_width=style.stroke_width,
-                method='caption',
-                size=(self.config.output_width - 80, None)  # Max width with margin
+                style.font,
+                style.size,
+                style.color,
+                style.stroke_color,
+                style.stroke_width,
+                self.config.output_width - 80  # Max width with margin
             )
+            txt_clip = mpy.ImageClip(image, transparent=True)
             
             # Get text size for positioning
             text_size = txt_clip.size
@@ -215,6 +351,37 @@ class VideoCompositor:
             logger.warning(f"Failed to create text clip: {e}")
             return None
     
+    def _apply_effects_file(self, path: str) -> str:
+        """
+        Bake configured effects into a temp copy of the source with FFmpeg.
+        
+        Cached by (path, mtime, settings). Returns the original path if
+        no effects are configured or the render fails.
+        """
+        if self.config.effects is None:
+            return path
+        
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return path
+        
+        key = hashlib.blake2b(
+            f"{path}:{mtime}:{self.config.effects!r}".encode()
+        ).hexdigest()[:16]
+        output_path = self.temp_dir / f"fx_{key}.mp4"
+        
+        if output_path.exists():
+            return str(output_path)
+        
+        rendered = self.effects.render_to_file(
+            path,
+            str(output_path),
+            self.config.effects,
+            preset="ultrafast"
+        )
+        return rendered or path
+    
     def _process_clip(self, clip_config: ClipConfig) -> Any:
         """
         Process a single video clip.
@@ -222,82 +389,156 @@ class VideoCompositor:
         - Load and validate
         - Resize/crop to 9:16
         - Apply duration limits
-        - Add overlays
+        
+        Text overlays and transitions are added later by the FFmpeg
+        filter graph in render_ranking_video.
         """
         mpy = self.moviepy
         
         try:
-            # Load clip
-            clip = mpy.VideoFileClip(clip_config.path)
+            # Load clip (with effects already applied by FFmpeg)
+            path = self._apply_effects_file(clip_config.path)
+            
+            info = get_video_info(path) if self.av else None
+            if info and info.get("duration"):
+                source_duration = info["duration"]
+            else:
+                clip = mpy.VideoFileClip(path)
+                source_duration = clip.duration
             
             # Apply time trimming
-            if clip_config.start_offset > 0:
-                clip = clip.subclip(clip_config.start_offset)
-            if clip_config.end_offset > 0:
-                clip = clip.subclip(0, clip.duration - clip_config.end_offset)
+            start = max(clip_config.start_offset, 0.0)
+            available = source_duration - start - max(clip_config.end_offset, 0.0)
             
             # Apply duration limits
             if clip_config.duration:
                 target_duration = clip_config.duration
             else:
                 target_duration = min(
-                    clip.duration,
+                    available,
                     self.config.max_clip_duration
                 )
             
             target_duration = max(target_duration, self.config.min_clip_duration)
+            duration = min(available, target_duration)
             
-            if clip.duration > target_duration:
-                clip = clip.subclip(0, target_duration)
-            
-            # Resize to target resolution (9:16)
-            clip = self._resize_to_vertical(clip)
+            if info and info.get("duration"):
+                # Decode and scale natively, no per-frame ffmpeg pipe
+                clip = self._load_clip_pyav(path, start, duration, info.get("has_audio", False))
+            else:
+                clip = clip.subclip(start, start + duration)
+                
+                # Resize to target resolution (9:16)
+                clip = self._resize_to_vertical(clip)
             
             # Adjust clip audio volume
             if clip.audio:
                 clip = clip.volumex(clip_config.volume)
             
-            # Create overlays
-            overlays = [clip]
-            
-            # Rank overlay
-            if clip_config.show_rank_overlay and clip_config.rank > 0:
-                rank_text = f"#{clip_config.rank}"
-                rank_clip = self._create_text_clip(
-                    rank_text,
-                    self.config.rank_style,
-                    self.config.rank_position,
-                    clip.duration
-                )
-                if rank_clip:
-                    overlays.append(rank_clip)
-            
-            # Caption overlay
-            if clip_config.show_caption and clip_config.caption:
-                caption_clip = self._create_text_clip(
-                    clip_config.caption,
-                    self.config.caption_style,
-                    self.config.caption_position,
-                    clip.duration
-                )
-                if caption_clip:
-                    overlays.append(caption_clip)
-            
-            # Composite
-            if len(overlays) > 1:
-                final_clip = mpy.CompositeVideoClip(
-                    overlays,
-                    size=(self.config.output_width, self.config.output_height)
-                )
-            else:
-                final_clip = clip
-            
-            return final_clip
+            return clip
             
         except Exception as e:
             logger.error(f"Failed to process clip {clip_config.path}: {e}")
             return None
     
+    def _cover_geometry(
+        self,
+        width: int,
+        height: int
+    ) -> Tuple[int, int, int, int]:
+        """
+        Scale and crop that fill the output frame, matching _resize_to_vertical.
+        
+        Returns (scaled_w, scaled_h, crop_x, crop_y).
+        """
+        target_w = self.config.output_width
+        target_h = self.config.output_height
+        
+        if abs(height / width - target_h / target_w) < 0.1:
+            # Already close to 9:16, stretch to fit
+            return target_w, target_h, 0, 0
+        
+        scale = max(target_w / width, target_h / height)
+        scaled_w = max(target_w, round(width * scale))
+        scaled_h = max(target_h, round(height * scale))
+        return scaled_w, scaled_h, (scaled_w - target_w) // 2, (scaled_h - target_h) // 2
+    
+    def _decode_and_resize_pyav(
+        self,
+        path: str,
+        start: float,
+        end: float
+    ) -> Iterator[Tuple[float, Any]]:
+        """
+        Decode frames with PyAV, scaled in libswscale and center-cropped.
+        
+        Yields (time relative to start, RGB ndarray) in presentation order.
+        """
+        av = self.av
+        target_w = self.config.output_width
+        target_h = self.config.output_height
+        
+        container = av.open(path)
+        try:
+            stream = container.streams.video[0]
+            stream.thread_type = "AUTO"  # Frame-threaded decoding
+            
+            if start > 0:
+                container.seek(int(start / stream.time_base), stream=stream)
+            
+            geometry = None
+            for frame in container.decode(stream):
+                if frame.time is None or frame.time < start:
+                    continue
+                if frame.time >= end:
+                    break
+                
+                if geometry is None:
+                    geometry = self._cover_geometry(frame.width, frame.height)
+                scaled_w, scaled_h, x, y = geometry
+                
+                image = frame.reformat(
+                    width=scaled_w,
+                    height=scaled_h,
+                    format="rgb24"
+                ).to_ndarray()
+                yield frame.time - start, image[y:y + target_h, x:x + target_w]
+        finally:
+            container.close()
+    
+    def _load_clip_pyav(
+        self,
+        path: str,
+        start: float,
+        duration: float,
+        has_audio: bool
+    ) -> Any:
+        """Wrap the PyAV frame iterator in a MoviePy clip."""
+        mpy = self.moviepy
+        
+        # Decode ahead on a background thread so decoding overlaps encoding
+        frames = _prefetch(self._decode_and_resize_pyav(path, start, start + duration))
+        current = None
+        upcoming = next(frames, None)
+        if upcoming is None:
+            raise ValueError("No frames decoded")
+        
+        def make_frame(t):
+            # Export requests frames in order, so just advance the decoder
+            nonlocal current, upcoming
+            while upcoming is not None and (current is None or upcoming[0] <= t):
+                current = upcoming
+                upcoming = next(frames, None)
+            return current[1]
+        
+        clip = mpy.VideoClip(make_frame, duration=duration)
+        
+        if has_audio:
+            audio = mpy.AudioFileClip(path).subclip(start, start + duration)
+            clip = clip.set_audio(audio)
+        
+        return clip
+    
     def _resize_to_vertical(self, clip) -> Any:
         """Resize clip to 9:16 aspect ratio."""
         mpy = self.moviepy
@@ -338,33 +579,357 @@ class VideoCompositor:
         
         return clip.resize((target_w, target_h))
     
-    def _apply_transition(
+    def _render_overlay_sprite(self, text: str, style: TextStyle) -> Optional[str]:
+        """Render overlay text to a cached PNG sprite, or None on failure."""
+        clean_text = self._sanitize_text(text)
+        if not clean_text:
+            return None
+        
+        try:
+            return self.text_renderer.render_sprite(
+                clean_text,
+                font=style.font,
+                size=style.size,
+                color=style.color,
+                stroke_color=style.stroke_color,
+                stroke_width=style.stroke_width,
+                max_width=self.config.output_width - 80,
+                output_dir=str(self.sprite_dir)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to render text sprite: {e}")
+            return None
+    
+    def _overlay_descriptors(
         self,
-        clip1,
-        clip2,
-        transition_type: TransitionType,
-        duration: float
-    ):
-        """Apply transition between two clips."""
-        mpy = self.moviepy
+        clip_config: ClipConfig
+    ) -> List[Tuple[str, TextStyle, TextPosition]]:
+        """Text overlays for a clip as (text, style, position)."""
+        overlays = []
+        if clip_config.show_rank_overlay and clip_config.rank > 0:
+            overlays.append((
+                f"#{clip_config.rank}", self.config.rank_style, self.config.rank_position
+            ))
+        if clip_config.show_caption and clip_config.caption:
+            overlays.append((
+                clip_config.caption, self.config.caption_style, self.config.caption_position
+            ))
+        return overlays
+    
+    def _build_filter_complex(
+        self,
+        entries: List[Tuple[ClipConfig, float, bool]],
+        first_sprite_input: int,
+        fade_in: float = 0.0,
+        fade_out: float = 0.0
+    ) -> Tuple[str, List[str], float]:
+        """
+        Build the transition + overlay graph for processed clips.
+        
+        entries: (clip config, duration, has_audio) per input, in order.
+        Sprite inputs are numbered from first_sprite_input. fade_in and
+        fade_out dip the first/last clip to black, standing in for the
+        transition at a chunk boundary.
+        
+        Overlays are applied once to the joined timeline: each distinct
+        sprite is a single input, enabled during every clip that uses it
+        (switching at the midpoint of each transition).
+        
+        Returns (graph, sprite paths, total duration). The graph's
+        outputs are labelled [vout] and [aout].
+        """
+        fps = self.config.fps
+        layout = "aformat=sample_rates=44100:channel_layouts=stereo"
+        chains = []
+        
+        for i, (clip_config, duration, has_audio) in enumerate(entries):
+            # xfade needs matching frame rate, timebase and pixel format
+            chains.append(f"[{i}:v]fps={fps},settb=AVTB,setsar=1,format=yuv420p[v{i}]")
+            
+            if has_audio:
+                chains.append(f"[{i}:a]{layout},asetpts=PTS-STARTPTS[a{i}]")
+            else:
+                chains.append(f"anullsrc=r=44100:cl=stereo,atrim=duration={duration}[a{i}]")
+        
+        # Chain xfade/acrossfade through every boundary; each offset is the
+        # running output length minus the transition overlap
+        video_label, audio_label = "v0", "a0"
+        total = entries[0][1]
+        switches = [0.0]
+        
+        for i in range(1, len(entries)):
+            outgoing = entries[i - 1][0]
+            if outgoing.transition_out == TransitionType.NONE:
+                overlap = 1 / fps
+            else:
+                overlap = min(
+                    outgoing.transition_duration,
+                    entries[i - 1][1] / 2,
+                    entries[i][1] / 2
+                )
+            
+            offset = total - overlap
+            chains.append(
+                f"[{video_label}][v{i}]xfade=transition="
+                f"{XFADE_TRANSITIONS.get(outgoing.transition_out, 'fade')}:"
+                f"duration={overlap:.3f}:offset={offset:.3f}[x{i}]"
+            )
+            chains.append(f"[{audio_label}][a{i}]acrossfade=d={overlap:.3f}[ax{i}]")
+            video_label, audio_label = f"x{i}", f"ax{i}"
+            switches.append(offset + overlap / 2)
+            total = offset + entries[i][1]
         
-        if transition_type == TransitionType.NONE:
-            return mpy.concatenate_videoclips([clip1, clip2])
+        switches.append(total)
         
-        if transition_type == TransitionType.FADE:
-            clip1 = clip1.fadeout(duration)
-            clip2 = clip2.fadein(duration)
-            return mpy.concatenate_videoclips([clip1, clip2])
+        # Group overlay intervals by sprite so each is composited once
+        windows: Dict[Tuple[str, str, str], List[Tuple[float, float]]] = {}
+        for i, (clip_config, _, _) in enumerate(entries):
+            for text, style, position in self._overlay_descriptors(clip_config):
+                sprite = self._render_overlay_sprite(text, style)
+                if sprite:
+                    key = (sprite, *OVERLAY_POSITIONS[position])
+                    windows.setdefault(key, []).append((switches[i], switches[i + 1]))
         
-        if transition_type == TransitionType.CROSSFADE:
-            return mpy.concatenate_videoclips(
-                [clip1, clip2],
-                method="compose",
-                padding=-duration
+        sprites = []
+        for j, ((sprite, x, y), intervals) in enumerate(windows.items()):
+            sprite_input = first_sprite_input + len(sprites)
+            sprites.append(sprite)
+            enable = "+".join(
+                f"gte(t,{start:.3f})*lt(t,{end:.3f})" for start, end in intervals
+            )
+            chains.append(
+                f"[{video_label}][{sprite_input}:v]overlay=x={x}:y={y}:"
+                f"enable='{enable}':shortest=1[ov{j}]"
             )
+            video_label = f"ov{j}"
+        
+        edges = ["format=yuv420p"]
+        if fade_in > 0:
+            edges.append(f"fade=t=in:st=0:d={fade_in:.3f}")
+        if fade_out > 0:
+            edges.append(f"fade=t=out:st={total - fade_out:.3f}:d={fade_out:.3f}")
+        
+        chains.append(f"[{video_label}]{','.join(edges)}[vout]")
+        chains.append(f"[{audio_label}]anull[aout]")
+        
+        return ";".join(chains), sprites, total
+    
+    def _resolve_codec(self) -> str:
+        """Resolve codec="auto" to a hardware encoder, or libx264 if none works."""
+        if self.config.codec != "auto":
+            return self.config.codec
+        return detect_hw_encoder() or "libx264"
+    
+    def _video_encoder_args(self, threads: Optional[int] = None) -> List[str]:
+        """FFmpeg video encoder arguments for the final render."""
+        codec = self._resolve_codec()
+        
+        if codec in HW_ENCODER_ARGS:
+            args = ["-c:v", codec, *HW_ENCODER_ARGS[codec]]
+            quality = self.config.encoder_crf
+            if quality is not None and codec == "h264_nvenc":
+                args += ["-cq", str(quality)]
+            elif quality is not None and codec == "h264_qsv":
+                args += ["-global_quality", str(quality)]
+            else:
+                args += ["-b:v", self.config.bitrate]
+            return args
+        
+        threads = threads or self.config.encoder_threads or os.cpu_count() or 4
+        args = [
+            "-c:v", codec,
+            "-preset", self.config.encoder_preset,
+            "-threads", str(threads),
+            "-pix_fmt", "yuv420p",
+        ]
+        
+        if self.config.encoder_crf is not None:
+            args += ["-crf", str(self.config.encoder_crf)]
+        else:
+            args += ["-b:v", self.config.bitrate]
+        
+        if codec == "libx264":
+            # Frame threading scales further than sliced threading
+            args += ["-x264-params", "sliced-threads=0"]
         
-        # Default: just concatenate
-        return mpy.concatenate_videoclips([clip1, clip2])
+        return args
+    
+    def _can_copy_audio(self, path: str) -> bool:
+        """True if a track's audio is already in the output codec."""
+        params = get_stream_params(path) or {}
+        return params.get("audio_codec") == self.config.audio_codec
+    
+    def _build_render_command(
+        self,
+        inputs: List[str],
+        entries: List[Tuple[ClipConfig, float, bool]],
+        output_path: str,
+        audio_track: str = None,
+        fade_in: float = 0.0,
+        fade_out: float = 0.0,
+        threads: Optional[int] = None
+    ) -> Tuple[List[str], float]:
+        """Build one FFmpeg overlay + transition + encode command."""
+        cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error"]
+        for path in inputs:
+            cmd += ["-i", path]
+        
+        graph, sprites, total_duration = self._build_filter_complex(
+            entries, len(entries), fade_in=fade_in, fade_out=fade_out
+        )
+        for sprite in sprites:
+            cmd += ["-loop", "1", "-framerate", str(self.config.fps), "-i", sprite]
+        
+        # Replace audio if provided
+        audio_map = "[aout]"
+        audio_args = ["-c:a", self.config.audio_codec]
+        if audio_track:
+            track_input = len(entries) + len(sprites)
+            cmd += ["-i", audio_track]
+            graph += ";[aout]anullsink"  # Clip audio is replaced
+            
+            if self._can_copy_audio(audio_track):
+                audio_map = f"{track_input}:a"
+                audio_args = ["-c:a", "copy", "-t", f"{total_duration:.3f}"]
+            else:
+                graph += (
+                    f";[{track_input}:a]"
+                    f"atrim=duration={total_duration:.3f},asetpts=PTS-STARTPTS[music]"
+                )
+                audio_map = "[music]"
+        
+        cmd += [
+            "-filter_complex", graph,
+            "-map", "[vout]",
+            "-map", audio_map,
+            *self._video_encoder_args(threads),
+            *audio_args,
+            "-movflags", "+faststart",
+            output_path
+        ]
+        
+        return cmd, total_duration
+    
+    def _plan_chunks(self, count: int) -> List[Tuple[int, int]]:
+        """
+        Split clip indices into contiguous [start, end) encode chunks.
+        
+        Hardware encoders get a single chunk, they are fast already and
+        consumer GPUs limit concurrent encode sessions.
+        """
+        chunks = (os.cpu_count() or 1) // 4
+        if (
+            not self.config.chunk_encode
+            or self._resolve_codec() in HW_ENCODER_ARGS
+            or chunks < 2
+            or count < 2
+        ):
+            return [(0, count)]
+        
+        chunks = min(chunks, count)
+        size, extra = divmod(count, chunks)
+        bounds = []
+        start = 0
+        for i in range(chunks):
+            end = start + size + (1 if i < extra else 0)
+            bounds.append((start, end))
+            start = end
+        return bounds
+    
+    def _encode_chunked(
+        self,
+        inputs: List[str],
+        entries: List[Tuple[ClipConfig, float, bool]],
+        output_path: str,
+        audio_track: str,
+        run_id: str
+    ) -> Tuple[Optional[str], float]:
+        """
+        Encode clip groups in parallel FFmpeg processes and stream-copy
+        them together.
+        
+        Transitions at chunk boundaries become a fade through black.
+        Returns (output path or None, duration).
+        """
+        chunks = self._plan_chunks(len(entries))
+        threads = max(1, (os.cpu_count() or 1) // len(chunks))
+        chunk_paths = []
+        commands = []
+        total_duration = 0.0
+        
+        for n, (start, end) in enumerate(chunks):
+            fade_in = 0.0
+            if start > 0:
+                fade_in = min(entries[start - 1][0].transition_duration, entries[start][1] / 2) / 2
+            fade_out = 0.0
+            if end < len(entries):
+                fade_out = min(entries[end - 1][0].transition_duration, entries[end - 1][1] / 2) / 2
+            
+            chunk_path = str(self.temp_dir / f"chunk_{run_id}_{n:02d}.mp4")
+            cmd, duration = self._build_render_command(
+                inputs[start:end],
+                entries[start:end],
+                chunk_path,
+                fade_in=fade_in,
+                fade_out=fade_out,
+                threads=threads
+            )
+            chunk_paths.append(chunk_path)
+            commands.append(cmd)
+            total_duration += duration
+        
+        try:
+            processes = [
+                subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+                for cmd in commands
+            ]
+            failed = False
+            for process in processes:
+                _, stderr = process.communicate()
+                if process.returncode != 0:
+                    logger.error(f"Chunk encode failed: {stderr[-2000:]}")
+                    failed = True
+            
+            if failed:
+                return None, total_duration
+            
+            body_path = output_path if not audio_track else str(
+                self.temp_dir / f"body_{run_id}.mp4"
+            )
+            if not concatenate_videos([os.path.abspath(p) for p in chunk_paths], body_path):
+                return None, total_duration
+            
+            if audio_track:
+                # Swap in the audio track, video is stream-copied
+                process = subprocess.run(
+                    [
+                        "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+                        "-i", body_path,
+                        "-i", audio_track,
+                        "-map", "0:v",
+                        "-map", "1:a",
+                        "-c:v", "copy",
+                        "-c:a", "copy" if self._can_copy_audio(audio_track) else self.config.audio_codec,
+                        "-t", f"{total_duration:.3f}",
+                        "-movflags", "+faststart",
+                        output_path
+                    ],
+                    capture_output=True,
+                    text=True
+                )
+                os.unlink(body_path)
+                if process.returncode != 0:
+                    logger.error(f"Audio track mux failed: {process.stderr[-2000:]}")
+                    return None, total_duration
+            
+            return output_path, total_duration
+        
+        finally:
+            for path in chunk_paths:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
     
     def render_ranking_video(
         self,
@@ -386,48 +951,48 @@ class VideoCompositor:
             RenderResult with output info
         """
         result = RenderResult()
-        mpy = self.moviepy
         
         if not clips:
             result.error = "No clips to render"
             return result
         
+        intermediates = []
+        
         try:
             logger.info(f"Starting render: {len(clips)} clips")
             
-            processed_clips = []
+            # Decode and resize each clip in its own process,
+            # writing intermediates to disk (MoviePy clips don't pickle)
+            run_id = uuid.uuid4().hex[:8]
+            jobs = [
+                (clip_config, str(self.temp_dir / f"comp_{run_id}_{i:03d}.mp4"))
+                for i, clip_config in enumerate(clips)
+            ]
             
-            # Process each clip
-            for i, clip_config in enumerate(clips):
-                logger.debug(f"Processing clip {i+1}/{len(clips)}")
-                
-                processed = self._process_clip(clip_config)
-                if processed:
-                    processed_clips.append(processed)
+            workers = min(len(jobs), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                rendered = list(executor.map(
+                    _render_clip_to_tempfile,
+                    jobs,
+                    [self.config] * len(jobs)
+                ))
+            
+            intermediates = [path for path in rendered if path]
+            
+            inputs = []
+            entries = []
+            for clip_config, path in zip(clips, rendered):
+                info = get_video_info(path) if path else None
+                if info and info.get("duration"):
+                    inputs.append(path)
+                    entries.append((clip_config, info["duration"], info.get("has_audio", False)))
             
-            if not processed_clips:
+            if not entries:
                 result.error = "No clips successfully processed"
                 return result
             
-            # Concatenate with transitions
-            if len(processed_clips) == 1:
-                final_video = processed_clips[0]
-            else:
-                final_video = mpy.concatenate_videoclips(
-                    processed_clips,
-                    method="compose"
-                )
-            
-            # Replace audio if provided
-            if audio_track and os.path.exists(audio_track):
-                try:
-                    new_audio = mpy.AudioFileClip(audio_track)
-                    # Trim audio to match video
-                    if new_audio.duration > final_video.duration:
-                        new_audio = new_audio.subclip(0, final_video.duration)
-                    final_video = final_video.set_audio(new_audio)
-                except Exception as e:
-                    logger.warning(f"Failed to set audio track: {e}")
+            if not (audio_track and os.path.exists(audio_track)):
+                audio_track = None
             
             # Set output path
             output_path = str(self.output_dir / output_filename)
@@ -435,27 +1000,29 @@ class VideoCompositor:
             # Render
             logger.info("Writing video file...")
             
-            final_video.write_videofile(
-                output_path,
-                fps=self.config.fps,
-                codec=self.config.codec,
-                audio_codec=self.config.audio_codec,
-                bitrate=self.config.bitrate,
-                threads=4,
-                preset="medium",
-                verbose=False,
-                logger=None
-            )
-            
-            # Close clips
-            for clip in processed_clips:
-                clip.close()
-            final_video.close()
+            if len(self._plan_chunks(len(entries))) > 1:
+                rendered_path, total_duration = self._encode_chunked(
+                    inputs, entries, output_path, audio_track, run_id
+                )
+                if rendered_path is None:
+                    result.error = "FFmpeg chunked render failed"
+                    return result
+                output_path = rendered_path
+            else:
+                # Overlays, transitions and the final encode in one FFmpeg pass
+                cmd, total_duration = self._build_render_command(
+                    inputs, entries, output_path, audio_track
+                )
+                process = subprocess.run(cmd, capture_output=True, text=True)
+                if process.returncode != 0:
+                    result.error = f"FFmpeg render failed: {process.stderr[-2000:]}"
+                    logger.error(result.error)
+                    return result
             
             # Get file info
             result.success = True
             result.output_path = output_path
-            result.duration_seconds = final_video.duration
+            result.duration_seconds = total_duration
             result.file_size_bytes = os.path.getsize(output_path)
             result.resolution = f"{self.config.output_width}x{self.config.output_height}"
             result.fps = self.config.fps
@@ -471,6 +1038,13 @@ class VideoCompositor:
             logger.error(f"Rendering failed: {e}")
             result.error = str(e)
         
+        finally:
+            for path in intermediates:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+        
         return result
     
     def create_title_card(
@@ -519,31 +1093,101 @@ class VideoCompositor:
         }
         return colors.get(color.lower(), (0, 0, 0))
     
+    def _preview_frame(self, path: str, frame_time: float):
+        """Decode one frame near frame_time as a PIL image."""
+        av = self.av
+        
+        if av is None:
+            from PIL import Image
+            clip = self.moviepy.VideoFileClip(path)
+            try:
+                return Image.fromarray(clip.get_frame(min(frame_time, clip.duration - 0.1)))
+            finally:
+                clip.close()
+        
+        container = av.open(path)
+        try:
+            stream = container.streams.video[0]
+            container.seek(int(frame_time / stream.time_base), stream=stream)
+            
+            image = None
+            for frame in container.decode(stream):
+                image = frame.to_image()
+                if frame.time is not None and frame.time >= frame_time:
+                    break
+            
+            if image is None:
+                raise ValueError("No frames decoded")
+            return image
+        finally:
+            container.close()
+    
     def get_render_preview(
         self,
         clips: List[ClipConfig],
-        frame_time: float = 2.0
-    ) -> str:
-        """Generate a preview frame from the first clip."""
+        frame_time: float = 2.0,
+        output_path: Optional[str] = None
+    ) -> bytes:
+        """
+        Generate a JPEG preview frame from the first clip.
+        
+        The image is encoded in memory; it is only written to disk if
+        output_path is given. Returns empty bytes on failure.
+        """
         if not clips:
-            return ""
+            return b""
         
         try:
-            mpy = self.moviepy
-            clip = mpy.VideoFileClip(clips[0].path)
+            image = self._preview_frame(clips[0].path, frame_time)
             
-            # Get frame at specified time
-            frame = clip.get_frame(min(frame_time, clip.duration - 0.1))
+            buffer = io.BytesIO()
+            image.save(buffer, format="JPEG", quality=85)
+            preview = buffer.getvalue()
             
-            preview_path = str(self.output_dir / "preview.jpg")
+            if output_path:
+                Path(output_path).write_bytes(preview)
             
-            from PIL import Image
-            img = Image.fromarray(frame)
-            img.save(preview_path)
-            
-            clip.close()
-            return preview_path
+            return preview
             
         except Exception as e:
             logger.error(f"Preview generation failed: {e}")
-            return ""
+            return b""
+
+
+def _render_clip_to_tempfile(
+    job: Tuple[ClipConfig, str],
+    config: CompositorConfig
+) -> Optional[str]:
+    """
+    Process one clip and write it to an intermediate file.
+    
+    Module-level so it can run in a ProcessPoolExecutor worker.
+    Returns the intermediate path, or None if the clip failed.
+    """
+    clip_config, output_path = job
+    compositor = VideoCompositor(config)
+    
+    clip = compositor._process_clip(clip_config)
+    if clip is None:
+        return None
+    
+    try:
+        # Near-lossless and fast: the final render re-encodes anyway
+        clip.write_videofile(
+            output_path,
+            fps=config.fps,
+            codec="libx264",
+            audio_codec=config.audio_codec,
+            preset="ultrafast",
+            ffmpeg_params=["-crf", "18"],
+            verbose=False,
+            logger=None
+        )
+        return output_path
+        
+    except Exception as e:
+        logger.error(f"Failed to render clip {clip_config.path}: {e}")
+        return None
+    
+    finally:
+        clip.close()
@@ -2,8 +2,16 @@
 
 from typing import Optional, Tuple, Any
 from dataclasses import dataclass
+from pathlib import Path
+import math
+import os
+import subprocess
+import cv2
+import numpy as np
 import structlog
 
+from app.utils.video_utils import temp_output_path
+
 logger = structlog.get_logger()
 
 
@@ -46,7 +54,7 @@ class EffectsEngine:
     
     def __init__(self):
         self._moviepy = None
-        self._cv2 = None
+        self._kernels = None
     
     @property
     def moviepy(self):
@@ -56,25 +64,32 @@ class EffectsEngine:
         return self._moviepy
     
     @property
-    def cv2(self):
-        if self._cv2 is None:
-            import cv2
-            self._cv2 = cv2
-        return self._cv2
+    def kernels(self):
+        """Lazy import the numba kernels (None if numba is not installed)."""
+        if self._kernels is None:
+            try:
+                from app.core.editor import kernels
+                kernels.warm_up()
+                self._kernels = kernels
+            except ImportError:
+                self._kernels = False
+        return self._kernels or None
     
     def apply_effects(self, clip, settings: EffectSettings = None):
-        """Apply all configured effects to a clip."""
-        settings = settings or EffectSettings()
+        """
+        Apply all configured effects to an in-memory MoviePy clip.
         
-        # Color correction
-        if settings.brightness != 1.0:
-            clip = self._adjust_brightness(clip, settings.brightness)
+        Every effect runs per frame in Python; for files on disk use
+        render_to_file instead.
+        """
+        settings = settings or EffectSettings()
         
-        if settings.contrast != 1.0:
-            clip = self._adjust_contrast(clip, settings.contrast)
-        
-        if settings.saturation != 1.0:
-            clip = self._adjust_saturation(clip, settings.saturation)
+        # Color correction (one fused pass)
+        if (settings.brightness, settings.contrast, settings.saturation) != (1.0, 1.0, 1.0):
+            lut = None
+            if (settings.brightness, settings.contrast) != (1.0, 1.0):
+                lut = self._build_bc_lut(settings.brightness, settings.contrast)
+            clip = self._apply_color(clip, lut, settings.saturation)
         
         # Filters
         if settings.vignette:
@@ -96,51 +111,160 @@ class EffectsEngine:
         
         return clip
     
-    def _adjust_brightness(self, clip, factor: float):
-        """Adjust clip brightness."""
-        mpy = self.moviepy
+    def build_filter_chains(self, settings: EffectSettings = None) -> Tuple[str, str]:
+        """
+        Translate effect settings into FFmpeg -vf and -af filter chains.
         
-        def adjust_frame(frame):
-            import numpy as np
-            adjusted = np.clip(frame * factor, 0, 255).astype(np.uint8)
-            return adjusted
+        Returns (video_chain, audio_chain); either may be empty.
+        """
+        settings = settings or EffectSettings()
+        video_filters = []
+        audio_filters = []
         
-        return clip.fl_image(adjust_frame)
+        # Color correction in one eq pass. eq brightness is additive, so the
+        # multiplicative factor is mapped to the equivalent mid-grey offset.
+        eq = []
+        if settings.brightness != 1.0:
+            eq.append(f"brightness={(settings.brightness - 1.0) * 0.5:.4f}")
+        if settings.contrast != 1.0:
+            eq.append(f"contrast={settings.contrast:.4f}")
+        if settings.saturation != 1.0:
+            eq.append(f"saturation={settings.saturation:.4f}")
+        if eq:
+            video_filters.append("eq=" + ":".join(eq))
+        
+        # FFmpeg's vignette follows cos^4, pick the angle that darkens the
+        # corners by the same amount as the NumPy mask (floored at 0.3)
+        if settings.vignette:
+            corner = max(1.0 - settings.vignette_intensity, 0.3)
+            video_filters.append(f"vignette=angle={math.acos(corner ** 0.25):.4f}")
+        
+        if settings.blur:
+            video_filters.append(f"gblur=sigma={settings.blur_amount:.2f}")
+        
+        if settings.sharpen:
+            # unsharp rejects luma amounts outside -2.0..5.0
+            amount = min(max(settings.sharpen_amount, -2.0), 5.0)
+            video_filters.append(f"unsharp=5:5:{amount:.2f}:5:5:0")
+        
+        if settings.speed_factor != 1.0:
+            video_filters.append(f"setpts=PTS/{settings.speed_factor:.4f}")
+            audio_filters.append(f"atempo={settings.speed_factor:.4f}")
+        
+        # Audio
+        if settings.normalize_audio:
+            audio_filters.append("loudnorm")
+        
+        if settings.audio_gain_db != 0.0:
+            audio_filters.append(f"volume={settings.audio_gain_db:.2f}dB")
+        
+        return ",".join(video_filters), ",".join(audio_filters)
+    
+    def render_to_file(
+        self,
+        input_path: str,
+        output_path: str,
+        settings: EffectSettings = None,
+        preset: str = "medium"
+    ) -> Optional[str]:
+        """
+        Apply effects to a video file in a single FFmpeg pass.
+        
+        All filtering runs inside libavfilter, so frames never pass
+        through Python. Prefer this over apply_effects whenever the
+        source is a file on disk.
+        
+        The file is written beside output_path and moved into place only
+        when FFmpeg succeeds, so output_path is never left truncated.
+        
+        Returns the output path, or None if rendering failed.
+        """
+        video_chain, audio_chain = self.build_filter_chains(settings)
+        tmp_path = temp_output_path(output_path)
+        
+        cmd = ["ffmpeg", "-y", "-i", input_path]
+        if video_chain:
+            cmd.extend(["-vf", video_chain])
+        if audio_chain:
+            cmd.extend(["-af", audio_chain])
+        cmd.extend([
+            "-c:v", "libx264",
+            "-preset", preset,
+            "-c:a", "aac",
+            "-movflags", "+faststart",
+            str(tmp_path)
+        ])
+        
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            
+            if result.returncode != 0:
+                logger.error("FFmpeg effects render failed", error=result.stderr[-2000:])
+                return None
+            
+            os.replace(tmp_path, output_path)
+            return output_path
+        
+        except Exception as e:
+            logger.error(f"Failed to run FFmpeg effects: {e}")
+            return None
+        
+        finally:
+            tmp_path.unlink(missing_ok=True)
     
-    def _adjust_contrast(self, clip, factor: float):
-        """Adjust clip contrast."""
-        def adjust_frame(frame):
-            import numpy as np
-            mean = np.mean(frame)
-            adjusted = np.clip((frame - mean) * factor + mean, 0, 255).astype(np.uint8)
-            return adjusted
+    def _build_bc_lut(self, brightness: float, contrast: float):
+        """
+        Build a 256-entry uint8 lookup table for brightness then contrast.
         
-        return clip.fl_image(adjust_frame)
+        Contrast pivots on a fixed mid-grey (127.5) rather than the
+        per-frame mean so the table can be computed once per clip.
+        """
+        values = np.arange(256, dtype=np.float32) * brightness
+        values = (values - 127.5) * contrast + 127.5
+        return np.clip(values, 0, 255).astype(np.uint8)
     
-    def _adjust_saturation(self, clip, factor: float):
-        """Adjust clip saturation."""
-        cv2 = self.cv2
+    def _apply_color(self, clip, lut, saturation: float):
+        """Apply a brightness/contrast LUT and saturation in one frame pass."""
+        adjust_saturation = saturation != 1.0
+        
+        # Output buffers are allocated on the first frame and reused
+        buffers = {}
         
-        def adjust_frame(frame):
-            import numpy as np
-            hsv = cv2.cvtColor(frame, cv2.COLOR_RGB2HSV).astype(np.float32)
-            hsv[:, :, 1] = np.clip(hsv[:, :, 1] * factor, 0, 255)
-            return cv2.cvtColor(hsv.astype(np.uint8), cv2.COLOR_HSV2RGB)
+        # cv2/np are bound as defaults so each frame uses fast local lookups
+        def adjust_frame(frame, cv2=cv2, np=np):
+            if buffers.get("shape") != frame.shape:
+                buffers["shape"] = frame.shape
+                buffers["out"] = np.empty(frame.shape, dtype=np.uint8)
+                buffers["hsv"] = np.empty(frame.shape, dtype=np.uint8)
+                buffers["sat"] = np.empty(frame.shape[:2], dtype=np.uint8)
+            out = buffers["out"]
+            
+            if lut is not None:
+                frame = cv2.LUT(frame, lut, dst=out)
+            if not adjust_saturation:
+                return frame
+            
+            hsv = cv2.cvtColor(frame, cv2.COLOR_RGB2HSV, dst=buffers["hsv"])
+            hsv[:, :, 1] = cv2.convertScaleAbs(
+                hsv[:, :, 1], dst=buffers["sat"], alpha=saturation
+            )
+            return cv2.cvtColor(hsv, cv2.COLOR_HSV2RGB, dst=out)
         
         return clip.fl_image(adjust_frame)
     
     def _apply_vignette(self, clip, intensity: float):
         """Apply vignette effect."""
-        def apply_frame(frame):
-            import numpy as np
-            
-            rows, cols = frame.shape[:2]
-            
-            # Create vignette mask
-            X = np.arange(0, cols)
-            Y = np.arange(0, rows)
-            X, Y = np.meshgrid(X, Y)
-            
+        kernels = self.kernels
+        
+        # Frame size is constant within a clip, so the mask and the
+        # output buffer are built once
+        masks = {}
+        buffers = {}
+        
+        def build_mask(rows: int, cols: int):
+            Y, X = np.ogrid[:rows, :cols]
             center_x, center_y = cols / 2, rows / 2
             
             # Gaussian mask
@@ -148,32 +272,50 @@ class EffectsEngine:
                 ((X - center_x) ** 2 + (Y - center_y) ** 2) /
                 (center_x ** 2 + center_y ** 2)
             )
-            mask = np.clip(mask, 0.3, 1)
+            mask = np.clip(mask, 0.3, 1).astype(np.float32)
             
-            # Apply mask
-            result = frame.copy()
-            for i in range(3):
-                result[:, :, i] = (frame[:, :, i] * mask).astype(np.uint8)
+            if kernels is not None:
+                return mask, np.empty((rows, cols, 3), dtype=np.uint8)
             
-            return result
+            # Fixed-point (x/255) uint8 mask replicated across channels, so
+            # cv2.multiply stays in its uint8 SIMD path with no float frames
+            mask_u8 = np.rint(mask * 255).astype(np.uint8)
+            return cv2.merge([mask_u8, mask_u8, mask_u8]), None
+        
+        def apply_frame(frame, cv2=cv2, np=np):
+            shape = frame.shape[:2]
+            cached = masks.get(shape)
+            if cached is None:
+                cached = masks[shape] = build_mask(*shape)
+            mask, out = cached
+            
+            if out is not None:
+                kernels.vignette_apply(frame, mask, out)
+                return out
+            
+            out = buffers.get(shape)
+            if out is None:
+                out = buffers[shape] = np.empty(frame.shape, dtype=np.uint8)
+            return cv2.multiply(frame, mask, dst=out, scale=1 / 255)
         
         return clip.fl_image(apply_frame)
     
     def _apply_sharpen(self, clip, amount: float):
-        """Apply sharpening filter."""
-        cv2 = self.cv2
+        """Apply sharpening filter (unsharp mask)."""
+        # Output buffers are allocated on the first frame and reused
+        buffers = {}
         
-        def sharpen_frame(frame):
-            import numpy as np
-            
-            # Sharpening kernel
-            kernel = np.array([
-                [-1, -1, -1],
-                [-1, 9 * amount, -1],
-                [-1, -1, -1]
-            ]) / (1 + 8 * (amount - 1))
+        def sharpen_frame(frame, cv2=cv2, np=np):
+            if buffers.get("shape") != frame.shape:
+                buffers["shape"] = frame.shape
+                buffers["blur"] = np.empty(frame.shape, dtype=np.uint8)
+                buffers["out"] = np.empty(frame.shape, dtype=np.uint8)
             
-            return cv2.filter2D(frame, -1, kernel)
+            # Separable Gaussian is far cheaper than a dense 3x3 convolution
+            blurred = cv2.GaussianBlur(frame, (0, 0), sigmaX=1.0, dst=buffers["blur"])
+            return cv2.addWeighted(
+                frame, 1.0 + amount, blurred, -amount, 0, dst=buffers["out"]
+            )
         
         return clip.fl_image(sharpen_frame)
     
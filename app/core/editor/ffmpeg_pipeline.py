@@ -0,0 +1,410 @@
+"""Single-pass FFmpeg render pipeline for ranking compilations."""
+
+from typing import List, Optional, Tuple, Collection
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+import os
+import subprocess
+import structlog
+
+from app.config import settings
+from app.core.editor.text_renderer import TextRenderer
+from app.utils.video_utils import get_video_info
+
+logger = structlog.get_logger()
+
+
+# Hardware H.264 encoders in order of preference, with their rate-control args
+HW_ENCODER_ARGS = {
+    "h264_nvenc": ["-preset", "p4", "-tune", "hq", "-rc", "vbr", "-pix_fmt", "yuv420p"],
+    "h264_qsv": ["-preset", "medium", "-pix_fmt", "nv12"],
+    "h264_videotoolbox": ["-pix_fmt", "yuv420p"],
+}
+
+
+@lru_cache(maxsize=None)
+def detect_hw_encoder(ffmpeg_binary: str = "ffmpeg") -> Optional[str]:
+    """
+    Find a usable hardware H.264 encoder.
+    
+    An encoder being compiled in does not mean the device is present, so
+    each candidate is verified with a tiny test encode. The result is
+    cached for the lifetime of the process.
+    """
+    try:
+        result = subprocess.run(
+            [ffmpeg_binary, "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except Exception as e:
+        logger.debug(f"Encoder probe failed: {e}")
+        return None
+    
+    for encoder in HW_ENCODER_ARGS:
+        if encoder not in result.stdout:
+            continue
+        
+        try:
+            test = subprocess.run(
+                [
+                    ffmpeg_binary, "-hide_banner", "-loglevel", "error",
+                    "-f", "lavfi", "-i", "color=size=256x256:duration=0.1",
+                    "-c:v", encoder, "-f", "null", "-"
+                ],
+                capture_output=True,
+                timeout=15
+            )
+        except Exception:
+            continue
+        
+        if test.returncode == 0:
+            logger.info("Using hardware encoder", encoder=encoder)
+            return encoder
+    
+    return None
+
+
+@dataclass
+class OverlayStyle:
+    """Styling for a text sprite overlay."""
+    font: str = "Impact"
+    font_size: int = 48
+    color: str = "white"
+    border_color: str = "black"
+    border_width: int = 2
+    fade_in: float = 0.0
+
+
+@dataclass
+class PipelineSegment:
+    """A single input clip in the render graph."""
+    path: str
+    start: float = 0.0
+    end: Optional[float] = None  # None = until end of clip
+    rank: Optional[int] = None
+    caption: Optional[str] = None
+    fade_in: float = 0.0
+    fade_out: float = 0.0
+    volume: float = 1.0
+
+
+@dataclass
+class BackgroundMusic:
+    """Background music mixed under the compilation audio."""
+    path: str
+    volume: float = 0.2
+    fade_in: float = 0.0
+    fade_out: float = 0.0
+
+
+class FFmpegPipeline:
+    """
+    Render a compilation as one FFmpeg filter_complex invocation.
+    
+    Trimming, scaling, text overlays, fades, concatenation and audio
+    mixing all run inside a single native FFmpeg graph, so frames never
+    round-trip through Python. Text is rendered once to PNG sprites and
+    alpha-composited with the overlay filter.
+    """
+    
+    SAMPLE_RATE = 44100
+    
+    def __init__(
+        self,
+        width: int = 1080,
+        height: int = 1920,
+        fps: int = 30,
+        video_codec: str = "libx264",
+        preset: str = "veryfast",
+        bitrate: str = "8M",
+        audio_codec: str = "aac",
+        ffmpeg_binary: str = "ffmpeg",
+        cpu_affinity: Optional[Collection[int]] = None,
+        temp_dir: Optional[str] = None
+    ):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.video_codec = video_codec
+        self.preset = preset
+        self.bitrate = bitrate
+        self.audio_codec = audio_codec
+        self.ffmpeg_binary = ffmpeg_binary
+        self.cpu_affinity = set(cpu_affinity) if cpu_affinity else None
+        
+        self.sprite_dir = Path(temp_dir or Path(settings.local_storage_path) / "temp") / "sprites"
+        self.text_renderer = TextRenderer()
+    
+    def _pin_cpus(self):
+        """Pin the FFmpeg child process to the configured cores (Linux only)."""
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, self.cpu_affinity)
+    
+    def _video_codec_args(self) -> List[str]:
+        """Encoder arguments for the configured video codec."""
+        if self.video_codec in HW_ENCODER_ARGS:
+            return (
+                ["-c:v", self.video_codec]
+                + HW_ENCODER_ARGS[self.video_codec]
+                + ["-b:v", self.bitrate]
+            )
+        
+        return ["-c:v", self.video_codec, "-preset", self.preset, "-pix_fmt", "yuv420p"]
+    
+    def _probe(self, segment: PipelineSegment) -> Optional[Tuple[float, bool]]:
+        """Return (duration, has_audio) for a segment after trimming."""
+        info = get_video_info(segment.path)
+        if not info or not info.get("duration"):
+            return None
+        
+        end = segment.end if segment.end is not None else info["duration"]
+        end = min(end, info["duration"])
+        duration = end - segment.start
+        if duration <= 0:
+            return None
+        
+        return duration, info.get("has_audio", False)
+    
+    def _render_sprite(
+        self,
+        text: str,
+        style: OverlayStyle,
+        max_width: Optional[int] = None
+    ) -> Optional[str]:
+        """Render a text sprite, returning None if Pillow fails."""
+        try:
+            return self.text_renderer.render_sprite(
+                text,
+                font=style.font,
+                size=style.font_size,
+                color=style.color,
+                stroke_color=style.border_color,
+                stroke_width=style.border_width,
+                max_width=max_width,
+                output_dir=str(self.sprite_dir)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to render text sprite: {e}", text=text)
+            return None
+    
+    def _video_chain(
+        self,
+        index: int,
+        segment: PipelineSegment,
+        duration: float,
+        overlays: List[Tuple[int, str, str, float]]
+    ) -> List[str]:
+        """
+        Build the per-input video filter chains.
+        
+        overlays: (sprite input index, x expr, y expr, fade-in seconds)
+        """
+        w, h = self.width, self.height
+        end = segment.start + duration
+        
+        base = [
+            f"trim=start={segment.start}:end={end}",
+            "setpts=PTS-STARTPTS",
+            # Fit inside the frame and letterbox in one scale+pad pass
+            f"scale={w}:{h}:force_original_aspect_ratio=decrease",
+            f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2:black",
+            "setsar=1",
+            f"fps={self.fps}",
+        ]
+        chains = [f"[{index}:v]" + ",".join(base) + f"[base{index}]"]
+        current = f"base{index}"
+        
+        for j, (input_index, x, y, fade_in) in enumerate(overlays):
+            sprite = f"[{input_index}:v]format=rgba"
+            if fade_in > 0:
+                sprite += f",fade=t=in:st=0:d={fade_in}:alpha=1"
+            chains.append(f"{sprite}[spr{index}_{j}]")
+            chains.append(
+                f"[{current}][spr{index}_{j}]overlay=x={x}:y={y}:shortest=1[ov{index}_{j}]"
+            )
+            current = f"ov{index}_{j}"
+        
+        post = ["format=yuv420p"]
+        if segment.fade_in > 0:
+            post.append(f"fade=t=in:st=0:d={segment.fade_in}")
+        if segment.fade_out > 0:
+            post.append(
+                f"fade=t=out:st={max(duration - segment.fade_out, 0)}:d={segment.fade_out}"
+            )
+        chains.append(f"[{current}]" + ",".join(post) + f"[v{index}]")
+        
+        return chains
+    
+    def _audio_chain(
+        self,
+        index: int,
+        segment: PipelineSegment,
+        duration: float,
+        has_audio: bool
+    ) -> str:
+        """Build the per-input audio chain, substituting silence if needed."""
+        layout = f"aformat=sample_rates={self.SAMPLE_RATE}:channel_layouts=stereo"
+        
+        if not has_audio:
+            return (
+                f"anullsrc=r={self.SAMPLE_RATE}:cl=stereo,"
+                f"atrim=duration={duration}[a{index}]"
+            )
+        
+        end = segment.start + duration
+        return (
+            f"[{index}:a]atrim=start={segment.start}:end={end},"
+            f"asetpts=PTS-STARTPTS,{layout},volume={segment.volume}[a{index}]"
+        )
+    
+    def build_command(
+        self,
+        segments: List[PipelineSegment],
+        output_path: str,
+        background_music: BackgroundMusic = None,
+        rank_style: OverlayStyle = None,
+        caption_style: OverlayStyle = None
+    ) -> Optional[List[str]]:
+        """
+        Build the full FFmpeg command line.
+        
+        Returns None if no segment could be probed.
+        """
+        rank_style = rank_style or OverlayStyle(font_size=120, border_width=3)
+        caption_style = caption_style or OverlayStyle(font="Arial")
+        
+        probed = []
+        for segment in segments:
+            probe = self._probe(segment)
+            if probe is None:
+                logger.warning("Skipping unreadable clip", path=segment.path)
+                continue
+            probed.append((segment, *probe))
+        
+        if not probed:
+            return None
+        
+        cmd = [self.ffmpeg_binary, "-y", "-hide_banner", "-loglevel", "error"]
+        for segment, _, _ in probed:
+            cmd += ["-i", segment.path]
+        
+        chains = []
+        concat_inputs = ""
+        total_duration = 0.0
+        next_input = len(probed)
+        
+        for i, (segment, duration, has_audio) in enumerate(probed):
+            overlays = []
+            
+            if segment.rank is not None:
+                sprite = self._render_sprite(f"#{segment.rank}", rank_style)
+                if sprite:
+                    overlays.append((sprite, "30", "30", rank_style.fade_in))
+            
+            if segment.caption:
+                sprite = self._render_sprite(
+                    segment.caption, caption_style, max_width=self.width - 80
+                )
+                if sprite:
+                    overlays.append((
+                        sprite, "(main_w-overlay_w)/2", "main_h-overlay_h-50", 0.0
+                    ))
+            
+            # Each sprite is a looped still image input
+            indexed_overlays = []
+            for sprite, x, y, fade_in in overlays:
+                cmd += ["-loop", "1", "-framerate", str(self.fps), "-i", sprite]
+                indexed_overlays.append((next_input, x, y, fade_in))
+                next_input += 1
+            
+            chains.extend(self._video_chain(i, segment, duration, indexed_overlays))
+            chains.append(self._audio_chain(i, segment, duration, has_audio))
+            concat_inputs += f"[v{i}][a{i}]"
+            total_duration += duration
+        
+        audio_label = "outa" if background_music is None else "cata"
+        chains.append(
+            f"{concat_inputs}concat=n={len(probed)}:v=1:a=1[outv][{audio_label}]"
+        )
+        
+        if background_music is not None:
+            music_index = next_input
+            cmd += ["-stream_loop", "-1", "-i", background_music.path]
+            
+            music_filters = [
+                f"atrim=duration={total_duration}",
+                "asetpts=PTS-STARTPTS",
+                f"aformat=sample_rates={self.SAMPLE_RATE}:channel_layouts=stereo",
+                f"volume={background_music.volume}",
+            ]
+            if background_music.fade_in > 0:
+                music_filters.append(f"afade=t=in:st=0:d={background_music.fade_in}")
+            if background_music.fade_out > 0:
+                fade_start = max(total_duration - background_music.fade_out, 0)
+                music_filters.append(
+                    f"afade=t=out:st={fade_start}:d={background_music.fade_out}"
+                )
+            
+            chains.append(f"[{music_index}:a]" + ",".join(music_filters) + "[bgm]")
+            chains.append("[cata][bgm]amix=inputs=2:duration=first:normalize=0[outa]")
+        
+        cmd += [
+            "-filter_complex", ";".join(chains),
+            "-map", "[outv]",
+            "-map", "[outa]",
+            *self._video_codec_args(),
+            "-r", str(self.fps),
+            "-threads", "0",
+            "-c:a", self.audio_codec,
+            "-movflags", "+faststart",
+            output_path
+        ]
+        
+        return cmd
+    
+    def render(
+        self,
+        segments: List[PipelineSegment],
+        output_path: str,
+        background_music: BackgroundMusic = None,
+        rank_style: OverlayStyle = None,
+        caption_style: OverlayStyle = None
+    ) -> Optional[str]:
+        """
+        Render segments to output_path.
+        
+        Returns the output path, or None if rendering failed.
+        """
+        cmd = self.build_command(
+            segments,
+            output_path,
+            background_music=background_music,
+            rank_style=rank_style,
+            caption_style=caption_style
+        )
+        if cmd is None:
+            logger.error("No renderable clips for FFmpeg pipeline")
+            return None
+        
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                preexec_fn=self._pin_cpus if self.cpu_affinity else None
+            )
+            
+            if result.returncode != 0:
+                logger.error("FFmpeg render failed", error=result.stderr[-2000:])
+                return None
+            
+            return output_path
+        
+        except Exception as e:
+            logger.error("Failed to run FFmpeg pipeline", error=str(e))
+            return None
@@ -0,0 +1,21 @@
+"""Numba-compiled per-frame kernels (optional, requires numba)."""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def vignette_apply(frame, mask, out):
+    """Scale every pixel by its mask value, writing into out."""
+    rows, cols, channels = frame.shape
+    for y in prange(rows):
+        for x in range(cols):
+            m = mask[y, x]
+            for c in range(channels):
+                out[y, x, c] = np.uint8(frame[y, x, c] * m)
+
+
+def warm_up():
+    """Trigger compilation (or cache load) for the common uint8 frame layout."""
+    frame = np.zeros((1, 1, 3), dtype=np.uint8)
+    vignette_apply(frame, np.ones((1, 1), dtype=np.float32), np.empty_like(frame))
@@ -1,11 +1,18 @@
 """Text rendering utilities for video overlays."""
 
-from typing import Tuple, Optional, Dict, Any, List
+from typing import Tuple, Optional, Dict, Any, List, Sequence
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from enum import Enum
+from functools import lru_cache
+import hashlib
+import os
+import tempfile
 import structlog
 
+from app.utils.video_utils import temp_output_path
+
 logger = structlog.get_logger()
 
 
@@ -45,6 +52,69 @@ class TextConfig:
     background_padding: int = 10
 
 
+@lru_cache(maxsize=64)
+def _load_font(font_name: str, size: int):
+    """Load a font, with fallbacks. Cached per (font_name, size)."""
+    from PIL import ImageFont
+    
+    # Try exact font name
+    fonts_to_try = [font_name] + TextRenderer.FALLBACK_FONTS
+    
+    for font in fonts_to_try:
+        try:
+            # Try as path first
+            if Path(font).exists():
+                return ImageFont.truetype(font, size)
+            
+            # Try as system font
+            return ImageFont.truetype(font, size)
+        except Exception:
+            continue
+    
+    # Fall back to default
+    return ImageFont.load_default()
+
+
+class SlideUpPosition:
+    """Position callable sliding a clip up 100px into place over `duration`."""
+    __slots__ = ("duration", "origin")
+    
+    def __init__(self, duration: float, origin: Tuple):
+        self.duration = duration
+        self.origin = origin
+    
+    def __call__(self, t):
+        if t >= self.duration:
+            return self.origin
+        offset = (1 - t / self.duration) * 100
+        if isinstance(self.origin[1], str):
+            return (self.origin[0], ("center", offset))
+        return (self.origin[0], self.origin[1] + offset)
+
+
+class ScaleIn:
+    """Resize callable growing a clip from 10% to full size over `duration`."""
+    __slots__ = ("duration",)
+    
+    def __init__(self, duration: float):
+        self.duration = duration
+    
+    def __call__(self, t):
+        return 0.1 + 0.9 * min(t / self.duration, 1.0)
+
+
+@lru_cache(maxsize=128)
+def _slide_up(duration: float, origin: Tuple) -> SlideUpPosition:
+    """Shared SlideUpPosition per (duration, origin)."""
+    return SlideUpPosition(duration, origin)
+
+
+@lru_cache(maxsize=32)
+def _scale_in(duration: float) -> ScaleIn:
+    """Shared ScaleIn per duration."""
+    return ScaleIn(duration)
+
+
 class TextRenderer:
     """
     Advanced text rendering for video overlays.
@@ -60,9 +130,22 @@ class TextRenderer:
     # Common fonts that should be available
     FALLBACK_FONTS = ["Arial", "Helvetica", "DejaVu Sans", "Liberation Sans"]
     
+    # Wrap width for long "caption" text (output width minus margins)
+    CAPTION_MAX_WIDTH = 1000
+    
+    # Upper bound on threads used to build independent text clips
+    MAX_CLIP_WORKERS = 8
+    
+    # Rendered text PNGs by content key, shared across instances
+    _render_cache: Dict[str, str] = {}
+    
     def __init__(self):
         self._moviepy = None
         self._pillow = None
+        self._skia = None
+        
+        # Rasterized TextClips keyed by everything that affects pixels
+        self._clip_cache: Dict[tuple, Any] = {}
     
     @property
     def moviepy(self):
@@ -78,39 +161,113 @@ class TextRenderer:
             self._pillow = {"Image": Image, "ImageDraw": ImageDraw, "ImageFont": ImageFont}
         return self._pillow
     
+    @property
+    def skia(self):
+        """Lazy import skia-python (None if it is not installed)."""
+        if self._skia is None:
+            try:
+                import skia
+                self._skia = skia
+            except ImportError:
+                self._skia = False
+        return self._skia or None
+    
     def _find_font(self, font_name: str, size: int):
         """Find a working font, with fallbacks."""
-        ImageFont = self.pillow["ImageFont"]
+        return _load_font(font_name, size)
+    
+    def _render_text_rgba(
+        self,
+        text: str,
+        font: str,
+        size: int,
+        color: str,
+        stroke_color: Optional[str],
+        stroke_width: int,
+        max_width: Optional[int] = None,
+        align: str = "center"
+    ):
+        """Rasterize text with Pillow into a tightly cropped RGBA image."""
+        Image = self.pillow["Image"]
+        ImageDraw = self.pillow["ImageDraw"]
         
-        # Try exact font name
-        fonts_to_try = [font_name] + self.FALLBACK_FONTS
+        font_obj = self._find_font(font, size)
+        lines = (
+            self._wrap_text(text, font_obj, max_width, stroke_width)
+            if max_width else [text]
+        )
+        joined = "\n".join(lines)
         
-        for font in fonts_to_try:
-            try:
-                # Try as path first
-                if Path(font).exists():
-                    return ImageFont.truetype(font, size)
-                
-                # Try as system font
-                return ImageFont.truetype(font, size)
-            except Exception:
-                continue
+        # Measure, then draw into an exactly sized transparent canvas
+        measure = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+        bbox = measure.multiline_textbbox(
+            (0, 0), joined, font=font_obj, stroke_width=stroke_width, align=align
+        )
+        width = max(bbox[2] - bbox[0], 1)
+        height = max(bbox[3] - bbox[1], 1)
+        
+        img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        draw.multiline_text(
+            (-bbox[0], -bbox[1]),
+            joined,
+            font=font_obj,
+            fill=color,
+            stroke_width=stroke_width,
+            stroke_fill=stroke_color,
+            align=align
+        )
         
-        # Fall back to default
-        return ImageFont.load_default()
+        return img
+    
+    def _text_clip(
+        self,
+        text: str,
+        font: str,
+        size: int,
+        color: str,
+        stroke_color: Optional[str],
+        stroke_width: int,
+        align: str = "center",
+        method: str = "label"
+    ):
+        """
+        Return a text ImageClip, rasterizing each distinct text/style once.
+        
+        Text is drawn in-process with Pillow rather than by spawning
+        ImageMagick through MoviePy's TextClip.
+        """
+        import numpy as np
+        
+        key = (text, font, size, color, stroke_color, stroke_width, align, method)
+        cached = self._clip_cache.get(key)
+        
+        if cached is None:
+            img = self._render_text_rgba(
+                text,
+                font,
+                size,
+                color,
+                stroke_color,
+                stroke_width,
+                max_width=self.CAPTION_MAX_WIDTH if method == "caption" else None,
+                align=align
+            )
+            cached = self.moviepy.ImageClip(np.array(img), transparent=True)
+            self._clip_cache[key] = cached
+        
+        return cached.copy()
     
     def create_text_clip(self, config: TextConfig):
         """Create a MoviePy text clip with styling."""
-        mpy = self.moviepy
-        
         try:
-            txt_clip = mpy.TextClip(
+            txt_clip = self._text_clip(
                 config.text,
-                fontsize=config.size,
-                color=config.color,
-                font=config.font,
-                stroke_color=config.stroke_color,
-                stroke_width=config.stroke_width,
+                config.font,
+                config.size,
+                config.color,
+                config.stroke_color,
+                config.stroke_width,
                 align=config.align,
                 method="caption" if len(config.text) > 50 else "label"
             )
@@ -119,11 +276,18 @@ class TextRenderer:
             txt_clip = txt_clip.set_start(config.start_time)
             txt_clip = txt_clip.set_duration(config.duration)
             
+            # Fades too short to see, or that would overlap on a short clip,
+            # only cost a mask clip per segment, so skip them
+            animate = (
+                config.animation_duration > 0.02
+                and config.duration >= 2 * config.animation_duration
+            )
+            
             # Apply animations
-            if config.animation_in != AnimationType.NONE:
+            if animate and config.animation_in != AnimationType.NONE:
                 txt_clip = self._apply_animation_in(txt_clip, config)
             
-            if config.animation_out != AnimationType.NONE:
+            if animate and config.animation_out != AnimationType.NONE:
                 txt_clip = self._apply_animation_out(txt_clip, config)
             
             return txt_clip
@@ -141,37 +305,19 @@ class TextRenderer:
         
         if config.animation_in == AnimationType.SLIDE_UP:
             # Start from below
-            original_pos = config.position
-            
-            def position_func(t):
-                if t < duration:
-                    progress = t / duration
-                    offset = (1 - progress) * 100
-                    if isinstance(original_pos[1], str):
-                        return (original_pos[0], ("center", offset))
-                    return (original_pos[0], original_pos[1] + offset)
-                return original_pos
-            
-            return clip.set_position(position_func)
+            return clip.set_position(_slide_up(duration, tuple(config.position)))
         
         if config.animation_in == AnimationType.SCALE_IN:
-            def resize_func(t):
-                if t < duration:
-                    return 0.1 + 0.9 * (t / duration)
-                return 1.0
-            
-            return clip.resize(resize_func)
+            return clip.resize(_scale_in(duration))
         
         return clip.crossfadein(duration)
     
     def _apply_animation_out(self, clip, config: TextConfig):
-        """Apply exit animation."""
-        duration = config.animation_duration
+        """Apply exit animation (every exit style is currently a fade out)."""
+        if config.animation_out == AnimationType.NONE:
+            return clip
         
-        if config.animation_out == AnimationType.FADE_IN:  # Fade out
-            return clip.crossfadeout(duration)
-        
-        return clip.crossfadeout(duration)
+        return clip.crossfadeout(config.animation_duration)
     
     def create_animated_counter(
         self,
@@ -181,8 +327,6 @@ class TextRenderer:
         style: dict = None
     ) -> List:
         """Create animated counting number clips."""
-        mpy = self.moviepy
-        
         style = style or {
             "font": "Impact",
             "size": 120,
@@ -193,19 +337,20 @@ class TextRenderer:
         
         clips = []
         step = 1 if end_num > start_num else -1
-        numbers = list(range(start_num, end_num + step, step))
+        numbers = range(start_num, end_num + step, step)  # len() is O(1), no list needed
         time_per_number = duration / len(numbers)
         
-        for i, num in enumerate(numbers):
-            clip = mpy.TextClip(
+        def _number_clip(num: int):
+            return self._text_clip(
                 str(num),
-                fontsize=style["size"],
-                color=style["color"],
-                font=style["font"],
-                stroke_color=style["stroke_color"],
-                stroke_width=style["stroke_width"]
+                style["font"],
+                style["size"],
+                style["color"],
+                style["stroke_color"],
+                style["stroke_width"]
             )
-            
+        
+        for i, clip in enumerate(self._map_clips(_number_clip, numbers)):
             clip = clip.set_position("center")
             clip = clip.set_start(i * time_per_number)
             clip = clip.set_duration(time_per_number)
@@ -237,11 +382,8 @@ class TextRenderer:
         clips.append(bar)
         
         # Name
-        name_clip = mpy.TextClip(
-            name,
-            fontsize=36,
-            color="white",
-            font="Arial Bold"
+        name_clip = self._text_clip(
+            name, "Arial Bold", 36, "white", None, 0
         ).set_duration(duration)
         
         name_clip = name_clip.set_position((20, 10))
@@ -249,10 +391,8 @@ class TextRenderer:
         
         # Title
         if title:
-            title_clip = mpy.TextClip(
-                title,
-                fontsize=24,
-                color="gray"
+            title_clip = self._text_clip(
+                title, "Arial", 24, "gray", None, 0
             ).set_duration(duration)
             
             title_clip = title_clip.set_position((20, 55))
@@ -281,10 +421,8 @@ class TextRenderer:
             "position": ("center", 0.85)  # Relative position
         }
         
-        clips = []
-        
-        for caption in captions:
-            config = TextConfig(
+        configs = [
+            TextConfig(
                 text=caption["text"],
                 font=style["font"],
                 size=style["size"],
@@ -297,12 +435,20 @@ class TextRenderer:
                 animation_out=AnimationType.FADE_IN,
                 animation_duration=0.15
             )
-            
-            clip = self.create_text_clip(config)
-            if clip:
-                clips.append(clip)
+            for caption in captions
+        ]
         
-        return clips
+        clips = self._map_clips(self.create_text_clip, configs)
+        
+        return [clip for clip in clips if clip]
+    
+    def _map_clips(self, build, items: Sequence) -> List:
+        """Build clips for independent items on a small thread pool, keeping order."""
+        if len(items) < 2:
+            return [build(item) for item in items]
+        
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CLIP_WORKERS, len(items))) as pool:
+            return list(pool.map(build, items))
     
     def render_text_image(
         self,
@@ -311,23 +457,59 @@ class TextRenderer:
         height: int = 200,
         style: dict = None
     ) -> str:
-        """Render text to a PNG image file."""
-        Image = self.pillow["Image"]
-        ImageDraw = self.pillow["ImageDraw"]
+        """
+        Render text to a PNG image file.
         
+        Files are named by a stable hash of the text, size and style, so
+        identical text is rasterized once and reused across processes.
+        """
         style = style or {}
         
+        key = hashlib.blake2b(
+            repr((text, width, height, sorted(style.items()))).encode(),
+            digest_size=16
+        ).hexdigest()
+        
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        output_path = str(Path(tempfile.gettempdir()) / f"text_{key}.png")
+        if Path(output_path).exists():
+            self._render_cache[key] = output_path
+            return output_path
+        
+        # Rendered beside the cache path and moved into place when complete
+        tmp_path = temp_output_path(output_path)
+        
+        if self.skia is not None:
+            try:
+                self._render_text_image_skia(text, width, height, style, str(tmp_path))
+                os.replace(tmp_path, output_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+            self._render_cache[key] = output_path
+            return output_path
+        
+        Image = self.pillow["Image"]
+        ImageDraw = self.pillow["ImageDraw"]
+        
         # Create image
         img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
         
         font = self._find_font(
             style.get("font", "Arial"),
             style.get("size", 48)
         )
         
+        # Rasterize the glyphs once into a coverage mask; shadow and fill are
+        # both pasted through it, so the shadow doesn't re-render the text
+        pad = 4
+        bbox = font.getbbox(text)
+        mask = Image.new('L', (bbox[2] + 2 * pad, bbox[3] + 2 * pad), 0)
+        ImageDraw.Draw(mask).text((pad, pad), text, font=font, fill=255)
+        
         # Calculate text position
-        bbox = draw.textbbox((0, 0), text, font=font)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
         
@@ -338,14 +520,118 @@ class TextRenderer:
         if style.get("shadow", True):
             shadow_color = style.get("shadow_color", "black")
             offset = style.get("shadow_offset", (2, 2))
-            draw.text((x + offset[0], y + offset[1]), text, font=font, fill=shadow_color)
+            img.paste(shadow_color, (x + offset[0] - pad, y + offset[1] - pad), mask)
         
         # Draw text
         color = style.get("color", "white")
-        draw.text((x, y), text, font=font, fill=color)
+        img.paste(color, (x - pad, y - pad), mask)
         
         # Save
-        output_path = f"/tmp/text_{hash(text)}.png"
-        img.save(output_path)
+        try:
+            img.save(tmp_path)
+            os.replace(tmp_path, output_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        self._render_cache[key] = output_path
         
         return output_path
+    
+    def _render_text_image_skia(
+        self,
+        text: str,
+        width: int,
+        height: int,
+        style: dict,
+        output_path: str
+    ):
+        """Draw centered text with an optional drop shadow using Skia."""
+        from PIL import ImageColor
+        
+        skia = self.skia
+        
+        def paint(color: str):
+            return skia.Paint(AntiAlias=True, Color=skia.Color(*ImageColor.getrgb(color)))
+        
+        font = skia.Font(skia.Typeface(style.get("font", "Arial")), style.get("size", 48))
+        metrics = font.getMetrics()
+        
+        # Center horizontally on advance width, vertically on ascent+descent
+        x = (width - font.measureText(text)) / 2
+        y = (height - (metrics.fDescent - metrics.fAscent)) / 2 - metrics.fAscent
+        
+        surface = skia.Surface(width, height)
+        with surface as canvas:
+            canvas.clear(skia.ColorTRANSPARENT)
+            
+            if style.get("shadow", True):
+                offset = style.get("shadow_offset", (2, 2))
+                canvas.drawString(
+                    text, x + offset[0], y + offset[1], font,
+                    paint(style.get("shadow_color", "black"))
+                )
+            
+            canvas.drawString(text, x, y, font, paint(style.get("color", "white")))
+        
+        surface.makeImageSnapshot().save(output_path, skia.kPNG)
+    
+    def _wrap_text(self, text: str, font, max_width: int, stroke_width: int = 0) -> List[str]:
+        """Greedily wrap words so each line fits within max_width pixels."""
+        ImageDraw = self.pillow["ImageDraw"]
+        Image = self.pillow["Image"]
+        draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+        
+        lines = []
+        current = ""
+        for word in text.split():
+            candidate = f"{current} {word}".strip()
+            width = draw.textlength(candidate, font=font) + 2 * stroke_width
+            if current and width > max_width:
+                lines.append(current)
+                current = word
+            else:
+                current = candidate
+        
+        if current:
+            lines.append(current)
+        
+        return lines
+    
+    def render_sprite(
+        self,
+        text: str,
+        font: str = "Impact",
+        size: int = 48,
+        color: str = "white",
+        stroke_color: str = "black",
+        stroke_width: int = 2,
+        max_width: Optional[int] = None,
+        output_dir: Optional[str] = None
+    ) -> str:
+        """
+        Render text to a tightly cropped RGBA PNG for compositing.
+        
+        Sprites are cached by content, so each rank label or caption is
+        drawn once and reused across clips and renders.
+        """
+        key = hashlib.blake2b(
+            repr((text, font, size, color, stroke_color, stroke_width, max_width)).encode(),
+            digest_size=8
+        ).hexdigest()
+        output_path = Path(output_dir or tempfile.gettempdir()) / f"sprite_{key}.png"
+        
+        if output_path.exists():
+            return str(output_path)
+        
+        img = self._render_text_rgba(
+            text, font, size, color, stroke_color, stroke_width, max_width=max_width
+        )
+        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = temp_output_path(output_path)
+        try:
+            img.save(tmp_path)
+            os.replace(tmp_path, output_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        
+        return str(output_path)
@@ -0,0 +1,20 @@
+"""Vectorized scoring kernels for content selection."""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain NumPy
+    njit = None
+
+
+def _composite_scores(trending, quality, relevance, tw, qw, rw):
+    """Weighted composite score for whole columns of candidate scores."""
+    # Trending is 0-100, quality and relevance are already 0-1
+    norm = np.where(trending > 1.0, trending / 100.0, trending)
+    return norm * tw + quality * qw + relevance * rw
+
+
+composite_scores = (
+    njit(cache=True, fastmath=True)(_composite_scores) if njit else _composite_scores
+)
@@ -1,13 +1,17 @@
 """Content selector for ranking and filtering analyzed videos."""
 
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from sqlalchemy import select, text, and_
+from sqlalchemy import select, text, and_, bindparam, Float, Integer
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+import numpy as np
 import structlog
 
 from app.core.database import async_session_maker
+from app.core.scoring import composite_scores
+from app.models.platform import PlatformType
 from app.models.platform_content import PlatformContent
 from app.models.video_analysis import VideoAnalysis
 from app.models.downloaded_video import DownloadedVideo
@@ -15,7 +19,102 @@ from app.models.downloaded_video import DownloadedVideo
 logger = structlog.get_logger()
 
 
-@dataclass
+# Statements are built once at import and reused for every call
+_JOB_ID = bindparam("job_id", type_=UUID(as_uuid=False))
+
+_SELECT_TOP_CLIPS = text("""
+    WITH scored AS (
+        SELECT 
+            pc.content_id,
+            pc.url,
+            pc.title,
+            pc.author,
+            pc.platform_id AS platform,
+            pc.trending_score,
+            va.quality_score,
+            va.relevance_score,
+            COALESCE(va.visual_analysis->>'caption_suggestion', '') AS caption_suggestion,
+            COALESCE(va.visual_analysis->>'description_suggestion', '') AS description_suggestion,
+            dv.local_path,
+            dv.duration_seconds,
+            (pc.trending_score / 100.0 * :tw + va.quality_score * :qw + va.relevance_score * :rw) AS composite,
+            ROW_NUMBER() OVER (
+                PARTITION BY pc.author
+                ORDER BY (pc.trending_score / 100.0 * :tw + va.quality_score * :qw + va.relevance_score * :rw) DESC
+            ) AS author_rn
+        FROM platform_content pc
+        INNER JOIN video_analysis va ON pc.content_id = va.content_id
+        -- Content can have several download rows; use the newest usable one
+        CROSS JOIN LATERAL (
+            SELECT d.local_path, d.duration_seconds
+            FROM downloaded_videos d
+            WHERE d.content_id = pc.content_id
+            AND d.local_path IS NOT NULL
+            AND d.duration_seconds BETWEEN :dmin AND :dmax
+            ORDER BY d.downloaded_at DESC
+            LIMIT 1
+        ) dv
+        WHERE pc.job_id = :job_id
+        AND va.recommended = true
+    )
+    SELECT
+        content_id, url, title, author, platform,
+        trending_score, quality_score, relevance_score,
+        caption_suggestion, description_suggestion, local_path, duration_seconds
+    FROM scored
+    WHERE author_rn <= :mpa
+    ORDER BY composite DESC
+    LIMIT :limit
+""").bindparams(
+    _JOB_ID,
+    bindparam("tw", type_=Float),
+    bindparam("qw", type_=Float),
+    bindparam("rw", type_=Float),
+    bindparam("dmin", type_=Float),
+    bindparam("dmax", type_=Float),
+    bindparam("mpa", type_=Integer),
+    bindparam("limit", type_=Integer)
+).columns(platform=PlatformType)
+
+# One row per content: video_analysis is unique on content_id, and
+# downloads are tested with EXISTS so duplicate download rows can't fan
+# out the counts and averages
+_SELECTION_SUMMARY = text("""
+    SELECT 
+        COUNT(va.content_id) AS total,
+        COUNT(*) FILTER (WHERE va.recommended) AS recommended,
+        COUNT(*) FILTER (
+            WHERE EXISTS (
+                SELECT 1 FROM downloaded_videos dv WHERE dv.content_id = pc.content_id
+            )
+        ) AS downloaded,
+        AVG(va.quality_score) FILTER (WHERE va.recommended) AS avg_quality,
+        AVG(va.relevance_score) FILTER (WHERE va.recommended) AS avg_relevance,
+        AVG(pc.trending_score) FILTER (WHERE va.recommended) AS avg_trending
+    FROM platform_content pc
+    LEFT JOIN video_analysis va ON pc.content_id = va.content_id
+    WHERE pc.job_id = :job_id
+""").bindparams(_JOB_ID)
+
+# Only the fields the rejection summary needs are extracted from the
+# visual_analysis JSONB, so the full document is never shipped or parsed
+_REJECTION_REASONS = text("""
+    SELECT 
+        pc.content_id,
+        COALESCE(LEFT(pc.title, 50), '') AS title,
+        pc.url,
+        COALESCE(va.visual_analysis->'rejection_reasons', '[]'::jsonb) AS reasons,
+        COALESCE((va.visual_analysis->>'has_watermark')::boolean, false) AS has_watermark,
+        COALESCE((va.visual_analysis->>'is_safe_content')::boolean, false) AS is_safe,
+        COALESCE((va.visual_analysis->>'visual_quality_score')::float, 10) AS visual_quality
+    FROM platform_content pc
+    INNER JOIN video_analysis va ON pc.content_id = va.content_id
+    WHERE pc.job_id = :job_id AND va.recommended = false
+    LIMIT 50
+""").bindparams(_JOB_ID)
+
+
+@dataclass(slots=True)
 class RankedClip:
     """A clip selected for the final compilation."""
     content_id: str
@@ -40,25 +139,10 @@ class RankedClip:
     platform: str = ""
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "content_id": self.content_id,
-            "rank": self.rank,
-            "url": self.url,
-            "local_path": self.local_path,
-            "title": self.title,
-            "author": self.author,
-            "trending_score": self.trending_score,
-            "quality_score": self.quality_score,
-            "relevance_score": self.relevance_score,
-            "composite_score": self.composite_score,
-            "caption_suggestion": self.caption_suggestion,
-            "description_suggestion": self.description_suggestion,
-            "duration_seconds": self.duration_seconds,
-            "platform": self.platform
-        }
+        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectionConfig:
     """Configuration for content selection."""
     # Weighting factors for composite score
@@ -108,24 +192,6 @@ class ContentSelector:
         self.config = config or SelectionConfig()
         self.config.validate()
     
-    def _calculate_composite_score(
-        self,
-        trending: float,
-        quality: float,
-        relevance: float
-    ) -> float:
-        """Calculate weighted composite score."""
-        # Normalize trending to 0-1 (it's 0-100)
-        normalized_trending = trending / 100.0 if trending > 1 else trending
-        
-        score = (
-            normalized_trending * self.config.trending_weight +
-            quality * self.config.quality_weight +
-            relevance * self.config.relevance_weight
-        )
-        
-        return round(score, 4)
-    
     async def select_top_clips(
         self,
         job_id: str,
@@ -146,97 +212,62 @@ class ContentSelector:
         limit = limit or self.config.max_clips
         
         async def _select(db: AsyncSession):
-            # Query joining content, analysis, and downloads
-            query = text("""
-                SELECT 
-                    pc.content_id,
-                    pc.url,
-                    pc.title,
-                    pc.author,
-                    pc.platform,
-                    pc.trending_score,
-                    va.quality_score,
-                    va.relevance_score,
-                    va.visual_analysis,
-                    dv.local_path,
-                    dv.duration_seconds
-                FROM platform_content pc
-                INNER JOIN video_analysis va ON pc.content_id = va.content_id
-                INNER JOIN downloaded_videos dv ON pc.content_id = dv.content_id
-                WHERE pc.job_id = :job_id
-                AND va.recommended = true
-                AND dv.local_path IS NOT NULL
-                ORDER BY 
-                    (pc.trending_score / 100.0 * :tw + va.quality_score * :qw + va.relevance_score * :rw) DESC
-            """)
-            
-            result = await db.execute(
-                query,
+            # Score, per-author cap, duration bounds and limit are all applied
+            # server-side so only the final top-N rows cross the wire. The
+            # server-side cursor delivers them in yield_per batches
+            stream = await db.stream(
+                _SELECT_TOP_CLIPS,
                 {
                     "job_id": job_id,
                     "tw": self.config.trending_weight,
                     "qw": self.config.quality_weight,
-                    "rw": self.config.relevance_weight
-                }
+                    "rw": self.config.relevance_weight,
+                    "dmin": self.config.min_duration_seconds,
+                    "dmax": self.config.max_duration_seconds,
+                    "mpa": self.config.max_per_author,
+                    "limit": limit
+                },
+                execution_options={"yield_per": 100}
             )
             
-            rows = result.mappings().all()
-            
-            # Apply additional filters and diversity rules
             selected = []
-            author_counts = {}
             platform_counts = {}
             
-            for row in rows:
-                # Check author limit
-                author = row.get("author", "unknown")
-                if author_counts.get(author, 0) >= self.config.max_per_author:
-                    continue
-                
-                # Check duration
-                duration = row.get("duration_seconds", 0) or 0
-                if duration < self.config.min_duration_seconds:
-                    continue
-                if duration > self.config.max_duration_seconds:
-                    continue
-                
-                # Calculate composite score
-                composite = self._calculate_composite_score(
-                    row.get("trending_score", 0),
-                    row.get("quality_score", 0),
-                    row.get("relevance_score", 0)
+            async for rows in stream.partitions():
+                # Score each batch in one vectorized pass
+                scores = composite_scores(
+                    np.fromiter((row[5] or 0.0 for row in rows), np.float64, len(rows)),
+                    np.fromiter((row[6] or 0.0 for row in rows), np.float64, len(rows)),
+                    np.fromiter((row[7] or 0.0 for row in rows), np.float64, len(rows)),
+                    self.config.trending_weight,
+                    self.config.quality_weight,
+                    self.config.relevance_weight
                 )
                 
-                # Extract AI suggestions
-                visual_analysis = row.get("visual_analysis") or {}
-                caption = visual_analysis.get("caption_suggestion", "")
-                description = visual_analysis.get("description_suggestion", "")
-                
-                clip = RankedClip(
-                    content_id=str(row["content_id"]),
-                    rank=len(selected) + 1,
-                    url=row["url"],
-                    local_path=row["local_path"],
-                    title=row.get("title", ""),
-                    author=author,
-                    trending_score=row.get("trending_score", 0),
-                    quality_score=row.get("quality_score", 0),
-                    relevance_score=row.get("relevance_score", 0),
-                    composite_score=composite,
-                    caption_suggestion=caption,
-                    description_suggestion=description,
-                    duration_seconds=duration,
-                    platform=row.get("platform", "")
-                )
-                
-                selected.append(clip)
-                author_counts[author] = author_counts.get(author, 0) + 1
-                
-                platform = row.get("platform", "unknown")
-                platform_counts[platform] = platform_counts.get(platform, 0) + 1
-                
-                if len(selected) >= limit:
-                    break
+                for (
+                    content_id, url, title, author, platform,
+                    trending, quality, relevance,
+                    caption, description, local_path, duration
+                ), score in zip(rows, scores):
+                    clip = RankedClip(
+                        content_id=str(content_id),
+                        rank=len(selected) + 1,
+                        url=url,
+                        local_path=local_path,
+                        title=title,
+                        author=author,
+                        trending_score=trending,
+                        quality_score=quality,
+                        relevance_score=relevance,
+                        composite_score=round(float(score), 4),
+                        caption_suggestion=caption,
+                        description_suggestion=description,
+                        duration_seconds=duration or 0,
+                        platform=platform
+                    )
+                    
+                    selected.append(clip)
+                    platform_counts[platform] = platform_counts.get(platform, 0) + 1
             
             logger.info(
                 f"Selected {len(selected)} clips for job",
@@ -255,56 +286,16 @@ class ContentSelector:
     async def get_selection_summary(self, job_id: str) -> Dict[str, Any]:
         """Get summary statistics for content selection."""
         async with async_session_maker() as db:
-            # Count total analyzed
-            total_result = await db.execute(
-                text("""
-                    SELECT COUNT(*) as total
-                    FROM platform_content pc
-                    INNER JOIN video_analysis va ON pc.content_id = va.content_id
-                    WHERE pc.job_id = :job_id
-                """),
-                {"job_id": job_id}
-            )
-            total = total_result.scalar() or 0
-            
-            # Count recommended
-            recommended_result = await db.execute(
-                text("""
-                    SELECT COUNT(*) as recommended
-                    FROM platform_content pc
-                    INNER JOIN video_analysis va ON pc.content_id = va.content_id
-                    WHERE pc.job_id = :job_id AND va.recommended = true
-                """),
-                {"job_id": job_id}
-            )
-            recommended = recommended_result.scalar() or 0
-            
-            # Count downloaded
-            downloaded_result = await db.execute(
-                text("""
-                    SELECT COUNT(*) as downloaded
-                    FROM platform_content pc
-                    INNER JOIN downloaded_videos dv ON pc.content_id = dv.content_id
-                    WHERE pc.job_id = :job_id
-                """),
-                {"job_id": job_id}
-            )
-            downloaded = downloaded_result.scalar() or 0
-            
-            # Get score averages
-            score_result = await db.execute(
-                text("""
-                    SELECT 
-                        AVG(va.quality_score) as avg_quality,
-                        AVG(va.relevance_score) as avg_relevance,
-                        AVG(pc.trending_score) as avg_trending
-                    FROM platform_content pc
-                    INNER JOIN video_analysis va ON pc.content_id = va.content_id
-                    WHERE pc.job_id = :job_id AND va.recommended = true
-                """),
+            # All counts and averages come from one join traversal;
+            # analysis is LEFT JOINed so downloads without analysis still count
+            result = await db.execute(
+                _SELECTION_SUMMARY,
                 {"job_id": job_id}
             )
-            scores = score_result.mappings().first() or {}
+            scores = result.mappings().first() or {}
+            total = scores.get("total", 0) or 0
+            recommended = scores.get("recommended", 0) or 0
+            downloaded = scores.get("downloaded", 0) or 0
             
             return {
                 "job_id": job_id,
@@ -321,38 +312,26 @@ class ContentSelector:
         """Get list of rejected videos with reasons."""
         async with async_session_maker() as db:
             result = await db.execute(
-                text("""
-                    SELECT 
-                        pc.content_id,
-                        pc.title,
-                        pc.url,
-                        va.visual_analysis
-                    FROM platform_content pc
-                    INNER JOIN video_analysis va ON pc.content_id = va.content_id
-                    WHERE pc.job_id = :job_id AND va.recommended = false
-                    LIMIT 50
-                """),
+                _REJECTION_REASONS,
                 {"job_id": job_id}
             )
             
             rejections = []
-            for row in result.mappings():
-                analysis = row.get("visual_analysis") or {}
-                reasons = analysis.get("rejection_reasons", [])
-                
+            for content_id, title, url, reasons, has_watermark, is_safe, visual_quality in result:
                 if not reasons:
                     # Infer reasons
-                    if analysis.get("has_watermark"):
+                    reasons = []
+                    if has_watermark:
                         reasons.append("Has watermark")
-                    if not analysis.get("is_safe_content"):
+                    if not is_safe:
                         reasons.append("Content not safe for ads")
-                    if analysis.get("visual_quality_score", 10) < 5:
+                    if visual_quality < 5:
                         reasons.append("Low visual quality")
                 
                 rejections.append({
-                    "content_id": str(row["content_id"]),
-                    "title": row.get("title", "")[:50],
-                    "url": row["url"],
+                    "content_id": str(content_id),
+                    "title": title,
+                    "url": url,
                     "reasons": reasons
                 })
             
@@ -1,6 +1,7 @@
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 import structlog
 from typing import AsyncGenerator
@@ -33,6 +34,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     
     logger.info("Database initialized")
     
+    # Warm the heavy media imports so the first render request doesn't pay
+    # for them. Lifespan runs in every worker process, so each worker
+    # imports them once at startup.
+    try:
+        import moviepy.editor  # noqa: F401
+        from PIL import Image, ImageDraw, ImageFont  # noqa: F401
+        logger.info("Media libraries preloaded")
+    except ImportError as e:
+        logger.warning(f"Media library preload skipped: {e}")
+    
     yield
     
     logger.info("Shutting down API")
@@ -44,7 +55,8 @@ app = FastAPI(
     description="AI-powered YouTube Shorts creation system",
     version="1.0.0",
     lifespan=lifespan,
-    debug=settings.debug
+    debug=settings.debug,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -56,6 +68,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON payloads (selection summaries, rejection lists)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 # Global exception handler
 @app.exception_handler(Exception)
@@ -1,7 +1,9 @@
 """Database models package"""
 
 from app.models.job import Job
-from app.models.platform_content import PlatformContent
+from app.models.job_log import JobLog
+from app.models.platform import Platform
+from app.models.platform_content import PlatformContent, PlatformContentExtra
 from app.models.video_analysis import VideoAnalysis
 from app.models.downloaded_video import DownloadedVideo
 from app.models.output_video import OutputVideo
@@ -9,7 +11,10 @@ from app.models.customization_preset import CustomizationPreset
 
 __all__ = [
     "Job",
+    "JobLog",
+    "Platform",
     "PlatformContent",
+    "PlatformContentExtra",
     "VideoAnalysis",
     "DownloadedVideo",
     "OutputVideo",
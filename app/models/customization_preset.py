@@ -3,9 +3,9 @@
 from sqlalchemy import Column, String, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB, TIMESTAMP
 from sqlalchemy.sql import func
-import uuid
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 
 
 class CustomizationPreset(Base):
@@ -15,7 +15,7 @@ class CustomizationPreset(Base):
     preset_id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4
+        default=uuid7
     )
     user_id = Column(String(255), nullable=False, index=True)
     preset_name = Column(String(255), nullable=False)
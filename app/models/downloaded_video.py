@@ -1,12 +1,12 @@
 """Downloaded video database model"""
 
-from sqlalchemy import Column, String, Text, BigInteger, Integer, Float, ForeignKey, Index
+from sqlalchemy import Column, String, Text, BigInteger, Integer, Float, ForeignKey, Index, CheckConstraint
 from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 
 
 class DownloadedVideo(Base):
@@ -16,13 +16,12 @@ class DownloadedVideo(Base):
     download_id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4
+        default=uuid7
     )
     content_id = Column(
         UUID(as_uuid=True),
         ForeignKey("platform_content.content_id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False  # Served by idx_dv_content_haspath
     )
     local_path = Column(Text, nullable=False)
     s3_path = Column(Text, nullable=True)
@@ -41,7 +40,14 @@ class DownloadedVideo(Base):
     
     # Indexes
     __table_args__ = (
-        Index("idx_download_content", "content_id"),
+        # Unknown durations are stored as NULL, never 0
+        CheckConstraint("duration_seconds > 0", name="ck_duration"),
+        # Covering index for the selector join (also serves plain content_id lookups)
+        Index(
+            "idx_dv_content_haspath",
+            "content_id",
+            postgresql_include=["local_path", "duration_seconds"]
+        ),
     )
     
     def __repr__(self):
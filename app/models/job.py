@@ -1,19 +1,21 @@
 """Job database model"""
 
-from sqlalchemy import Column, String, Text, Enum, Index
+from sqlalchemy import Column, String, Text, Enum as SQLEnum, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB, TIMESTAMP
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 import enum
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 
 
 class JobStatus(str, enum.Enum):
     PENDING = "pending"
     DISCOVERING = "discovering"
+    DISCOVERED = "discovered"
     ANALYZING = "analyzing"
+    ANALYZED = "analyzed"
     DOWNLOADING = "downloading"
     EDITING = "editing"
     COMPLETED = "completed"
@@ -24,6 +26,7 @@ class JobType(str, enum.Enum):
     RANKING = "ranking"
     COMPILATION = "compilation"
     HIGHLIGHTS = "highlights"
+    DISCOVERY = "discovery"
 
 
 class Job(Base):
@@ -33,12 +36,17 @@ class Job(Base):
     job_id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4
+        default=uuid7
+    )
+    user_id = Column(String(255), nullable=False)  # Served by idx_user_status
+    # Native PostgreSQL enums: 4 bytes per row and integer comparisons.
+    # values_callable stores the lowercase values rather than member names
+    job_type = Column(
+        SQLEnum(JobType, name="job_type", values_callable=lambda e: [m.value for m in e]),
+        nullable=False
     )
-    user_id = Column(String(255), nullable=False, index=True)
-    job_type = Column(String(50), nullable=False)
     status = Column(
-        String(50),
+        SQLEnum(JobStatus, name="job_status", values_callable=lambda e: [m.value for m in e]),
         default=JobStatus.PENDING,
         index=True
     )
@@ -54,7 +62,7 @@ class Job(Base):
     )
     completed_at = Column(TIMESTAMP(timezone=True), nullable=True)
     error_message = Column(Text, nullable=True)
-    logs = Column(JSONB, nullable=True, default=list)  # Array of log entries
+    logs = Column(JSONB, nullable=True, default=list)  # Legacy log array; new entries go to job_logs
     
     # Relationships
     platform_content = relationship(
@@ -72,6 +80,10 @@ class Job(Base):
     __table_args__ = (
         Index("idx_user_status", "user_id", "status"),
         Index("idx_created", "created_at"),
+        # Filters extract scalars with ->>, which GIN can't serve; index the
+        # extracted values directly
+        Index("idx_job_niche", text("(config->>'niche')")),
+        Index("idx_job_timeframe_status", text("(config->>'timeframe')"), "status"),
     )
     
     def __repr__(self):
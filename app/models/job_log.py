@@ -0,0 +1,49 @@
+"""Job log entry database model"""
+
+from sqlalchemy import Column, String, Text, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TIMESTAMP
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+from app.utils.ids import uuid7
+
+
+class JobLog(Base):
+    """Job activity log: one row per entry, appended without rewriting the job"""
+    __tablename__ = "job_logs"
+    
+    log_id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid7
+    )
+    job_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("jobs.job_id", ondelete="CASCADE"),
+        nullable=False
+    )
+    ts = Column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    level = Column(String(20), nullable=False)  # 'info', 'warning', 'error', 'success'
+    message = Column(Text, nullable=False)
+    details = Column(JSONB, nullable=True)
+    
+    # Indexes
+    __table_args__ = (
+        Index("idx_job_logs_job_ts", "job_id", "ts"),
+    )
+    
+    def to_dict(self) -> dict:
+        """Entry in the shape of the legacy Job.logs array items."""
+        return {
+            "timestamp": self.ts.isoformat() if self.ts else None,
+            "level": self.level,
+            "message": self.message,
+            "details": self.details or {}
+        }
+    
+    def __repr__(self):
+        return f"<JobLog {self.job_id} [{self.level}]>"
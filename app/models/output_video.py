@@ -4,9 +4,9 @@ from sqlalchemy import Column, String, Text, BigInteger, Float, ForeignKey, Inde
 from sqlalchemy.dialects.postgresql import UUID, JSONB, TIMESTAMP, ARRAY
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 
 
 class OutputVideo(Base):
@@ -16,7 +16,7 @@ class OutputVideo(Base):
     output_id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4
+        default=uuid7
     )
     job_id = Column(
         UUID(as_uuid=True),
@@ -46,6 +46,8 @@ class OutputVideo(Base):
     # Indexes
     __table_args__ = (
         Index("idx_output_job", "job_id"),
+        # Tag lookups use array containment: tags @> ARRAY['gaming']
+        Index("idx_output_tags_gin", "tags", postgresql_using="gin"),
     )
     
     def __repr__(self):
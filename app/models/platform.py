@@ -0,0 +1,76 @@
+"""Platform lookup table and column type"""
+
+from typing import Literal
+from sqlalchemy import Column, SmallInteger, Text, DDL, event
+from sqlalchemy.types import TypeDecorator
+
+from app.core.database import Base
+
+
+# Stable ids for the supported platforms; never renumber an existing entry
+PLATFORMS = ("youtube", "tiktok", "instagram", "snapchat")
+PLATFORM_IDS = {name: platform_id for platform_id, name in enumerate(PLATFORMS, start=1)}
+PLATFORM_NAMES = {platform_id: name for name, platform_id in PLATFORM_IDS.items()}
+
+# Request parameter type accepting exactly the supported platform names
+PlatformName = Literal["youtube", "tiktok", "instagram", "snapchat"]
+
+
+def platform_id(name: str) -> int:
+    """
+    Look up the SMALLINT id of a platform name.
+    
+    Raises:
+        ValueError: If the platform is not supported
+    """
+    try:
+        return PLATFORM_IDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown platform {name!r}; expected one of: {', '.join(PLATFORMS)}"
+        ) from None
+
+
+class PlatformType(TypeDecorator):
+    """
+    Platform name stored as its SMALLINT id.
+    
+    Binds and results stay plain platform names, so queries such as
+    PlatformContent.platform == "youtube" work unchanged.
+    """
+    
+    impl = SmallInteger
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, int):
+            return value
+        return platform_id(value)
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return PLATFORM_NAMES[value]
+
+
+class Platform(Base):
+    """Platform: lookup table referenced by platform_content.platform_id"""
+    __tablename__ = "platforms"
+    
+    platform_id = Column(SmallInteger, primary_key=True, autoincrement=False)
+    name = Column(Text, nullable=False, unique=True)
+    
+    def __repr__(self):
+        return f"<Platform {self.platform_id}:{self.name}>"
+
+
+# Seed the lookup rows whenever create_all builds the table
+event.listen(
+    Platform.__table__,
+    "after_create",
+    DDL(
+        "INSERT INTO platforms (platform_id, name) VALUES "
+        + ", ".join(f"({platform_id}, '{name}')" for name, platform_id in PLATFORM_IDS.items())
+        + " ON CONFLICT DO NOTHING"
+    )
+)
@@ -1,12 +1,18 @@
 """Platform content database model"""
 
-from sqlalchemy import Column, String, Text, BigInteger, Integer, Float, ForeignKey, Index
+from typing import List, Dict, Any
+from sqlalchemy import Column, String, Text, BigInteger, Integer, Float, ForeignKey, Index, text, insert
 from sqlalchemy.dialects.postgresql import UUID, JSONB, TIMESTAMP
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+import orjson
 import uuid
 
 from app.core.database import Base
+from app.utils.ids import uuid7
+from app.models.platform import PlatformType, platform_id
 
 
 class PlatformContent(Base):
@@ -16,27 +22,30 @@ class PlatformContent(Base):
     content_id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4
+        default=uuid7
     )
     job_id = Column(
         UUID(as_uuid=True),
         ForeignKey("jobs.job_id", ondelete="CASCADE"),
-        nullable=True,
-        index=True
+        nullable=True  # Served by idx_job_platform
+    )
+    # SMALLINT id in the platform_id column; leads idx_platform_video
+    platform = Column(
+        "platform_id",
+        PlatformType,
+        ForeignKey("platforms.platform_id"),
+        nullable=False
     )
-    platform = Column(String(50), nullable=False, index=True)
     platform_video_id = Column(String(255), nullable=False)
     url = Column(Text, nullable=False)
     title = Column(Text, nullable=True)
-    description = Column(Text, nullable=True)
     author = Column(String(255), nullable=True)
     views = Column(BigInteger, nullable=True)
     likes = Column(BigInteger, nullable=True)
     comments = Column(BigInteger, nullable=True)
     duration_seconds = Column(Integer, nullable=True)
     upload_date = Column(TIMESTAMP(timezone=True), nullable=True)
-    trending_score = Column(Float, nullable=True, index=True)
-    content_metadata = Column("metadata", JSONB, nullable=True)  # Renamed to avoid SQLAlchemy reserved word conflict
+    trending_score = Column(Float, nullable=True)  # Served by idx_trending_covering
     discovered_at = Column(
         TIMESTAMP(timezone=True),
         server_default=func.now()
@@ -56,13 +65,199 @@ class PlatformContent(Base):
         uselist=False,
         cascade="all, delete-orphan"
     )
+    # Rarely read wide columns live in platform_content_extra; load with
+    # joinedload(PlatformContent.details) before touching them
+    details = relationship(
+        "PlatformContentExtra",
+        uselist=False,
+        cascade="all, delete-orphan"
+    )
+    description = association_proxy(
+        "details", "description",
+        creator=lambda description: PlatformContentExtra(description=description)
+    )
+    extra = association_proxy(
+        "details", "extra",
+        creator=lambda extra: PlatformContentExtra(extra=extra)
+    )
     
     # Indexes and constraints
     __table_args__ = (
         Index("idx_job_platform", "job_id", "platform"),
-        Index("idx_trending_score", "trending_score"),
+        # Trending lists only rank scored rows, highest first; INCLUDE carries
+        # every TrendingContentResponse column for index-only scans
+        Index(
+            "idx_trending_covering",
+            trending_score.desc(),
+            postgresql_where=text("trending_score IS NOT NULL"),
+            postgresql_include=[
+                "content_id", "platform", "url", "title",
+                "author", "views", "likes", "discovered_at"
+            ]
+        ),
+        # discovered_at follows insertion order, so a BRIN index stays tiny
+        Index("idx_discovered_at_brin", "discovered_at", postgresql_using="brin"),
         Index("idx_platform_video", "platform", "platform_video_id", unique=True),
+        # Covering index for the selector's per-job top-N scan
+        Index(
+            "idx_pc_job_trending",
+            job_id,
+            trending_score.desc(),
+            postgresql_include=["content_id", "url", "title", "author", "platform"]
+        ),
     )
     
     def __repr__(self):
         return f"<PlatformContent {self.platform}:{self.platform_video_id}>"
+
+
+class PlatformContentExtra(Base):
+    """Platform content extra: Cold description/metadata, one row per content"""
+    __tablename__ = "platform_content_extra"
+    
+    content_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("platform_content.content_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    description = Column(Text, nullable=True)
+    extra = Column("metadata", JSONB, nullable=True)  # DB column stays "metadata"; the attribute can't shadow Base.metadata
+    
+    __table_args__ = (
+        # Containment (@>) lookups on metadata; jsonb_path_ops is smaller than jsonb_ops
+        Index(
+            "idx_platform_content_metadata_gin",
+            extra,
+            postgresql_using="gin",
+            postgresql_ops={"extra": "jsonb_path_ops"}
+        ),
+    )
+    
+    def __repr__(self):
+        return f"<PlatformContentExtra {self.content_id}>"
+
+
+# Batches at least this large are loaded with COPY instead of INSERTs
+COPY_THRESHOLD = 100
+
+# Column order of the records built by bulk_copy_platform_content
+COPY_COLUMNS = [
+    "content_id",
+    "job_id",
+    "platform_id",
+    "platform_video_id",
+    "url",
+    "title",
+    "author",
+    "views",
+    "likes",
+    "comments",
+    "duration_seconds",
+    "upload_date",
+    "trending_score",
+]
+COPY_EXTRA_COLUMNS = ["content_id", "description", "metadata"]
+
+
+async def bulk_copy_platform_content(
+    session: AsyncSession,
+    rows: List[Dict[str, Any]]
+) -> int:
+    """
+    Load discovered videos with one COPY per table on the session's connection.
+    
+    Primary keys are generated client-side so the platform_content_extra
+    rows can reference them, and both COPYs run inside the session's
+    transaction, so they are committed (or rolled back) with it.
+    
+    Returns:
+        Number of rows copied
+    """
+    records = []
+    extra_records = []
+    for row in rows:
+        content_id = uuid7()
+        records.append((
+            content_id,
+            uuid.UUID(str(row["job_id"])),
+            platform_id(row["platform"]),
+            row["platform_video_id"],
+            row["url"],
+            row.get("title"),
+            row.get("author"),
+            row.get("views"),
+            row.get("likes"),
+            row.get("comments"),
+            row.get("duration_seconds"),
+            row.get("upload_date"),
+            row.get("trending_score"),
+        ))
+        extra_records.append((
+            content_id,
+            row.get("description", ""),
+            orjson.dumps(row.get("metadata") or {}).decode(),
+        ))
+    
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        PlatformContent.__tablename__,
+        records=records,
+        columns=COPY_COLUMNS
+    )
+    await raw.driver_connection.copy_records_to_table(
+        PlatformContentExtra.__tablename__,
+        records=extra_records,
+        columns=COPY_EXTRA_COLUMNS
+    )
+    
+    return len(records)
+
+
+async def insert_platform_content(
+    session: AsyncSession,
+    rows: List[Dict[str, Any]]
+) -> int:
+    """
+    Insert discovered videos with one batched INSERT per table.
+    
+    Used below COPY_THRESHOLD. Each statement is sent as multi-row VALUES
+    pages (insertmanyvalues) instead of a round-trip per ORM object, and
+    since ids are generated client-side nothing needs to come back via
+    RETURNING before the platform_content_extra rows can be written.
+    
+    Returns:
+        Number of rows inserted
+    """
+    content_rows = []
+    extra_rows = []
+    for row in rows:
+        content_id = uuid7()
+        content_rows.append({
+            "content_id": content_id,
+            "job_id": row["job_id"],
+            "platform": row["platform"],
+            "platform_video_id": row["platform_video_id"],
+            "url": row["url"],
+            "title": row.get("title"),
+            "author": row.get("author"),
+            "views": row.get("views"),
+            "likes": row.get("likes"),
+            "comments": row.get("comments"),
+            "duration_seconds": row.get("duration_seconds"),
+            "upload_date": row.get("upload_date"),
+            "trending_score": row.get("trending_score"),
+        })
+        extra_rows.append({
+            "content_id": content_id,
+            "description": row.get("description", ""),
+            "extra": row.get("metadata") or {},
+        })
+    
+    if not content_rows:
+        return 0
+    
+    await session.execute(insert(PlatformContent), content_rows)
+    await session.execute(insert(PlatformContentExtra), extra_rows)
+    
+    return len(content_rows)
@@ -1,12 +1,12 @@
 """Video analysis database model"""
 
-from sqlalchemy import Column, String, Text, Float, Boolean, ForeignKey, Index
+from sqlalchemy import Column, String, Text, Float, Boolean, ForeignKey, Index, CheckConstraint, text, DDL, event
 from sqlalchemy.dialects.postgresql import UUID, JSONB, TIMESTAMP, ARRAY
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 
 
 class VideoAnalysis(Base):
@@ -16,13 +16,12 @@ class VideoAnalysis(Base):
     analysis_id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4
+        default=uuid7
     )
     content_id = Column(
         UUID(as_uuid=True),
         ForeignKey("platform_content.content_id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False  # One analysis per content: uq_analysis_content
     )
     ai_model = Column(String(100), nullable=False)
     quality_score = Column(Float, nullable=True)
@@ -43,9 +42,33 @@ class VideoAnalysis(Base):
     
     # Indexes
     __table_args__ = (
+        # Scores are normalized to 0-1 by every analyzer
+        CheckConstraint("quality_score BETWEEN 0 AND 1", name="ck_quality"),
+        CheckConstraint("virality_score BETWEEN 0 AND 1", name="ck_virality"),
+        CheckConstraint("relevance_score BETWEEN 0 AND 1", name="ck_relevance"),
+        # Target of the analysis tasks' INSERT ... ON CONFLICT DO NOTHING
+        Index("uq_analysis_content", "content_id", unique=True),
         Index("idx_recommended", "content_id", "recommended"),
         Index("idx_scores", "quality_score", "virality_score", "relevance_score"),
+        # Covering partial index for the selector join on recommended rows
+        Index(
+            "idx_va_recommended_scores",
+            "content_id",
+            postgresql_where=text("recommended = true"),
+            postgresql_include=["quality_score", "relevance_score"]
+        ),
+        # Topic lookups use array containment: detected_topics @> ARRAY['gaming']
+        Index("idx_analysis_topics_gin", "detected_topics", postgresql_using="gin"),
     )
     
     def __repr__(self):
         return f"<VideoAnalysis {self.analysis_id} (recommended={self.recommended})>"
+
+
+# visual_analysis is the widest column; LZ4 TOAST compression decompresses
+# several times faster than the default pglz on every detail read
+event.listen(
+    VideoAnalysis.__table__,
+    "after_create",
+    DDL("ALTER TABLE video_analysis ALTER COLUMN visual_analysis SET COMPRESSION lz4")
+)
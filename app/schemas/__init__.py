@@ -1,25 +1,30 @@
 """Pydantic schemas package"""
 
-from app.schemas.job import JobCreate, JobResponse, JobUpdate, JobConfig, JobStatus
+from app.schemas.job import JobCreate, JobResponse, JobListAdapter, JobUpdate, JobConfig, JobStatus
 from app.schemas.video import (
     PlatformContentResponse,
+    PlatformContentListAdapter,
     VideoAnalysisResponse,
     DownloadedVideoResponse,
     OutputVideoResponse,
     DownloadRequest,
-    TrendingContentResponse
+    TrendingContentResponse,
+    TrendingContentListAdapter
 )
 
 __all__ = [
     "JobCreate",
     "JobResponse",
+    "JobListAdapter",
     "JobUpdate",
     "JobConfig",
     "JobStatus",
     "PlatformContentResponse",
+    "PlatformContentListAdapter",
     "VideoAnalysisResponse",
     "DownloadedVideoResponse",
     "OutputVideoResponse",
     "DownloadRequest",
-    "TrendingContentResponse"
+    "TrendingContentResponse",
+    "TrendingContentListAdapter"
 ]
@@ -1,6 +1,6 @@
 """Job Pydantic schemas"""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Optional, List, Literal
 from datetime import datetime
 from uuid import UUID
@@ -10,7 +10,9 @@ from enum import Enum
 class JobStatus(str, Enum):
     PENDING = "pending"
     DISCOVERING = "discovering"
+    DISCOVERED = "discovered"
     ANALYZING = "analyzing"
+    ANALYZED = "analyzed"
     DOWNLOADING = "downloading"
     EDITING = "editing"
     COMPLETED = "completed"
@@ -21,6 +23,7 @@ class JobType(str, Enum):
     RANKING = "ranking"
     COMPILATION = "compilation"
     HIGHLIGHTS = "highlights"
+    DISCOVERY = "discovery"
 
 
 class JobConfig(BaseModel):
@@ -36,8 +39,8 @@ class JobConfig(BaseModel):
     min_relevance_score: float = Field(default=0.7, ge=0.0, le=1.0)
     output_settings: Optional[dict] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "niche": "gaming",
                 "platforms": ["youtube", "tiktok"],
@@ -48,6 +51,7 @@ class JobConfig(BaseModel):
                 "min_relevance_score": 0.7
             }
         }
+    )
 
 
 class JobCreate(BaseModel):
@@ -56,8 +60,8 @@ class JobCreate(BaseModel):
     job_type: JobType = JobType.RANKING
     config: JobConfig
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_id": "user-123",
                 "job_type": "ranking",
@@ -69,6 +73,7 @@ class JobCreate(BaseModel):
                 }
             }
         }
+    )
 
 
 class JobUpdate(BaseModel):
@@ -90,9 +95,9 @@ class JobResponse(BaseModel):
     completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "job_id": "123e4567-e89b-12d3-a456-426614174000",
                 "user_id": "user-123",
@@ -106,6 +111,7 @@ class JobResponse(BaseModel):
                 "updated_at": "2024-01-15T10:00:00Z"
             }
         }
+    )
 
 
 class JobProgress(BaseModel):
@@ -119,3 +125,7 @@ class JobProgress(BaseModel):
     videos_analyzed: int = 0
     videos_downloaded: int = 0
     estimated_completion: Optional[datetime] = None
+
+
+# Compiled once; validates and serializes whole job lists in pydantic-core
+JobListAdapter = TypeAdapter(List[JobResponse])
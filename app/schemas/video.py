@@ -1,6 +1,6 @@
 """Video Pydantic schemas"""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from uuid import UUID
@@ -22,11 +22,11 @@ class PlatformContentResponse(BaseModel):
     duration_seconds: Optional[int] = None
     upload_date: Optional[datetime] = None
     trending_score: Optional[float] = None
-    metadata: Optional[Dict[str, Any]] = None
+    # Read from the ORM's `extra` attribute, emitted as "metadata"
+    extra: Optional[Dict[str, Any]] = Field(default=None, serialization_alias="metadata")
     discovered_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TrendingContentResponse(BaseModel):
@@ -41,8 +41,7 @@ class TrendingContentResponse(BaseModel):
     trending_score: Optional[float] = None
     discovered_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class VideoAnalysisResponse(BaseModel):
@@ -60,8 +59,7 @@ class VideoAnalysisResponse(BaseModel):
     recommended: bool = False
     analyzed_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DownloadRequest(BaseModel):
@@ -83,8 +81,7 @@ class DownloadedVideoResponse(BaseModel):
     duration_seconds: Optional[float] = None
     downloaded_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RankingItem(BaseModel):
@@ -113,8 +110,7 @@ class OutputVideoResponse(BaseModel):
     render_settings: Optional[Dict[str, Any]] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class OutputVideoCreate(BaseModel):
@@ -158,3 +154,8 @@ class RenderSettings(BaseModel):
     transition_duration: float = Field(default=0.3, ge=0.0, le=2.0)
     caption_style: Optional[CaptionStyleConfig] = None
     audio_settings: Optional[AudioSettingsConfig] = None
+
+
+# Compiled once; validates and serializes whole result lists in pydantic-core
+PlatformContentListAdapter = TypeAdapter(List[PlatformContentResponse])
+TrendingContentListAdapter = TypeAdapter(List[TrendingContentResponse])
@@ -1,18 +1,398 @@
 """Analysis Celery tasks for video evaluation."""
 
 from celery import shared_task
+from celery.signals import worker_process_init
 from datetime import datetime
+from functools import lru_cache
 import asyncio
 import os
 import structlog
 
+from sqlalchemy import select, update, delete, insert, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
 from workers.celery_app import celery_app
+from app.config import settings
 from app.core.database import async_session_maker
-from app.utils.async_utils import run_async
+from app.core.downloader import VideoDownloader
+from app.core.analyzer.vision_analyzer import VisionAnalyzer
+from app.core.analyzer.quality_checker import BatchQualityChecker
+from app.models.job import Job, JobStatus
+from app.models.platform_content import PlatformContent, PlatformContentExtra
+from app.models.video_analysis import VideoAnalysis
+from app.models.downloaded_video import DownloadedVideo
+from app.utils.async_utils import run_async, worker_loop_running
+from app.utils.progress import ProgressReporter
 
 logger = structlog.get_logger()
 
 
+# Columns written by the bulk video_analysis INSERTs
+_ANALYSIS_COLUMNS = (
+    "content_id",
+    "ai_model",
+    "quality_score",
+    "virality_score",
+    "relevance_score",
+    "content_summary",
+    "detected_topics",
+    "visual_analysis",
+    "sentiment",
+    "recommended",
+)
+
+
+def _analysis_row(content_id, **values) -> dict:
+    """
+    Build a video_analysis row for a bulk INSERT.
+    
+    Rows are only batched together when they carry the same keys, so
+    columns an analyzer didn't produce are filled with None.
+    """
+    row = dict.fromkeys(_ANALYSIS_COLUMNS)
+    row.update(values, content_id=content_id)
+    return row
+
+
+def _replace_analyses():
+    """
+    INSERT for video_analysis rows that overwrites an existing analysis.
+    
+    Re-analysis replaces whatever uq_analysis_content already holds for
+    the content, including a row another task wrote in the meantime.
+    """
+    stmt = pg_insert(VideoAnalysis)
+    return stmt.on_conflict_do_update(
+        index_elements=["content_id"],
+        set_={
+            **{column: stmt.excluded[column] for column in _ANALYSIS_COLUMNS if column != "content_id"},
+            "analyzed_at": func.now()
+        }
+    )
+
+
+@lru_cache(maxsize=2)
+def _shared_analyzer(use_free: bool) -> VisionAnalyzer:
+    return VisionAnalyzer(use_free=use_free)
+
+
+def get_analyzer() -> VisionAnalyzer:
+    """
+    Return the VisionAnalyzer for the configured backend.
+    
+    The free (OpenCV) analyzer is shared by every task in the worker
+    process. The GPT analyzer's AsyncOpenAI client belongs to the event
+    loop it was created on, so it is only shared when tasks run on the
+    worker's persistent loop; otherwise it is built per call.
+    """
+    if not settings.use_free_analyzer and settings.openai_api_key:
+        if not worker_loop_running():
+            return VisionAnalyzer(use_free=False)
+        return _shared_analyzer(False)
+    return _shared_analyzer(True)
+
+
+@lru_cache(maxsize=1)
+def get_quality_checker() -> BatchQualityChecker:
+    """Return the worker process's shared BatchQualityChecker."""
+    return BatchQualityChecker()
+
+
+@worker_process_init.connect
+def _warm_analyzers(**kwargs):
+    """Build the shared analyzers (and import OpenCV) when a worker starts."""
+    try:
+        get_analyzer()
+        get_quality_checker().checker.cv2
+    except ImportError as e:
+        logger.warning(f"Analyzer warm-up skipped: {e}")
+
+
+async def _run_pipeline(
+    session,
+    pending: list,
+    *,
+    downloader,
+    analyzer,
+    quality_checker,
+    niche: str,
+    model_name: str,
+    on_progress=None
+) -> dict:
+    """
+    Download, quality-check and analyze content, writing the results.
+    
+    Download workers feed finished downloads to analysis workers, which
+    hand their rows to a single DB writer. Only the writer touches the
+    session. Every batch but the last is committed as it is written;
+    the caller commits the last one with the final job status.
+    
+    Args:
+        session: Database session
+        pending: Content rows still to analyze
+        downloader: VideoDownloader
+        analyzer: VisionAnalyzer
+        quality_checker: BatchQualityChecker
+        niche: Niche context for the analyzer
+        model_name: ai_model recorded for successful analyses
+        on_progress: Called with (downloaded, analyzed, finished) after each write
+    
+    Returns:
+        Counts of downloaded, analyzed and recommended videos
+    """
+    # Downloads are capped by the downloader's own semaphore; this
+    # caps concurrent vision/API calls separately
+    analysis_semaphore = asyncio.Semaphore(settings.max_concurrent_analysis)
+    downloaded = 0
+    analyzed = 0
+    recommended = 0
+    
+    def _outcome() -> dict:
+        return {
+            "downloaded": False,
+            "analyzed": False,
+            "recommended": False,
+            "download": None,
+            "analysis": None
+        }
+    
+    async def _analyze_one(content, download_result, quality_report) -> dict:
+        """Analyze one downloaded, quality-checked video (no session access)."""
+        outcome = _outcome()
+        outcome["downloaded"] = True
+        local_path = download_result.local_path
+        
+        # Download record row
+        outcome["download"] = {
+            "content_id": content.content_id,
+            "local_path": local_path,
+            "file_size_bytes": download_result.file_size_bytes,
+            "resolution": download_result.resolution,
+            "format": download_result.format,
+            "fps": download_result.fps,
+            "duration_seconds": download_result.duration_seconds or None  # 0 means unknown
+        }
+        
+        if not quality_report.passed:
+            # Analysis row marked as not recommended
+            outcome["analysis"] = _analysis_row(
+                content.content_id,
+                ai_model="quality_check",
+                quality_score=0.0,
+                relevance_score=0.0,
+                visual_analysis={
+                    "quality_check_failed": True,
+                    "issues": quality_report.issues,
+                    "rejection_reasons": quality_report.issues
+                },
+                recommended=False
+            )
+            return outcome
+        
+        # AI Vision Analysis
+        try:
+            # Pass metadata for free analyzer
+            video_metadata = {
+                "title": content.title,
+                "description": content.description,
+                "views": content.views or 0,
+                "likes": content.likes or 0,
+                "comments": content.comments or 0,
+                "upload_date": content.upload_date
+            }
+            async with analysis_semaphore:
+                analysis_result = await analyzer.analyze_video(
+                    video_path=local_path,
+                    niche_context=niche,
+                    content_id=str(content.content_id),
+                    metadata=video_metadata
+                )
+            outcome["analyzed"] = True
+            outcome["recommended"] = bool(analysis_result.recommended)
+            
+            # Analysis row
+            outcome["analysis"] = _analysis_row(
+                content.content_id,
+                ai_model=model_name,
+                quality_score=analysis_result.visual_quality_score,
+                relevance_score=analysis_result.relevance_score,
+                virality_score=analysis_result.virality_potential,
+                content_summary=analysis_result.caption_suggestion,
+                detected_topics=analysis_result.detected_topics,
+                visual_analysis=analysis_result.to_dict(),
+                sentiment=analysis_result.sentiment,
+                recommended=analysis_result.recommended
+            )
+        except Exception as e:
+            logger.error(f"AI analysis failed: {e}")
+            # Still save a basic record
+            outcome["analysis"] = _analysis_row(
+                content.content_id,
+                ai_model="error",
+                quality_score=0.5,
+                relevance_score=0.5,
+                visual_analysis={"error": str(e)},
+                recommended=False
+            )
+        
+        return outcome
+    
+    num_workers = min(settings.analysis_concurrency, len(pending)) or 1
+    todo = iter(pending)  # Shared by the download workers
+    ready: asyncio.Queue = asyncio.Queue(maxsize=settings.analysis_concurrency)
+    results: asyncio.Queue = asyncio.Queue()
+    
+    async def download_worker():
+        for content in todo:
+            try:
+                download_result = await downloader.download_video(
+                    url=content.url,
+                    video_id=content.platform_video_id,
+                    content_id=str(content.content_id)
+                )
+            except Exception as e:
+                logger.error(f"Error processing {content.content_id}: {e}")
+                await results.put(_outcome())
+                continue
+            
+            if not download_result.success:
+                logger.warning(
+                    f"Download failed: {content.content_id}",
+                    error=download_result.error
+                )
+                await results.put(_outcome())
+                continue
+            
+            # Blocks while the analyzers are behind
+            await ready.put((content, download_result))
+    
+    async def analysis_worker():
+        stopping = False
+        while not stopping:
+            item = await ready.get()
+            if item is None:
+                return
+            
+            # Take every other download that is already waiting, so
+            # they share one quality-check batch
+            batch = [item]
+            while len(batch) < settings.analysis_concurrency:
+                try:
+                    item = ready.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            # Quality checks decode frames, so off the event loop
+            reports = await asyncio.to_thread(
+                quality_checker.check_batch,
+                [download_result.local_path for _, download_result in batch]
+            )
+            outcomes = await asyncio.gather(
+                *(
+                    _analyze_one(content, download_result, reports[download_result.local_path])
+                    for content, download_result in batch
+                ),
+                return_exceptions=True
+            )
+            
+            for (content, _), outcome in zip(batch, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error(f"Error processing {content.content_id}: {outcome}")
+                    outcome = _outcome()
+                    outcome["downloaded"] = True
+                await results.put(outcome)
+    
+    async def downloads():
+        await asyncio.gather(*(download_worker() for _ in range(num_workers)))
+        for _ in range(num_workers):
+            await ready.put(None)
+    
+    async def analyses():
+        await asyncio.gather(*(analysis_worker() for _ in range(num_workers)))
+        await results.put(None)
+    
+    async def writer():
+        nonlocal downloaded, analyzed, recommended
+        pending_downloads = []
+        pending_analyses = []
+        batched = 0
+        finished = False
+        
+        while not finished:
+            try:
+                outcome = await asyncio.wait_for(
+                    results.get(),
+                    timeout=settings.analysis_flush_seconds
+                )
+            except asyncio.TimeoutError:
+                # Slow analyses: write what has finished so far
+                outcome = {}
+            
+            if outcome is None:
+                finished = True
+            elif outcome:
+                batched += 1
+                if outcome["download"]:
+                    pending_downloads.append(outcome["download"])
+                if outcome["analysis"]:
+                    pending_analyses.append(outcome["analysis"])
+                if outcome["downloaded"]:
+                    downloaded += 1
+                if outcome["analyzed"]:
+                    analyzed += 1
+                if outcome["recommended"]:
+                    recommended += 1
+            
+            if not batched and not finished:
+                continue
+            if batched < settings.analysis_concurrency and outcome and not finished:
+                continue
+            
+            # One executemany per table per batch
+            if pending_downloads:
+                await session.execute(insert(DownloadedVideo), pending_downloads)
+            if pending_analyses:
+                # Another task (or a retry of this one) may have
+                # analyzed the same content since it was fetched
+                await session.execute(
+                    pg_insert(VideoAnalysis).on_conflict_do_nothing(
+                        index_elements=["content_id"]
+                    ),
+                    pending_analyses
+                )
+            if not finished:
+                # The last batch is committed with the final job status
+                await session.commit()
+            pending_downloads = []
+            pending_analyses = []
+            batched = 0
+            
+            if on_progress:
+                on_progress(downloaded, analyzed, finished)
+    
+    stages = [
+        asyncio.create_task(downloads()),
+        asyncio.create_task(analyses()),
+        asyncio.create_task(writer())
+    ]
+    try:
+        await asyncio.gather(*stages)
+    finally:
+        # A failed stage would leave the others blocked on a queue
+        for task in stages:
+            task.cancel()
+    
+    return {
+        "downloaded": downloaded,
+        "analyzed": analyzed,
+        "recommended": recommended
+    }
+
+
 @celery_app.task(bind=True, name="analysis.process_content_pool")
 def process_content_pool(
     self,
@@ -35,42 +415,49 @@ def process_content_pool(
         niche: Content niche for relevance scoring
         limit: Maximum videos to process
     """
-    import asyncio
+    # Task.request is thread-local and the coroutine runs on the worker
+    # loop's thread, so progress updates name the task id explicitly
+    task_id = self.request.id
     
     async def _process():
-        from sqlalchemy import select, update, text
-        from app.core.downloader import VideoDownloader
-        from app.core.analyzer.vision_analyzer import VisionAnalyzer
-        from app.core.analyzer.quality_checker import QualityChecker
-        from app.models.job import Job, JobStatus
-        from app.models.platform_content import PlatformContent
-        from app.models.video_analysis import VideoAnalysis
-        from app.models.downloaded_video import DownloadedVideo
-        
         async with async_session_maker() as session:
             try:
-                # Update job status
+                # Update job status (committed with the first batch of results)
                 await session.execute(
                     update(Job)
                     .where(Job.job_id == job_id)
                     .values(status=JobStatus.ANALYZING)
                 )
-                await session.commit()
                 
                 # Initialize components
                 downloader = VideoDownloader()
-                from app.config import settings
-                analyzer = VisionAnalyzer(use_free=settings.use_free_analyzer)
-                quality_checker = QualityChecker()
+                analyzer = get_analyzer()
+                quality_checker = get_quality_checker()
+                model_name = "free-vision" if settings.use_free_analyzer else "gpt-4-vision"
                 
-                # Fetch top discovered content
+                # Fetch top discovered content: only the columns the pipeline
+                # reads, as plain rows instead of ORM instances, flagged when
+                # an analysis already exists
                 result = await session.execute(
-                    select(PlatformContent)
+                    select(
+                        PlatformContent.content_id,
+                        PlatformContent.url,
+                        PlatformContent.platform_video_id,
+                        PlatformContent.title,
+                        PlatformContentExtra.description,
+                        PlatformContent.views,
+                        PlatformContent.likes,
+                        PlatformContent.comments,
+                        PlatformContent.upload_date,
+                        VideoAnalysis.analysis_id.isnot(None).label("already_analyzed")
+                    )
+                    .outerjoin(PlatformContent.details)
+                    .outerjoin(PlatformContent.analysis)
                     .where(PlatformContent.job_id == job_id)
                     .order_by(PlatformContent.trending_score.desc())
                     .limit(limit)
                 )
-                content_list = result.scalars().all()
+                content_list = result.all()
                 
                 logger.info(
                     f"Processing {len(content_list)} videos",
@@ -78,154 +465,41 @@ def process_content_pool(
                     niche=niche
                 )
                 
-                processed = 0
-                downloaded = 0
-                analyzed = 0
-                recommended = 0
+                pending = [c for c in content_list if not c.already_analyzed]
+                processed = len(content_list) - len(pending)
                 
-                for i, content in enumerate(content_list):
-                    try:
-                        # Update progress
-                        self.update_state(
-                            state="PROGRESS",
-                            meta={
-                                "current": i + 1,
-                                "total": len(content_list),
-                                "stage": "processing",
-                                "downloaded": downloaded,
-                                "analyzed": analyzed
-                            }
-                        )
-                        
-                        # Check if already processed
-                        existing_analysis = await session.execute(
-                            select(VideoAnalysis)
-                            .where(VideoAnalysis.content_id == content.content_id)
-                        )
-                        if existing_analysis.scalar_one_or_none():
-                            processed += 1
-                            continue
-                        
-                        # Download video
-                        download_result = await downloader.download_video(
-                            url=content.url,
-                            video_id=content.platform_video_id,
-                            content_id=str(content.content_id)
-                        )
-                        
-                        if not download_result.success:
-                            logger.warning(
-                                f"Download failed: {content.content_id}",
-                                error=download_result.error
-                            )
-                            continue
-                        
-                        downloaded += 1
-                        local_path = download_result.local_path
-                        
-                        # Save download record
-                        download_record = DownloadedVideo(
-                            content_id=content.content_id,
-                            local_path=local_path,
-                            file_size_bytes=download_result.file_size_bytes,
-                            resolution=download_result.resolution,
-                            format=download_result.format,
-                            fps=download_result.fps,
-                            duration_seconds=download_result.duration_seconds
-                        )
-                        session.add(download_record)
-                        
-                        # Quick quality check first
-                        quality_report = quality_checker.check_video(local_path)
-                        
-                        if not quality_report.passed:
-                            # Create analysis record marked as not recommended
-                            analysis = VideoAnalysis(
-                                content_id=content.content_id,
-                                ai_model="quality_check",
-                                quality_score=0.0,
-                                relevance_score=0.0,
-                                visual_analysis={
-                                    "quality_check_failed": True,
-                                    "issues": quality_report.issues,
-                                    "rejection_reasons": quality_report.issues
-                                },
-                                recommended=False
-                            )
-                            session.add(analysis)
-                            processed += 1
-                            continue
-                        
-                        # AI Vision Analysis
-                        try:
-                            # Pass metadata for free analyzer
-                            video_metadata = {
-                                "title": content.title,
-                                "description": content.description,
-                                "views": content.views or 0,
-                                "likes": content.likes or 0,
-                                "comments": content.comments or 0,
-                                "upload_date": content.upload_date
-                            }
-                            analysis_result = await analyzer.analyze_video(
-                                video_path=local_path,
-                                niche_context=niche,
-                                content_id=str(content.content_id),
-                                metadata=video_metadata
-                            )
-                            analyzed += 1
-                            
-                            # Save analysis
-                            from app.config import settings
-                            model_name = "free-vision" if settings.use_free_analyzer else "gpt-4-vision"
-                            analysis = VideoAnalysis(
-                                content_id=content.content_id,
-                                ai_model=model_name,
-                                quality_score=analysis_result.visual_quality_score,
-                                relevance_score=analysis_result.relevance_score,
-                                virality_score=analysis_result.virality_potential,
-                                content_summary=analysis_result.caption_suggestion,
-                                detected_topics=analysis_result.detected_topics,
-                                visual_analysis=analysis_result.to_dict(),
-                                sentiment=analysis_result.sentiment,
-                                recommended=analysis_result.recommended
-                            )
-                            session.add(analysis)
-                            
-                            if analysis_result.recommended:
-                                recommended += 1
-                                
-                        except Exception as e:
-                            logger.error(f"AI analysis failed: {e}")
-                            # Still save a basic record
-                            analysis = VideoAnalysis(
-                                content_id=content.content_id,
-                                ai_model="error",
-                                quality_score=0.5,
-                                relevance_score=0.5,
-                                visual_analysis={"error": str(e)},
-                                recommended=False
-                            )
-                            session.add(analysis)
-                        
-                        processed += 1
-                        
-                        # Commit periodically
-                        if processed % 5 == 0:
-                            await session.commit()
-                            
-                    except Exception as e:
-                        logger.error(f"Error processing {content.content_id}: {e}")
-                        continue
+                progress = ProgressReporter(self, task_id=task_id)
                 
-                # Final commit
-                await session.commit()
+                def _report(downloaded, analyzed, finished):
+                    progress.update(
+                        processed + downloaded,
+                        len(content_list),
+                        force=finished,
+                        stage="processing",
+                        downloaded=downloaded,
+                        analyzed=analyzed
+                    )
                 
-                # Update job status
+                counts = await _run_pipeline(
+                    session,
+                    pending,
+                    downloader=downloader,
+                    analyzer=analyzer,
+                    quality_checker=quality_checker,
+                    niche=niche,
+                    model_name=model_name,
+                    on_progress=_report
+                )
+                downloaded = counts["downloaded"]
+                analyzed = counts["analyzed"]
+                recommended = counts["recommended"]
+                processed += downloaded
+                
+                # Update job status and commit the last batch with it
                 await session.execute(
                     update(Job)
                     .where(Job.job_id == job_id)
-                    .values(status="analyzed")
+                    .values(status=JobStatus.ANALYZED)
                 )
                 await session.commit()
                 
@@ -260,7 +534,7 @@ def process_content_pool(
                     update(Job)
                     .where(Job.job_id == job_id)
                     .values(
-                        status="failed",
+                        status=JobStatus.FAILED,
                         error_message=str(e)
                     )
                 )
@@ -285,22 +559,10 @@ def analyze_single_video(
         video_path: Local path to video file
         niche: Content niche context
     """
-    import asyncio
     
     async def _analyze():
-        from app.core.analyzer.vision_analyzer import VisionAnalyzer
-        from app.models.video_analysis import VideoAnalysis
-        from sqlalchemy import select, delete
-        
         async with async_session_maker() as session:
-            from app.config import settings
-            analyzer = VisionAnalyzer(use_free=settings.use_free_analyzer)
-            
-            # Delete existing analysis
-            await session.execute(
-                delete(VideoAnalysis)
-                .where(VideoAnalysis.content_id == content_id)
-            )
+            analyzer = get_analyzer()
             
             # Run analysis
             result = await analyzer.analyze_video(
@@ -309,22 +571,23 @@ def analyze_single_video(
                 content_id=content_id
             )
             
-            # Save new analysis
-            from app.config import settings
+            # Save new analysis, replacing any existing one in the same statement
             model_name = "free-vision" if settings.use_free_analyzer else "gpt-4-vision"
-            analysis = VideoAnalysis(
-                content_id=content_id,
-                ai_model=model_name,
-                quality_score=result.visual_quality_score,
-                relevance_score=result.relevance_score,
-                virality_score=result.virality_potential,
-                content_summary=result.caption_suggestion,
-                detected_topics=result.detected_topics,
-                visual_analysis=result.to_dict(),
-                sentiment=result.sentiment,
-                recommended=result.recommended
+            await session.execute(
+                _replace_analyses(),
+                [_analysis_row(
+                    content_id,
+                    ai_model=model_name,
+                    quality_score=result.visual_quality_score,
+                    relevance_score=result.relevance_score,
+                    virality_score=result.virality_potential,
+                    content_summary=result.caption_suggestion,
+                    detected_topics=result.detected_topics,
+                    visual_analysis=result.to_dict(),
+                    sentiment=result.sentiment,
+                    recommended=result.recommended
+                )]
             )
-            session.add(analysis)
             await session.commit()
             
             return result.to_dict()
@@ -343,68 +606,71 @@ def reanalyze_batch(
     
     Useful when user wants to repurpose content.
     """
-    import asyncio
     
     async def _reanalyze():
-        from sqlalchemy import select, delete
-        from app.core.analyzer.vision_analyzer import VisionAnalyzer
-        from app.models.video_analysis import VideoAnalysis
-        from app.models.downloaded_video import DownloadedVideo
-        from app.models.platform_content import PlatformContent
-        
         async with async_session_maker() as session:
-            # Get downloaded videos for this job
+            # Get downloaded videos for this job: content can have several
+            # download rows, so take the newest one per content
             result = await session.execute(
-                select(DownloadedVideo, PlatformContent)
+                select(DownloadedVideo.content_id, DownloadedVideo.local_path)
                 .join(PlatformContent)
                 .where(PlatformContent.job_id == job_id)
+                .distinct(DownloadedVideo.content_id)
+                .order_by(DownloadedVideo.content_id, DownloadedVideo.downloaded_at.desc())
                 .limit(limit)
             )
             
             videos = result.all()
-            from app.config import settings
-            analyzer = VisionAnalyzer(use_free=settings.use_free_analyzer)
+            analyzer = get_analyzer()
             
-            updated = 0
-            for downloaded, content in videos:
-                try:
-                    # Delete old analysis
-                    await session.execute(
-                        delete(VideoAnalysis)
-                        .where(VideoAnalysis.content_id == content.content_id)
-                    )
-                    
-                    # Re-analyze
-                    analysis_result = await analyzer.analyze_video(
-                        video_path=downloaded.local_path,
+            # Delete old analyses for the whole batch in one statement
+            await session.execute(
+                delete(VideoAnalysis)
+                .where(VideoAnalysis.content_id.in_([video.content_id for video in videos]))
+            )
+            
+            # Re-analyze concurrently, capped like the main pipeline
+            analysis_semaphore = asyncio.Semaphore(settings.max_concurrent_analysis)
+            
+            async def _reanalyze_one(video):
+                async with analysis_semaphore:
+                    return await analyzer.analyze_video(
+                        video_path=video.local_path,
                         niche_context=new_niche,
-                        content_id=str(content.content_id)
+                        content_id=str(video.content_id)
                     )
-                    
-                    # Save
-                    model_name = "free-vision" if settings.use_free_analyzer else "gpt-4-vision"
-                    analysis = VideoAnalysis(
-                        content_id=content.content_id,
-                        ai_model=model_name,
-                        quality_score=analysis_result.visual_quality_score,
-                        relevance_score=analysis_result.relevance_score,
-                        content_summary=analysis_result.caption_suggestion,
-                        detected_topics=analysis_result.detected_topics,
-                        visual_analysis=analysis_result.to_dict(),
-                        sentiment=analysis_result.sentiment,
-                        recommended=analysis_result.recommended
-                    )
-                    session.add(analysis)
-                    updated += 1
-                    
-                except Exception as e:
-                    logger.error(f"Re-analysis failed: {e}")
             
+            results = await asyncio.gather(
+                *(_reanalyze_one(video) for video in videos),
+                return_exceptions=True
+            )
+            
+            model_name = "free-vision" if settings.use_free_analyzer else "gpt-4-vision"
+            new_analyses = []
+            for video, analysis_result in zip(videos, results):
+                if isinstance(analysis_result, Exception):
+                    logger.error(f"Re-analysis failed: {analysis_result}")
+                    continue
+                
+                new_analyses.append(_analysis_row(
+                    video.content_id,
+                    ai_model=model_name,
+                    quality_score=analysis_result.visual_quality_score,
+                    relevance_score=analysis_result.relevance_score,
+                    content_summary=analysis_result.caption_suggestion,
+                    detected_topics=analysis_result.detected_topics,
+                    visual_analysis=analysis_result.to_dict(),
+                    sentiment=analysis_result.sentiment,
+                    recommended=analysis_result.recommended
+                ))
+            
+            if new_analyses:
+                await session.execute(_replace_analyses(), new_analyses)
             await session.commit()
             
             return {
                 "status": "success",
-                "updated": updated,
+                "updated": len(new_analyses),
                 "new_niche": new_niche
             }
     
@@ -418,10 +684,7 @@ def quality_check_batch(video_paths: list):
     
     Returns list of pass/fail results.
     """
-    from app.core.analyzer.quality_checker import BatchQualityChecker
-    
-    checker = BatchQualityChecker()
-    results = checker.check_batch(video_paths)
+    results = get_quality_checker().check_batch(video_paths)
     
     return {
         path: {
@@ -7,7 +7,13 @@ import structlog
 from workers.celery_app import celery_app
 from app.core.database import async_session_maker
 from app.models.job import Job, JobStatus
-from app.models.platform_content import PlatformContent
+from app.models.platform import PLATFORM_IDS
+from app.models.platform_content import (
+    PlatformContent,
+    COPY_THRESHOLD,
+    bulk_copy_platform_content,
+    insert_platform_content
+)
 from app.utils.async_utils import run_async
 from app.utils.job_logger import add_job_log
 
@@ -42,6 +48,10 @@ def run_discovery_job(
     """
     import asyncio
     
+    # Task.request is thread-local and the coroutine runs on the worker
+    # loop's thread, so progress updates name the task id explicitly
+    task_id = self.request.id
+    
     async def _process():
         from app.core.discovery.orchestrator import DiscoveryOrchestrator
         from sqlalchemy import select, update
@@ -115,52 +125,48 @@ def run_discovery_job(
                 await add_job_log(session, job_id, "info", f"Saving {len(videos)} discovered videos to database...")
                 await session.commit()
                 
-                inserted_count = 0
-                duplicate_count = 0
+                # Check for existing content by URL in one query
+                existing = await session.execute(
+                    select(PlatformContent.url).where(
+                        PlatformContent.url.in_([video.url for video in videos])
+                    )
+                )
+                existing_urls = set(existing.scalars().all())
                 
+                new_rows = []
                 for video in videos:
-                    # Check for existing content by URL
-                    existing = await session.execute(
-                        select(PlatformContent).where(
-                            PlatformContent.url == video.url
-                        )
-                    )
-                    
-                    if existing.scalar_one_or_none():
-                        duplicate_count += 1
+                    if video.url in existing_urls:
                         continue
-                    
-                    # Create new platform content record
-                    video_data = video.to_dict()
-                    content = PlatformContent(
-                        job_id=job_id,
-                        platform=video_data["platform"],
-                        platform_video_id=video_data["platform_video_id"],
-                        url=video_data["url"],
-                        title=video_data["title"],
-                        description=video_data.get("description", ""),
-                        author=video_data["author"],
-                        views=video_data["views"],
-                        likes=video_data["likes"],
-                        comments=video_data["comments"],
-                        duration_seconds=video_data.get("duration_seconds"),
-                        upload_date=video_data.get("upload_date"),
-                        trending_score=video_data["trending_score"],
-                        metadata=video_data.get("metadata", {})
-                    )
-                    session.add(content)
-                    inserted_count += 1
-                    
-                    # Update progress periodically
-                    if inserted_count % 10 == 0:
-                        self.update_state(
-                            state="PROGRESS",
-                            meta={
-                                "current": inserted_count,
-                                "total": len(videos),
-                                "stage": "saving"
-                            }
+                    if video.platform not in PLATFORM_IDS:
+                        # No platforms row to reference; don't fail the whole save
+                        logger.warning(
+                            "Skipping content from unsupported platform",
+                            platform=video.platform,
+                            url=video.url
                         )
+                        continue
+                    existing_urls.add(video.url)
+                    new_rows.append({"job_id": job_id, **video.to_dict()})
+                
+                inserted_count = len(new_rows)
+                duplicate_count = len(videos) - inserted_count
+                
+                if inserted_count >= COPY_THRESHOLD:
+                    # Large batches go over the COPY protocol in one frame
+                    await bulk_copy_platform_content(session, new_rows)
+                else:
+                    # Small batches: one multi-row INSERT per table
+                    await insert_platform_content(session, new_rows)
+                
+                self.update_state(
+                    task_id=task_id,
+                    state="PROGRESS",
+                    meta={
+                        "current": inserted_count,
+                        "total": len(videos),
+                        "stage": "saving"
+                    }
+                )
                 
                 await session.commit()
                 
@@ -175,7 +181,7 @@ def run_discovery_job(
                 await session.execute(
                     update(Job)
                     .where(Job.job_id == job_id)
-                    .values(status="discovered")
+                    .values(status=JobStatus.DISCOVERED)
                 )
                 await session.commit()
                 
@@ -9,6 +9,7 @@ from app.core.downloader import VideoDownloader
 from app.models.job import Job, JobStatus
 from app.models.platform_content import PlatformContent
 from app.models.downloaded_video import DownloadedVideo
+from app.utils.progress import ProgressReporter
 
 logger = structlog.get_logger()
 
@@ -86,7 +87,7 @@ def download_video(
                 resolution=download_result.resolution,
                 format=download_result.format,
                 fps=download_result.fps,
-                duration_seconds=download_result.duration_seconds
+                duration_seconds=download_result.duration_seconds or None  # 0 means unknown
             )
             session.add(download_record)
             await session.commit()
@@ -168,7 +169,7 @@ def batch_download(
                         resolution=download_result.resolution,
                         format=download_result.format,
                         fps=download_result.fps,
-                        duration_seconds=download_result.duration_seconds
+                        duration_seconds=download_result.duration_seconds or None  # 0 means unknown
                     )
                     session.add(download_record)
                     success_count += 1
@@ -203,6 +204,10 @@ def batch_download_for_job(
     """
     import asyncio
     
+    # Task.request is thread-local and the coroutine runs on the worker
+    # loop's thread, so progress updates name the task id explicitly
+    task_id = self.request.id
+    
     async def _run():
         async with async_session_maker() as session:
             from sqlalchemy import select, desc
@@ -260,6 +265,7 @@ def batch_download_for_job(
             
             # Download with progress updates
             success_count = 0
+            progress = ProgressReporter(self, task_id=task_id)
             for i, (content, item) in enumerate(zip(contents, download_items)):
                 try:
                     download_result = await downloader.download(
@@ -275,20 +281,13 @@ def batch_download_for_job(
                             resolution=download_result.resolution,
                             format=download_result.format,
                             fps=download_result.fps,
-                            duration_seconds=download_result.duration_seconds
+                            duration_seconds=download_result.duration_seconds or None  # 0 means unknown
                         )
                         session.add(download_record)
                         success_count += 1
                     
                     # Update progress
-                    self.update_state(
-                        state="PROGRESS",
-                        meta={
-                            "current": i + 1,
-                            "total": len(contents),
-                            "success": success_count
-                        }
-                    )
+                    progress.update(i + 1, len(contents), success=success_count)
                     
                 except Exception as e:
                     logger.error(
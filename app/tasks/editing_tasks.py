@@ -1,6 +1,7 @@
 """Editing Celery tasks for video compilation and rendering."""
 
 from celery import shared_task
+import base64
 import structlog
 from datetime import datetime
 from typing import List, Dict, Any
@@ -94,6 +95,10 @@ def render_final_video(
     """
     import asyncio
     
+    # Task.request is thread-local and the coroutine runs on the worker
+    # loop's thread, so progress updates name the task id explicitly
+    task_id = self.request.id
+    
     async def _render():
         from sqlalchemy import select, desc, update
         from app.core.audio.tts_service import TTSService, VoiceStyle
@@ -167,6 +172,7 @@ def render_final_video(
                 )
                 
                 self.update_state(
+                    task_id=task_id,
                     state="PROGRESS",
                     meta={"stage": "generating_tts", "progress": 10}
                 )
@@ -200,6 +206,7 @@ def render_final_video(
                 tts_results = tts.generate_ranking_audio_set(niche, clips_data)
                 
                 self.update_state(
+                    task_id=task_id,
                     state="PROGRESS",
                     meta={"stage": "mixing_audio", "progress": 30}
                 )
@@ -230,6 +237,7 @@ def render_final_video(
                     logger.warning("No background music found")
                 
                 self.update_state(
+                    task_id=task_id,
                     state="PROGRESS",
                     meta={"stage": "compositing_video", "progress": 50}
                 )
@@ -263,6 +271,7 @@ def render_final_video(
                 output_filename = f"ranking_{niche}_{timestamp}.mp4"
                 
                 self.update_state(
+                    task_id=task_id,
                     state="PROGRESS",
                     meta={"stage": "rendering", "progress": 70}
                 )
@@ -284,6 +293,7 @@ def render_final_video(
                     return {"error": render_result.error}
                 
                 self.update_state(
+                    task_id=task_id,
                     state="PROGRESS",
                     meta={"stage": "saving", "progress": 95}
                 )
@@ -481,11 +491,15 @@ def generate_preview(job_id: str):
             compositor = VideoCompositor()
             from app.core.editor.compositor import ClipConfig
             
-            preview_path = compositor.get_render_preview(
+            preview = compositor.get_render_preview(
                 [ClipConfig(path=download.local_path)],
                 frame_time=2.0
             )
             
-            return {"preview_path": preview_path}
+            if not preview:
+                return {"error": "Preview generation failed"}
+            
+            # Task results are JSON, so the JPEG travels base64-encoded
+            return {"preview_jpeg": base64.b64encode(preview).decode("ascii")}
     
     return run_async(_preview())
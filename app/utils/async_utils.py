@@ -2,14 +2,99 @@
 
 import asyncio
 import sys
+import threading
+from typing import Optional
+
+
+def _install_uvloop() -> bool:
+    """
+    Use uvloop as the event loop policy on Linux/macOS.
+    
+    uvloop schedules awaits and socket I/O considerably faster than the
+    default selector loop, which matters for large batch downloads.
+    """
+    if sys.platform == "win32":
+        return False
+    
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+UVLOOP_ENABLED = _install_uvloop()
+
+# Set in Celery worker processes by start_worker_loop()
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Per-thread asyncio.Runner used when there is no worker loop
+_thread_runners = threading.local()
+
+
+def start_worker_loop() -> asyncio.AbstractEventLoop:
+    """
+    Start this process's persistent event loop in a daemon thread.
+    
+    Once started, run_async submits every coroutine to this loop instead
+    of creating a new one per task, so pooled database connections and
+    API clients (which belong to the loop they were opened on) stay usable
+    across tasks.
+    
+    Returns:
+        The running loop
+    """
+    global _worker_loop
+    if _worker_loop is None:
+        loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=loop.run_forever,
+            name="async-worker-loop",
+            daemon=True
+        ).start()
+        _worker_loop = loop
+    return _worker_loop
+
+
+def stop_worker_loop():
+    """Stop the persistent event loop started by start_worker_loop()."""
+    global _worker_loop
+    if _worker_loop is not None:
+        _worker_loop.call_soon_threadsafe(_worker_loop.stop)
+        _worker_loop = None
+
+
+def worker_loop_running() -> bool:
+    """Whether run_async is submitting to a persistent worker loop."""
+    return _worker_loop is not None
+
+
+def _thread_runner() -> asyncio.Runner:
+    """
+    Return this thread's asyncio.Runner, creating it on first use.
+    
+    The runner (and its loop) is kept for the life of the thread, so
+    every run_async call on it reuses one loop.
+    """
+    runner = getattr(_thread_runners, "runner", None)
+    if runner is None:
+        runner = asyncio.Runner()
+        _thread_runners.runner = runner
+    return runner
 
 
 def run_async(coro):
     """
-    Run an async coroutine in a Celery task, handling Windows event loop issues.
+    Run an async coroutine from synchronous code (Celery tasks, scripts).
     
-    This function handles the common issue where asyncio.run() creates a new event loop
-    that conflicts with SQLAlchemy async connections on Windows/Celery.
+    The module-level engine pools asyncpg connections, which belong to
+    the loop they were opened on. asyncio.run() would give every call a
+    fresh loop and strand those connections, so calls are run on a loop
+    that outlives them instead: the worker's persistent loop when one is
+    running (prefork children), otherwise a loop kept per thread (solo or
+    threads pools, eager mode, scripts).
     
     Args:
         coro: The coroutine to run
@@ -17,37 +102,33 @@ def run_async(coro):
     Returns:
         The result of the coroutine
     """
-    # Try to use nest_asyncio if available (fixes Windows/Celery issues)
+    # Celery worker process: reuse the long-lived loop
+    if _worker_loop is not None:
+        future = asyncio.run_coroutine_threadsafe(coro, _worker_loop)
+        try:
+            return future.result()
+        except BaseException:
+            # e.g. SoftTimeLimitExceeded raised while waiting: don't leave
+            # the coroutine running on the loop
+            future.cancel()
+            raise
+    
     try:
-        import nest_asyncio
-        nest_asyncio.apply()
-        return asyncio.run(coro)
-    except ImportError:
-        # nest_asyncio not installed, try alternative approach
-        pass
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _thread_runner().run(coro)
     
-    # Try standard asyncio.run first
+    # Called from inside a running loop; only nest_asyncio can re-enter it
+    if UVLOOP_ENABLED:
+        coro.close()
+        raise RuntimeError("run_async cannot be called from a running uvloop event loop")
     try:
-        return asyncio.run(coro)
-    except RuntimeError as e:
-        if "attached to a different loop" in str(e) or "Event loop is closed" in str(e):
-            # Windows/Celery event loop conflict - try to get existing loop
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_closed():
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                return loop.run_until_complete(coro)
-            except Exception:
-                # Last resort: try nest_asyncio again (might have been installed)
-                try:
-                    import nest_asyncio
-                    nest_asyncio.apply()
-                    return asyncio.run(coro)
-                except ImportError:
-                    # If all else fails, raise the original error
-                    raise RuntimeError(
-                        "Event loop conflict detected. Please install nest-asyncio: "
-                        "pip install nest-asyncio"
-                    ) from e
-        raise
+        import nest_asyncio
+    except ImportError:
+        coro.close()
+        raise RuntimeError(
+            "run_async was called from a running event loop. Please install "
+            "nest-asyncio: pip install nest-asyncio"
+        )
+    nest_asyncio.apply()
+    return asyncio.get_running_loop().run_until_complete(coro)
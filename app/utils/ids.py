@@ -0,0 +1,26 @@
+"""Time-ordered UUIDs for database primary keys."""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate an RFC 9562 version 7 UUID.
+    
+    The top 48 bits are the Unix time in milliseconds, so newer ids sort
+    after older ones and primary key inserts append to the right-hand
+    side of the btree instead of landing on a random leaf page.
+    
+    Returns:
+        A new UUID whose remaining 74 non-version/variant bits are random
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    
+    # Version 7 in bits 76-79, RFC 4122 variant (0b10) in bits 62-63
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    
+    return uuid.UUID(int=value)
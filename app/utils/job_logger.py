@@ -1,13 +1,13 @@
 """Utility for logging job activities to the database."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any, Union
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
-import json
+from sqlalchemy import select, insert
 import uuid
 
 from app.models.job import Job
+from app.models.job_log import JobLog
 
 
 async def add_job_log(
@@ -18,7 +18,10 @@ async def add_job_log(
     details: Optional[Dict[str, Any]] = None
 ) -> None:
     """
-    Add a log entry to a job's logs array.
+    Append a log entry for a job.
+    
+    Each entry is its own job_logs row, so appending never rewrites
+    earlier entries.
     
     Args:
         session: Database session
@@ -27,48 +30,34 @@ async def add_job_log(
         message: Log message
         details: Optional additional details as dict
     
-    Returns silently if logs column doesn't exist yet.
+    Returns silently if the job_logs table doesn't exist yet.
     """
     try:
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "level": level,
-            "message": message,
-            "details": details or {}
-        }
-        
         # Convert string UUID to UUID object if needed
         if isinstance(job_id, str):
             job_id = uuid.UUID(job_id)
         
-        # Check if logs column exists by trying to access it
-        # If it doesn't exist, this will fail gracefully
+        # If the table doesn't exist yet, this will fail gracefully
         from sqlalchemy.exc import ProgrammingError
         
         try:
-            # Get current logs
-            result = await session.execute(
-                select(Job.logs).where(Job.job_id == job_id)
-            )
-            current_logs = result.scalar_one_or_none() or []
-            
-            # Append new log entry
-            updated_logs = current_logs + [log_entry]
-            
-            # Update job with new logs
             await session.execute(
-                update(Job)
-                .where(Job.job_id == job_id)
-                .values(logs=updated_logs)
+                insert(JobLog).values(
+                    job_id=job_id,
+                    ts=datetime.now(timezone.utc),
+                    level=level,
+                    message=message,
+                    details=details or {}
+                )
             )
         except ProgrammingError as e:
-            # Column doesn't exist yet - rollback and continue
+            # Table doesn't exist yet - rollback and continue
             await session.rollback()
             # Log to console as fallback
             import structlog
             logger = structlog.get_logger()
             logger.warning(
-                "Cannot log to database - logs column doesn't exist",
+                "Cannot log to database - job_logs table doesn't exist",
                 job_id=str(job_id),
                 level=level,
                 message=message
@@ -81,14 +70,33 @@ async def add_job_log(
         logger.warning(f"Failed to add job log: {e}", job_id=str(job_id))
 
 
-async def get_job_logs(session: AsyncSession, job_id: Union[str, uuid.UUID]) -> list:
-    """Get all logs for a job."""
+async def get_job_logs(
+    session: AsyncSession,
+    job_id: Union[str, uuid.UUID],
+    limit: Optional[int] = None
+) -> list:
+    """
+    Get logs for a job, oldest first.
+    
+    Entries written before job_logs existed are read from the legacy
+    Job.logs array and come first. With limit, only the newest entries
+    from job_logs are returned.
+    """
     # Convert string UUID to UUID object if needed
     if isinstance(job_id, str):
         job_id = uuid.UUID(job_id)
     
-    result = await session.execute(
+    query = select(JobLog).where(JobLog.job_id == job_id).order_by(JobLog.ts.desc())
+    if limit:
+        query = query.limit(limit)
+    
+    result = await session.execute(query)
+    entries = [entry.to_dict() for entry in reversed(result.scalars().all())]
+    
+    if limit:
+        return entries
+    
+    legacy = await session.execute(
         select(Job.logs).where(Job.job_id == job_id)
     )
-    logs = result.scalar_one_or_none() or []
-    return logs
+    return (legacy.scalar_one_or_none() or []) + entries
@@ -0,0 +1,56 @@
+"""Throttled Celery progress reporting."""
+
+import time
+
+
+class ProgressReporter:
+    """
+    Coalesce a task's PROGRESS updates.
+    
+    Every update_state call is a write to the result backend, so loops
+    report through this instead: an update is only sent once `every`
+    items have completed or `interval` seconds have passed since the
+    last one, and always when forced (e.g. for the final item).
+    """
+    
+    def __init__(self, task, task_id: str = None, every: int = 5, interval: float = 1.0):
+        self.task = task
+        # Pass the id when reporting from a thread other than the task's
+        # own: Celery's Task.request is thread-local
+        self.task_id = task_id
+        self.every = every
+        self.interval = interval
+        self._last_current = 0
+        self._last_sent = time.monotonic()
+    
+    def update(self, current: int, total: int, force: bool = False, **meta) -> bool:
+        """
+        Report progress if it is due.
+        
+        Args:
+            current: Items completed so far
+            total: Total items
+            force: Send regardless of the throttle
+            **meta: Extra fields for the PROGRESS meta
+        
+        Returns:
+            True if an update was sent
+        """
+        now = time.monotonic()
+        due = (
+            force
+            or current >= total
+            or current - self._last_current >= self.every
+            or now - self._last_sent >= self.interval
+        )
+        if not due:
+            return False
+        
+        self.task.update_state(
+            task_id=self.task_id,
+            state="PROGRESS",
+            meta={"current": current, "total": total, **meta}
+        )
+        self._last_current = current
+        self._last_sent = now
+        return True
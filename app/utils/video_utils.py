@@ -2,13 +2,28 @@
 
 from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
+import os
 import subprocess
 import json
+import uuid
 import structlog
 
 logger = structlog.get_logger()
 
 
+def temp_output_path(path) -> Path:
+    """
+    Unique sibling path to write a cache file to before moving it into place.
+    
+    Writers render here and os.replace() the result onto `path` only on
+    success, so a concurrent reader or a killed worker never sees a
+    truncated file at the final path. The real extension stays last so
+    FFmpeg and Pillow still infer the format.
+    """
+    path = Path(path)
+    return path.with_name(f"{path.stem}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp{path.suffix}")
+
+
 def get_video_info(video_path: str) -> Optional[Dict[str, Any]]:
     """
     Get detailed video information using ffprobe.
@@ -71,6 +86,57 @@ def get_video_info(video_path: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def get_stream_params(video_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Get the first video and audio stream parameters using ffprobe.
+    
+    These are the parameters that must match for files to be joined with
+    the concat demuxer without re-encoding.
+    """
+    try:
+        cmd = [
+            "ffprobe",
+            "-v", "quiet",
+            "-print_format", "json",
+            "-show_entries",
+            "stream=codec_type,codec_name,width,height,r_frame_rate,pix_fmt,sample_rate,channels",
+            video_path
+        ]
+        
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        
+        if result.returncode != 0:
+            logger.error("ffprobe failed", path=video_path, error=result.stderr)
+            return None
+        
+        streams = json.loads(result.stdout).get("streams", [])
+        video = next((s for s in streams if s.get("codec_type") == "video"), {})
+        audio = next((s for s in streams if s.get("codec_type") == "audio"), {})
+        
+        return {
+            "video_codec": video.get("codec_name"),
+            "width": video.get("width"),
+            "height": video.get("height"),
+            "r_frame_rate": video.get("r_frame_rate"),
+            "pix_fmt": video.get("pix_fmt"),
+            "audio_codec": audio.get("codec_name"),
+            "sample_rate": audio.get("sample_rate"),
+            "channels": audio.get("channels")
+        }
+        
+    except subprocess.TimeoutExpired:
+        logger.error("ffprobe timed out", path=video_path)
+        return None
+    except Exception as e:
+        logger.error("Failed to get stream params", path=video_path, error=str(e))
+        return None
+
+
 def extract_audio(
     video_path: str,
     output_path: str = None,
@@ -0,0 +1,79 @@
+"""Add the score/duration CHECK, content_id NOT NULL and one-analysis-per-content constraints."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from app.core.database import engine
+
+
+# NOT VALID adds each CHECK without a full-table scan under an exclusive
+# lock; VALIDATE then scans while allowing concurrent writes.
+CONSTRAINTS = [
+    ("video_analysis", "ck_quality", "quality_score BETWEEN 0 AND 1"),
+    ("video_analysis", "ck_virality", "virality_score BETWEEN 0 AND 1"),
+    ("video_analysis", "ck_relevance", "relevance_score BETWEEN 0 AND 1"),
+    ("downloaded_videos", "ck_duration", "duration_seconds > 0"),
+]
+
+
+async def add_constraints():
+    """Clean up out-of-range rows and add the constraints if missing."""
+    try:
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            # Unknown durations used to be stored as 0
+            await conn.execute(text(
+                "UPDATE downloaded_videos SET duration_seconds = NULL WHERE duration_seconds <= 0"
+            ))
+            
+            for table, name, condition in CONSTRAINTS:
+                result = await conn.execute(
+                    text("SELECT 1 FROM pg_constraint WHERE conname = :name"),
+                    {"name": name}
+                )
+                if result.scalar() is not None:
+                    print(f"[OK] Constraint '{name}' already exists")
+                    continue
+                
+                await conn.execute(text(
+                    f"ALTER TABLE {table} ADD CONSTRAINT {name} CHECK ({condition}) NOT VALID"
+                ))
+                await conn.execute(text(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}"))
+                print(f"[OK] Constraint '{name}' added")
+            
+            for table in ("video_analysis", "downloaded_videos"):
+                await conn.execute(text(
+                    f"ALTER TABLE {table} ALTER COLUMN content_id SET NOT NULL"
+                ))
+            print("[OK] content_id is NOT NULL")
+            
+            # Keep only the newest analysis per content before enforcing uniqueness
+            await conn.execute(text("""
+                DELETE FROM video_analysis va
+                USING video_analysis newer
+                WHERE newer.content_id = va.content_id
+                  AND (newer.analyzed_at, newer.analysis_id) > (va.analyzed_at, va.analysis_id)
+            """))
+            await conn.execute(text(
+                "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_analysis_content "
+                "ON video_analysis(content_id)"
+            ))
+            print("[OK] video_analysis.content_id is unique")
+    except Exception as e:
+        print(f"[ERROR] Error: {e}")
+        print("\nMake sure:")
+        print("1. PostgreSQL is running")
+        print("2. Database connection is configured correctly")
+        print("3. Every existing score is between 0 and 1")
+        sys.exit(1)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(add_constraints())
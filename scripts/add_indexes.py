@@ -0,0 +1,135 @@
+"""Add performance indexes to an existing database."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from app.core.database import engine
+
+
+# Schema objects the indexes reference, and the script that creates each
+PREREQUISITES = [
+    (
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_name = 'platform_content' AND column_name = 'platform_id'",
+        "scripts/convert_platform_ids.py"
+    ),
+    (
+        "SELECT 1 FROM information_schema.tables WHERE table_name = 'platform_content_extra'",
+        "scripts/split_platform_content_extra.py"
+    ),
+]
+
+# CONCURRENTLY avoids locking the tables against writes while the
+# indexes build, but cannot run inside a transaction block.
+INDEXES = [
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pc_job_trending
+    ON platform_content(job_id, trending_score DESC)
+    INCLUDE (content_id, url, title, author, platform_id)
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_va_recommended_scores
+    ON video_analysis(content_id)
+    INCLUDE (quality_score, relevance_score)
+    WHERE recommended = true
+    """,
+    # Superseded: carried the whole visual_analysis document in the index
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_va_content_recommended",
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_dv_content_haspath
+    ON downloaded_videos(content_id)
+    INCLUDE (local_path, duration_seconds)
+    """,
+    # jsonb_path_ops GIN indexes serve @> containment filters only
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_platform_content_metadata_gin
+    ON platform_content_extra USING GIN (metadata jsonb_path_ops)
+    """,
+    # Job filters extract config scalars with ->>, which needs btree
+    # expression indexes (replaces the earlier idx_job_config_gin)
+    """
+    DROP INDEX CONCURRENTLY IF EXISTS idx_job_config_gin
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_niche
+    ON jobs((config->>'niche'))
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_timeframe_status
+    ON jobs((config->>'timeframe'), status)
+    """,
+    # Trending lists filter out unscored rows and scan discovered_at ranges
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trending_covering
+    ON platform_content(trending_score DESC)
+    INCLUDE (content_id, platform_id, url, title, author, views, likes, discovered_at)
+    WHERE trending_score IS NOT NULL
+    """,
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_trending_recent",
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_discovered_at_brin
+    ON platform_content USING BRIN (discovered_at)
+    """,
+    # Tag/topic containment (@>) lookups on the text arrays
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_output_tags_gin
+    ON output_videos USING GIN (tags)
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_analysis_topics_gin
+    ON video_analysis USING GIN (detected_topics)
+    """,
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_trending_score",
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_content_trending",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_platform_content_trending_score",
+    # Single-column indexes whose column already leads a composite index
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_user_id",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_platform_content_job_id",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_video_analysis_content_id",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_downloaded_videos_content_id",
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_download_content",
+    # Only affects values written from now on
+    "ALTER TABLE video_analysis ALTER COLUMN visual_analysis SET COMPRESSION lz4",
+    # Index-only scans need an up-to-date visibility map
+    "VACUUM (ANALYZE) platform_content",
+]
+
+
+async def add_indexes():
+    """Create the indexes if they don't exist."""
+    try:
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            
+            missing = []
+            for query, script in PREREQUISITES:
+                result = await conn.execute(text(query))
+                if result.scalar() is None:
+                    missing.append(script)
+            if missing:
+                print("[ERROR] Run these migrations before add_indexes.py:")
+                for script in missing:
+                    print(f"  python {script}")
+                sys.exit(1)
+            
+            for statement in INDEXES:
+                await conn.execute(text(statement))
+        print("[OK] Indexes are in place")
+    except Exception as e:
+        print(f"[ERROR] Error: {e}")
+        print("\nMake sure:")
+        print("1. PostgreSQL is running")
+        print("2. Database connection is configured correctly")
+        print("3. You have permissions to create indexes")
+        sys.exit(1)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(add_indexes())
@@ -0,0 +1,65 @@
+"""Convert jobs.status and jobs.job_type to native PostgreSQL enums."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from app.core.database import engine
+from app.models.job import JobStatus, JobType
+
+
+def _enum_literal(enum_cls) -> str:
+    return ", ".join(f"'{member.value}'" for member in enum_cls)
+
+
+async def convert_job_enums():
+    """Create the enum types and retype the jobs columns if needed."""
+    try:
+        async with engine.begin() as conn:
+            for type_name, column, enum_cls in (
+                ("job_status", "status", JobStatus),
+                ("job_type", "job_type", JobType),
+            ):
+                # Check if column is already converted
+                result = await conn.execute(text("""
+                    SELECT data_type
+                    FROM information_schema.columns
+                    WHERE table_name='jobs' AND column_name=:column
+                """), {"column": column})
+                
+                if result.scalar() == "USER-DEFINED":
+                    print(f"[OK] Column '{column}' is already {type_name}")
+                    continue
+                
+                print(f"Converting jobs.{column} to {type_name}...")
+                await conn.execute(text(
+                    f"CREATE TYPE {type_name} AS ENUM ({_enum_literal(enum_cls)})"
+                ))
+                await conn.execute(text(f"ALTER TABLE jobs ALTER COLUMN {column} DROP DEFAULT"))
+                await conn.execute(text(
+                    f"ALTER TABLE jobs ALTER COLUMN {column} "
+                    f"TYPE {type_name} USING {column}::{type_name}"
+                ))
+                if column == "status":
+                    await conn.execute(text(
+                        f"ALTER TABLE jobs ALTER COLUMN status "
+                        f"SET DEFAULT '{JobStatus.PENDING.value}'"
+                    ))
+                print(f"[OK] Column '{column}' converted")
+    except Exception as e:
+        print(f"[ERROR] Error: {e}")
+        print("\nMake sure:")
+        print("1. PostgreSQL is running")
+        print("2. Database connection is configured correctly")
+        print("3. Every existing status/job_type value is a member of the enum")
+        sys.exit(1)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(convert_job_enums())
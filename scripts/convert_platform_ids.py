@@ -0,0 +1,89 @@
+"""Convert platform_content.platform to a SMALLINT platform_id lookup."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from app.core.database import engine
+from app.models.platform import PLATFORM_IDS
+
+
+async def convert_platform_ids():
+    """Create and seed platforms, then move platform_content onto platform_id."""
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("""
+                CREATE TABLE IF NOT EXISTS platforms (
+                    platform_id SMALLINT PRIMARY KEY,
+                    name TEXT NOT NULL UNIQUE
+                )
+            """))
+            for name, platform_id in PLATFORM_IDS.items():
+                await conn.execute(
+                    text(
+                        "INSERT INTO platforms (platform_id, name) "
+                        "VALUES (:platform_id, :name) ON CONFLICT DO NOTHING"
+                    ),
+                    {"platform_id": platform_id, "name": name}
+                )
+            
+            # Check if column is already converted
+            result = await conn.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name='platform_content' AND column_name='platform'
+            """))
+            
+            if result.scalar() is None:
+                print("[OK] Column 'platform' is already converted to 'platform_id'")
+                return
+            
+            print("Converting platform_content.platform to platform_id...")
+            await conn.execute(text(
+                "ALTER TABLE platform_content ADD COLUMN IF NOT EXISTS platform_id SMALLINT"
+            ))
+            await conn.execute(text("""
+                UPDATE platform_content pc
+                SET platform_id = p.platform_id
+                FROM platforms p
+                WHERE p.name = pc.platform
+            """))
+            await conn.execute(text("""
+                ALTER TABLE platform_content
+                ALTER COLUMN platform_id SET NOT NULL,
+                ADD FOREIGN KEY (platform_id) REFERENCES platforms(platform_id)
+            """))
+            # Dropping the text column also drops every index and the unique
+            # constraint built on it; rebuild them on platform_id
+            await conn.execute(text("ALTER TABLE platform_content DROP COLUMN platform"))
+            await conn.execute(text("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_platform_video
+                ON platform_content(platform_id, platform_video_id)
+            """))
+            await conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_job_platform
+                ON platform_content(job_id, platform_id)
+            """))
+            await conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_pc_job_trending
+                ON platform_content(job_id, trending_score DESC)
+                INCLUDE (content_id, url, title, author, platform_id)
+            """))
+            print("[OK] Column 'platform' converted")
+    except Exception as e:
+        print(f"[ERROR] Error: {e}")
+        print("\nMake sure:")
+        print("1. PostgreSQL is running")
+        print("2. Database connection is configured correctly")
+        print("3. Every existing platform value is one of: " + ", ".join(PLATFORM_IDS))
+        sys.exit(1)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(convert_platform_ids())
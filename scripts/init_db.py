@@ -11,7 +11,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from app.core.database import engine, Base
 from app.models import (
     Job,
+    JobLog,
+    Platform,
     PlatformContent,
+    PlatformContentExtra,
     VideoAnalysis,
     DownloadedVideo,
     OutputVideo,
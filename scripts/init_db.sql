@@ -4,12 +4,27 @@
 -- Enable UUID extension
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
+-- Job enums
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'job_status') THEN
+        CREATE TYPE job_status AS ENUM (
+            'pending', 'discovering', 'discovered', 'analyzing', 'analyzed',
+            'downloading', 'editing', 'completed', 'failed'
+        );
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'job_type') THEN
+        CREATE TYPE job_type AS ENUM ('ranking', 'compilation', 'highlights', 'discovery');
+    END IF;
+END
+$$;
+
 -- Jobs table
 CREATE TABLE IF NOT EXISTS jobs (
     job_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     user_id VARCHAR(255) NOT NULL,
-    job_type VARCHAR(50) NOT NULL,
-    status VARCHAR(50) DEFAULT 'pending',
+    job_type job_type NOT NULL,
+    status job_status DEFAULT 'pending',
     config JSONB NOT NULL,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
@@ -19,16 +34,39 @@ CREATE TABLE IF NOT EXISTS jobs (
 
 CREATE INDEX IF NOT EXISTS idx_jobs_user_status ON jobs(user_id, status);
 CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_job_niche ON jobs((config->>'niche'));
+CREATE INDEX IF NOT EXISTS idx_job_timeframe_status ON jobs((config->>'timeframe'), status);
+
+-- Job log entries (append-only)
+CREATE TABLE IF NOT EXISTS job_logs (
+    log_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    job_id UUID NOT NULL REFERENCES jobs(job_id) ON DELETE CASCADE,
+    ts TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    level VARCHAR(20) NOT NULL,
+    message TEXT NOT NULL,
+    details JSONB
+);
+
+CREATE INDEX IF NOT EXISTS idx_job_logs_job_ts ON job_logs(job_id, ts);
+
+-- Platform lookup table
+CREATE TABLE IF NOT EXISTS platforms (
+    platform_id SMALLINT PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+INSERT INTO platforms (platform_id, name) VALUES
+    (1, 'youtube'), (2, 'tiktok'), (3, 'instagram'), (4, 'snapchat')
+ON CONFLICT DO NOTHING;
 
 -- Platform content table
 CREATE TABLE IF NOT EXISTS platform_content (
     content_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     job_id UUID REFERENCES jobs(job_id) ON DELETE CASCADE,
-    platform VARCHAR(50) NOT NULL,
+    platform_id SMALLINT NOT NULL REFERENCES platforms(platform_id),
     platform_video_id VARCHAR(255) NOT NULL,
     url TEXT NOT NULL,
     title TEXT,
-    description TEXT,
     author VARCHAR(255),
     views BIGINT,
     likes BIGINT,
@@ -36,37 +74,57 @@ CREATE TABLE IF NOT EXISTS platform_content (
     duration_seconds INTEGER,
     upload_date TIMESTAMP WITH TIME ZONE,
     trending_score FLOAT,
-    metadata JSONB,
     discovered_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    UNIQUE(platform, platform_video_id)
+    UNIQUE(platform_id, platform_video_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_content_job_platform ON platform_content(job_id, platform_id);
+CREATE INDEX IF NOT EXISTS idx_trending_covering ON platform_content(trending_score DESC)
+    INCLUDE (content_id, platform_id, url, title, author, views, likes, discovered_at)
+    WHERE trending_score IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_discovered_at_brin ON platform_content USING BRIN (discovered_at);
+CREATE INDEX IF NOT EXISTS idx_pc_job_trending ON platform_content(job_id, trending_score DESC)
+    INCLUDE (content_id, url, title, author, platform_id);
+
+-- Cold platform content columns, kept out of the trending scans
+CREATE TABLE IF NOT EXISTS platform_content_extra (
+    content_id UUID PRIMARY KEY REFERENCES platform_content(content_id) ON DELETE CASCADE,
+    description TEXT,
+    metadata JSONB
 );
 
-CREATE INDEX IF NOT EXISTS idx_content_job_platform ON platform_content(job_id, platform);
-CREATE INDEX IF NOT EXISTS idx_content_trending ON platform_content(trending_score DESC);
+CREATE INDEX IF NOT EXISTS idx_platform_content_metadata_gin ON platform_content_extra USING GIN (metadata jsonb_path_ops);
 
 -- Video analysis table
 CREATE TABLE IF NOT EXISTS video_analysis (
     analysis_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    content_id UUID REFERENCES platform_content(content_id) ON DELETE CASCADE,
+    content_id UUID NOT NULL REFERENCES platform_content(content_id) ON DELETE CASCADE,
     ai_model VARCHAR(100) NOT NULL,
     quality_score FLOAT,
     virality_score FLOAT,
     relevance_score FLOAT,
     content_summary TEXT,
     detected_topics TEXT[],
-    visual_analysis JSONB,
+    visual_analysis JSONB COMPRESSION lz4,
     sentiment VARCHAR(50),
     recommended BOOLEAN DEFAULT FALSE,
-    analyzed_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+    analyzed_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT ck_quality CHECK (quality_score BETWEEN 0 AND 1),
+    CONSTRAINT ck_virality CHECK (virality_score BETWEEN 0 AND 1),
+    CONSTRAINT ck_relevance CHECK (relevance_score BETWEEN 0 AND 1)
 );
 
+CREATE UNIQUE INDEX IF NOT EXISTS uq_analysis_content ON video_analysis(content_id);
 CREATE INDEX IF NOT EXISTS idx_analysis_recommended ON video_analysis(content_id, recommended);
 CREATE INDEX IF NOT EXISTS idx_analysis_scores ON video_analysis(quality_score, virality_score, relevance_score);
+CREATE INDEX IF NOT EXISTS idx_analysis_topics_gin ON video_analysis USING GIN (detected_topics);
+CREATE INDEX IF NOT EXISTS idx_va_recommended_scores ON video_analysis(content_id)
+    INCLUDE (quality_score, relevance_score) WHERE recommended = true;
 
 -- Downloaded videos table
 CREATE TABLE IF NOT EXISTS downloaded_videos (
     download_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    content_id UUID REFERENCES platform_content(content_id) ON DELETE CASCADE,
+    content_id UUID NOT NULL REFERENCES platform_content(content_id) ON DELETE CASCADE,
     local_path TEXT NOT NULL,
     s3_path TEXT,
     file_size_bytes BIGINT,
@@ -74,10 +132,12 @@ CREATE TABLE IF NOT EXISTS downloaded_videos (
     format VARCHAR(20),
     fps INTEGER,
     duration_seconds FLOAT,
-    downloaded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+    downloaded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT ck_duration CHECK (duration_seconds > 0)
 );
 
-CREATE INDEX IF NOT EXISTS idx_download_content ON downloaded_videos(content_id);
+CREATE INDEX IF NOT EXISTS idx_dv_content_haspath ON downloaded_videos(content_id)
+    INCLUDE (local_path, duration_seconds);
 
 -- Output videos table
 CREATE TABLE IF NOT EXISTS output_videos (
@@ -98,6 +158,7 @@ CREATE TABLE IF NOT EXISTS output_videos (
 );
 
 CREATE INDEX IF NOT EXISTS idx_output_job ON output_videos(job_id);
+CREATE INDEX IF NOT EXISTS idx_output_tags_gin ON output_videos USING GIN (tags);
 
 -- Customization presets table
 CREATE TABLE IF NOT EXISTS customization_presets (
@@ -88,7 +88,7 @@ async def seed_platform_content():
             duration_seconds=random.randint(15, 60),
             upload_date=upload_date,
             trending_score=random.uniform(0.3, 0.95),
-            metadata={
+            extra={
                 "niche": niche,
                 "hashtags": [f"#{niche}", "#viral", "#shorts"]
             }
@@ -0,0 +1,65 @@
+"""Move platform_content.description/metadata into platform_content_extra."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from app.core.database import engine
+
+
+async def split_platform_content_extra():
+    """Create platform_content_extra, copy the cold columns over and drop them."""
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("""
+                CREATE TABLE IF NOT EXISTS platform_content_extra (
+                    content_id UUID PRIMARY KEY
+                        REFERENCES platform_content(content_id) ON DELETE CASCADE,
+                    description TEXT,
+                    metadata JSONB
+                )
+            """))
+            
+            # Check if columns were already moved
+            result = await conn.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name='platform_content' AND column_name='metadata'
+            """))
+            
+            if result.scalar() is None:
+                print("[OK] platform_content is already split")
+                return
+            
+            print("Copying description/metadata into platform_content_extra...")
+            await conn.execute(text("""
+                INSERT INTO platform_content_extra (content_id, description, metadata)
+                SELECT content_id, description, metadata
+                FROM platform_content
+                ON CONFLICT (content_id) DO NOTHING
+            """))
+            # Also drops idx_platform_content_metadata_gin on the old column
+            await conn.execute(text(
+                "ALTER TABLE platform_content DROP COLUMN description, DROP COLUMN metadata"
+            ))
+            await conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_platform_content_metadata_gin
+                ON platform_content_extra USING GIN (metadata jsonb_path_ops)
+            """))
+            print("[OK] platform_content split")
+    except Exception as e:
+        print(f"[ERROR] Error: {e}")
+        print("\nMake sure:")
+        print("1. PostgreSQL is running")
+        print("2. Database connection is configured correctly")
+        sys.exit(1)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(split_platform_content_extra())
@@ -0,0 +1,208 @@
+"""Tests for the content pool analysis pipeline"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch, MagicMock
+
+
+def _content(n):
+    """Content row as selected by process_content_pool"""
+    return SimpleNamespace(
+        content_id=f"content-{n}",
+        url=f"https://example.com/{n}",
+        platform_video_id=f"video-{n}",
+        title=f"Video {n}",
+        description="",
+        views=100,
+        likes=10,
+        comments=1,
+        upload_date=None
+    )
+
+
+def _download(n, success=True):
+    """DownloadResult-like object for content n"""
+    return SimpleNamespace(
+        success=success,
+        local_path=f"/tmp/video-{n}.mp4",
+        file_size_bytes=1024,
+        resolution="1080x1920",
+        format="mp4",
+        fps=30.0,
+        duration_seconds=20.0,
+        error=None if success else "unavailable"
+    )
+
+
+def _quality_checker(failing=()):
+    """Quality checker whose check_batch fails the given paths"""
+    checker = MagicMock()
+    checker.check_batch.side_effect = lambda paths: {
+        path: SimpleNamespace(passed=path not in failing, issues=["blurry"] if path in failing else [])
+        for path in paths
+    }
+    return checker
+
+
+def _analyzer(recommended=True):
+    """Vision analyzer returning one fixed result"""
+    analysis = MagicMock()
+    analysis.recommended = recommended
+    analysis.visual_quality_score = 0.8
+    analysis.relevance_score = 0.7
+    analysis.virality_potential = 0.6
+    analysis.caption_suggestion = "caption"
+    analysis.detected_topics = ["topic"]
+    analysis.sentiment = "positive"
+    analysis.to_dict.return_value = {}
+    
+    analyzer = MagicMock()
+    analyzer.analyze_video = AsyncMock(return_value=analysis)
+    return analyzer
+
+
+def _written_rows(session):
+    """All rows passed to session.execute, in call order"""
+    return [row for call in session.execute.call_args_list for row in call.args[1]]
+
+
+class TestRunPipeline:
+    """Test the download/analysis/writer pipeline"""
+    
+    @pytest.mark.asyncio
+    async def test_counts_and_rows(self):
+        """Test failed downloads and quality checks are counted and written correctly"""
+        from app.config import settings
+        from app.tasks.analysis_tasks import _run_pipeline
+        
+        pending = [_content(n) for n in range(4)]
+        downloader = MagicMock()
+        downloader.download_video = AsyncMock(
+            side_effect=[_download(0), _download(1, success=False), _download(2), _download(3)]
+        )
+        session = AsyncMock()
+        
+        with patch.object(settings, "analysis_concurrency", 2), \
+             patch.object(settings, "analysis_flush_seconds", 30.0):
+            counts = await _run_pipeline(
+                session,
+                pending,
+                downloader=downloader,
+                analyzer=_analyzer(),
+                quality_checker=_quality_checker(failing={"/tmp/video-3.mp4"}),
+                niche="gaming",
+                model_name="free-vision"
+            )
+        
+        assert counts == {"downloaded": 3, "analyzed": 2, "recommended": 2}
+        
+        rows = _written_rows(session)
+        downloads = [row for row in rows if "local_path" in row]
+        analyses = [row for row in rows if "ai_model" in row]
+        assert len(downloads) == 3
+        assert sorted(row["ai_model"] for row in analyses) == ["free-vision", "free-vision", "quality_check"]
+    
+    @pytest.mark.asyncio
+    async def test_sentinels_shut_down_pipeline(self):
+        """Test the pipeline finishes once every worker has seen its sentinel"""
+        from app.config import settings
+        from app.tasks.analysis_tasks import _run_pipeline
+        
+        pending = [_content(n) for n in range(3)]
+        downloader = MagicMock()
+        downloader.download_video = AsyncMock(side_effect=[_download(n) for n in range(3)])
+        session = AsyncMock()
+        progress = []
+        
+        with patch.object(settings, "analysis_concurrency", 8), \
+             patch.object(settings, "analysis_flush_seconds", 30.0):
+            counts = await asyncio.wait_for(
+                _run_pipeline(
+                    session,
+                    pending,
+                    downloader=downloader,
+                    analyzer=_analyzer(recommended=False),
+                    quality_checker=_quality_checker(),
+                    niche="gaming",
+                    model_name="free-vision",
+                    on_progress=lambda *args: progress.append(args)
+                ),
+                timeout=5
+            )
+        
+        assert counts == {"downloaded": 3, "analyzed": 3, "recommended": 0}
+        # Everything fit in one batch, which is left for the caller to commit
+        session.commit.assert_not_called()
+        assert progress[-1] == (3, 3, True)
+    
+    @pytest.mark.asyncio
+    async def test_empty_pending(self):
+        """Test an empty pool still shuts down cleanly"""
+        from app.tasks.analysis_tasks import _run_pipeline
+        
+        downloader = MagicMock()
+        downloader.download_video = AsyncMock()
+        session = AsyncMock()
+        
+        counts = await asyncio.wait_for(
+            _run_pipeline(
+                session,
+                [],
+                downloader=downloader,
+                analyzer=_analyzer(),
+                quality_checker=_quality_checker(),
+                niche="gaming",
+                model_name="free-vision"
+            ),
+            timeout=5
+        )
+        
+        assert counts == {"downloaded": 0, "analyzed": 0, "recommended": 0}
+        downloader.download_video.assert_not_called()
+        session.execute.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_failed_writer_cancels_other_stages(self):
+        """Test a failing stage cancels the stages still waiting"""
+        from app.config import settings
+        from app.tasks.analysis_tasks import _run_pipeline
+        
+        never = asyncio.Event()
+        cancelled = asyncio.Event()
+        calls = 0
+        
+        async def download_video(url, video_id, content_id):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return _download(0)
+            try:
+                await never.wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        
+        downloader = MagicMock()
+        downloader.download_video = download_video
+        session = AsyncMock()
+        session.execute.side_effect = RuntimeError("database unavailable")
+        
+        with patch.object(settings, "analysis_concurrency", 1), \
+             patch.object(settings, "analysis_flush_seconds", 30.0):
+            with pytest.raises(RuntimeError, match="database unavailable"):
+                await asyncio.wait_for(
+                    _run_pipeline(
+                        session,
+                        [_content(n) for n in range(3)],
+                        downloader=downloader,
+                        analyzer=_analyzer(),
+                        quality_checker=_quality_checker(),
+                        niche="gaming",
+                        model_name="free-vision"
+                    ),
+                    timeout=5
+                )
+        
+        # The blocked download is cancelled rather than left running
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
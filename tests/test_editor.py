@@ -197,3 +197,134 @@ class TestHexToRgb:
             
             # Without hash
             assert editor._hex_to_rgb("00FF00") == (0, 255, 0)
+
+
+class TestFFmpegPipeline:
+    """Test FFmpeg filter graph construction"""
+    
+    def test_build_command_concats_all_segments(self):
+        """Test every probed segment feeds the concat filter"""
+        from app.core.editor.ffmpeg_pipeline import FFmpegPipeline, PipelineSegment
+        
+        info = {"duration": 10.0, "has_audio": True}
+        with patch('app.core.editor.ffmpeg_pipeline.get_video_info', return_value=info), \
+                patch.object(FFmpegPipeline, '_render_sprite', return_value="rank.png"):
+            pipeline = FFmpegPipeline()
+            cmd = pipeline.build_command(
+                [PipelineSegment(path="a.mp4", rank=2), PipelineSegment(path="b.mp4", rank=1)],
+                "out.mp4"
+            )
+        
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert "[v0][a0][v1][a1]concat=n=2:v=1:a=1[outv][outa]" in graph
+        assert "[base0][spr0_0]overlay=x=30:y=30:shortest=1" in graph
+        assert cmd.count("rank.png") == 2
+        assert cmd[-1] == "out.mp4"
+    
+    def test_build_command_no_readable_clips(self):
+        """Test None is returned when no clip can be probed"""
+        from app.core.editor.ffmpeg_pipeline import FFmpegPipeline, PipelineSegment
+        
+        with patch('app.core.editor.ffmpeg_pipeline.get_video_info', return_value=None):
+            pipeline = FFmpegPipeline()
+            assert pipeline.build_command([PipelineSegment(path="a.mp4")], "out.mp4") is None
+
+
+class TestEffectsFilterChains:
+    """Test EffectSettings to FFmpeg filter translation"""
+    
+    def test_color_correction_single_eq(self):
+        """Test color settings collapse into one eq filter"""
+        from app.core.editor.effects import EffectsEngine, EffectSettings
+        
+        video, audio = EffectsEngine().build_filter_chains(
+            EffectSettings(brightness=1.2, contrast=1.1, saturation=1.3, normalize_audio=False)
+        )
+        
+        assert video == "eq=brightness=0.1000:contrast=1.1000:saturation=1.3000"
+        assert audio == ""
+    
+    def test_defaults_only_normalize_audio(self):
+        """Test default settings produce no video filters"""
+        from app.core.editor.effects import EffectsEngine
+        
+        video, audio = EffectsEngine().build_filter_chains()
+        
+        assert video == ""
+        assert audio == "loudnorm"
+
+
+class TestCompositorFilterComplex:
+    """Test compositor overlay and transition graph"""
+    
+    def test_xfade_offsets_accumulate(self):
+        """Test each xfade starts one overlap before the running length"""
+        from app.core.editor.compositor import VideoCompositor, ClipConfig
+        
+        with patch('app.core.editor.compositor.settings') as mock_settings, \
+                patch.object(VideoCompositor, '_render_overlay_sprite', return_value="rank.png"):
+            mock_settings.local_storage_path = "./storage"
+            compositor = VideoCompositor()
+            
+            entries = [
+                (ClipConfig(path="a.mp4", rank=2), 10.0, True),
+                (ClipConfig(path="b.mp4", rank=1), 8.0, False),
+                (ClipConfig(path="c.mp4"), 6.0, True),
+            ]
+            graph, sprites, total = compositor._build_filter_complex(entries, 3)
+        
+        assert "[v0][v1]xfade=transition=fadeblack:duration=0.500:offset=9.500[x1]" in graph
+        assert "[x1][v2]xfade=transition=fadeblack:duration=0.500:offset=17.000[x2]" in graph
+        assert "anullsrc=r=44100:cl=stereo,atrim=duration=8.0[a1]" in graph
+        assert total == 23.0
+    
+    def test_identical_sprites_composited_once(self):
+        """Test a sprite shared by several clips is one enabled overlay"""
+        from app.core.editor.compositor import VideoCompositor, ClipConfig
+        
+        with patch('app.core.editor.compositor.settings') as mock_settings, \
+                patch.object(VideoCompositor, '_render_overlay_sprite', return_value="rank.png"):
+            mock_settings.local_storage_path = "./storage"
+            compositor = VideoCompositor()
+            
+            entries = [
+                (ClipConfig(path="a.mp4", rank=2), 10.0, True),
+                (ClipConfig(path="b.mp4", rank=1), 8.0, True),
+            ]
+            graph, sprites, total = compositor._build_filter_complex(entries, 2)
+        
+        assert sprites == ["rank.png"]
+        assert (
+            "[x1][2:v]overlay=x=main_w-overlay_w-40:y=40:"
+            "enable='gte(t,0.000)*lt(t,9.750)+gte(t,9.750)*lt(t,17.500)':shortest=1[ov0]"
+        ) in graph
+    
+    def test_chunked_render_skips_single_pass_encode(self, tmp_path):
+        """Test a chunked render succeeds without running the one-pass FFmpeg command"""
+        from concurrent.futures import ThreadPoolExecutor
+        from app.core.editor.compositor import VideoCompositor, ClipConfig
+        
+        output_path = str(tmp_path / "processed" / "out.mp4")
+        
+        with patch('app.core.editor.compositor.settings') as mock_settings, \
+                patch('app.core.editor.compositor.ProcessPoolExecutor', ThreadPoolExecutor), \
+                patch('app.core.editor.compositor._render_clip_to_tempfile',
+                      side_effect=lambda job, config: job[1]), \
+                patch('app.core.editor.compositor.get_video_info',
+                      return_value={"duration": 5.0, "has_audio": True}), \
+                patch('app.core.editor.compositor.subprocess.run') as mock_run, \
+                patch('app.core.editor.compositor.os.path.getsize', return_value=1024):
+            mock_settings.local_storage_path = str(tmp_path)
+            compositor = VideoCompositor()
+            
+            with patch.object(compositor, '_plan_chunks', return_value=[(0, 1), (1, 2)]), \
+                    patch.object(compositor, '_encode_chunked', return_value=(output_path, 10.0)):
+                result = compositor.render_ranking_video(
+                    [ClipConfig(path="a.mp4", rank=2), ClipConfig(path="b.mp4", rank=1)],
+                    "out.mp4"
+                )
+        
+        assert result.success, result.error
+        assert result.output_path == output_path
+        assert result.duration_seconds == 10.0
+        mock_run.assert_not_called()
@@ -0,0 +1,48 @@
+"""Tests for database model helpers"""
+
+import pytest
+
+
+class TestPlatformType:
+    """Test the platform name <-> SMALLINT id column type"""
+    
+    def test_bind_maps_names_to_ids(self):
+        """Test platform names bind as their ids"""
+        from app.models.platform import PlatformType, PLATFORM_IDS
+        
+        column_type = PlatformType()
+        
+        for name, platform_id in PLATFORM_IDS.items():
+            assert column_type.process_bind_param(name, None) == platform_id
+    
+    def test_bind_passes_ids_and_none_through(self):
+        """Test raw ids and NULLs are bound unchanged"""
+        from app.models.platform import PlatformType
+        
+        column_type = PlatformType()
+        
+        assert column_type.process_bind_param(2, None) == 2
+        assert column_type.process_bind_param(None, None) is None
+    
+    def test_bind_rejects_unknown_platform(self):
+        """Test an unsupported name raises ValueError instead of KeyError"""
+        from app.models.platform import PlatformType
+        
+        with pytest.raises(ValueError, match="Unknown platform 'vimeo'"):
+            PlatformType().process_bind_param("vimeo", None)
+    
+    def test_result_maps_ids_to_names(self):
+        """Test stored ids load back as platform names"""
+        from app.models.platform import PlatformType, PLATFORM_IDS
+        
+        column_type = PlatformType()
+        
+        for name, platform_id in PLATFORM_IDS.items():
+            assert column_type.process_result_value(platform_id, None) == name
+        assert column_type.process_result_value(None, None) is None
+    
+    def test_ids_are_stable(self):
+        """Test existing platform ids are never renumbered"""
+        from app.models.platform import PLATFORM_IDS
+        
+        assert PLATFORM_IDS == {"youtube": 1, "tiktok": 2, "instagram": 3, "snapchat": 4}
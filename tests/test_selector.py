@@ -0,0 +1,45 @@
+"""Tests for content selection scoring"""
+
+import numpy as np
+import pytest
+
+
+def _reference_score(trending, quality, relevance, tw, qw, rw):
+    """Per-clip composite score as ContentSelector computed it before vectorizing"""
+    normalized_trending = trending / 100.0 if trending > 1 else trending
+    return round(normalized_trending * tw + quality * qw + relevance * rw, 4)
+
+
+class TestCompositeScores:
+    """Test the vectorized composite score kernel"""
+    
+    def test_matches_per_clip_formula(self):
+        """Test composite_scores matches the original per-clip calculation"""
+        from app.core.scoring import composite_scores
+        
+        rng = np.random.default_rng(42)
+        trending = np.concatenate([rng.uniform(0, 100, 200), [0.0, 0.5, 1.0, 1.5, 100.0]])
+        quality = rng.uniform(0, 1, len(trending))
+        relevance = rng.uniform(0, 1, len(trending))
+        
+        for weights in [(0.3, 0.4, 0.3), (0.5, 0.25, 0.25), (1.0, 0.0, 0.0)]:
+            scores = composite_scores(trending, quality, relevance, *weights)
+            
+            expected = [
+                _reference_score(t, q, r, *weights)
+                for t, q, r in zip(trending, quality, relevance)
+            ]
+            assert scores == pytest.approx(expected, abs=1e-4)
+    
+    def test_trending_already_normalized(self):
+        """Test trending scores of at most 1 are used as-is"""
+        from app.core.scoring import composite_scores
+        
+        scores = composite_scores(
+            np.array([0.8, 80.0]),
+            np.array([0.5, 0.5]),
+            np.array([0.5, 0.5]),
+            0.5, 0.25, 0.25
+        )
+        
+        assert scores[0] == pytest.approx(scores[1])
@@ -0,0 +1,148 @@
+"""Tests for utility modules"""
+
+from unittest.mock import patch
+
+
+class TestRunAsyncWorkerLoop:
+    """Test run_async on the persistent worker loop"""
+    
+    def test_progress_uses_captured_task_id(self):
+        """Test progress from a coroutine on the loop thread reaches the task's own id"""
+        from celery import Celery
+        from app.utils.async_utils import run_async, start_worker_loop, stop_worker_loop
+        from app.utils.progress import ProgressReporter
+        
+        app = Celery("test_worker_loop", set_as_current=False)
+        seen = {}
+        
+        @app.task(bind=True)
+        def report(self):
+            task_id = self.request.id
+            
+            async def _run():
+                seen["request_id"] = self.request.id
+                ProgressReporter(self, task_id=task_id).update(1, 1)
+                return "done"
+            
+            return run_async(_run())
+        
+        start_worker_loop()
+        try:
+            with patch("celery.app.task.Task.update_state") as mock_update:
+                result = report.apply(task_id="task-123")
+        finally:
+            stop_worker_loop()
+        
+        assert result.get() == "done"
+        # The request context stays on the task's thread
+        assert seen["request_id"] is None
+        mock_update.assert_called_once_with(
+            task_id="task-123",
+            state="PROGRESS",
+            meta={"current": 1, "total": 1}
+        )
+    
+    def test_reuses_thread_loop_without_worker_loop(self):
+        """Test consecutive calls outside a worker share one event loop"""
+        import asyncio
+        from app.utils.async_utils import run_async
+        
+        async def current_loop():
+            return asyncio.get_running_loop()
+        
+        first = run_async(current_loop())
+        second = run_async(current_loop())
+        
+        assert first is second
+        assert not first.is_closed()
+
+
+class TestUuid7:
+    """Test time-ordered UUID generation"""
+    
+    def test_version_and_variant(self):
+        """Test the version 7 and RFC 4122 variant bits are set"""
+        from app.utils.ids import uuid7
+        
+        for _ in range(100):
+            value = uuid7()
+            assert value.version == 7
+            assert (value.int >> 76) & 0xF == 7
+            assert (value.int >> 62) & 0x3 == 0b10
+    
+    def test_timestamp_prefix(self):
+        """Test the top 48 bits hold the current Unix time in milliseconds"""
+        import time
+        from app.utils.ids import uuid7
+        
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        
+        assert before <= value.int >> 80 <= after
+    
+    def test_ordered_across_milliseconds(self):
+        """Test ids from later milliseconds sort after earlier ones"""
+        import time
+        from app.utils.ids import uuid7
+        
+        ids = []
+        for _ in range(5):
+            ids.append(uuid7())
+            time.sleep(0.002)
+        
+        assert ids == sorted(ids)
+        assert [str(value) for value in ids] == sorted(str(value) for value in ids)
+
+
+class TestProgressReporter:
+    """Test throttled progress reporting"""
+    
+    def test_throttles_by_item_count(self):
+        """Test updates are only sent every `every` items"""
+        from unittest.mock import MagicMock
+        from app.utils.progress import ProgressReporter
+        
+        task = MagicMock()
+        progress = ProgressReporter(task, every=5, interval=3600)
+        
+        assert progress.update(1, 20) is False
+        assert progress.update(4, 20) is False
+        assert progress.update(5, 20) is True
+        assert progress.update(9, 20) is False
+        assert progress.update(10, 20) is True
+        assert task.update_state.call_count == 2
+    
+    def test_throttles_by_interval(self):
+        """Test an update is sent once the interval has passed"""
+        from unittest.mock import MagicMock
+        from app.utils.progress import ProgressReporter
+        
+        task = MagicMock()
+        with patch("app.utils.progress.time.monotonic", side_effect=[0.0, 0.5, 1.5]):
+            progress = ProgressReporter(task, every=100, interval=1.0)
+            
+            assert progress.update(1, 20) is False
+            assert progress.update(2, 20) is True
+        
+        task.update_state.assert_called_once_with(
+            task_id=None,
+            state="PROGRESS",
+            meta={"current": 2, "total": 20}
+        )
+    
+    def test_forced_and_final_updates(self):
+        """Test forced and final updates bypass the throttle"""
+        from unittest.mock import MagicMock
+        from app.utils.progress import ProgressReporter
+        
+        task = MagicMock()
+        progress = ProgressReporter(task, task_id="task-1", every=100, interval=3600)
+        
+        assert progress.update(1, 20, force=True, stage="processing") is True
+        assert progress.update(20, 20) is True
+        assert task.update_state.call_args_list[0].kwargs == {
+            "task_id": "task-1",
+            "state": "PROGRESS",
+            "meta": {"current": 1, "total": 20, "stage": "processing"}
+        }
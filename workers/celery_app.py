@@ -1,9 +1,13 @@
 """Celery application configuration"""
 
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from kombu import Queue
 import os
 
+from app.core.downloader_cache import close_metadata_caches
+from app.utils.async_utils import start_worker_loop, stop_worker_loop
+
 # Import settings - handle both standalone worker and app context
 try:
     from app.config import settings
@@ -89,6 +93,18 @@ celery_app.conf.beat_schedule = {
 }
 
 
+# One event loop per worker process, shared by every task it runs
+@worker_process_init.connect
+def _start_event_loop(**kwargs):
+    start_worker_loop()
+
+
+@worker_process_shutdown.connect
+def _stop_event_loop(**kwargs):
+    stop_worker_loop()
+    close_metadata_caches()
+
+
 # Task event handlers
 @celery_app.task(bind=True, name="celery.ping")
 def ping(self):